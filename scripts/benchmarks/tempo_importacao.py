@@ -0,0 +1,75 @@
+"""
+Compara o tempo de importação da fachada utils_pandas.utils com carga preguiçosa
+(só utils.py) e com carga imediata (todos os submódulos, como a fachada fazia antes).
+
+Cada medição roda em um interpretador novo, para não aproveitar módulos já importados.
+
+Uso:
+    python scripts/benchmarks/tempo_importacao.py [--repeticoes 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+PASTA_SCRIPTS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# O pacote é importado como modulos.utils_pandas; aqui 'modulos' aponta para a pasta scripts
+PREAMBULO = f"""
+import sys, time, types
+modulos = types.ModuleType('modulos')
+modulos.__path__ = [{PASTA_SCRIPTS!r}]
+sys.modules['modulos'] = modulos
+inicio = time.perf_counter()
+"""
+
+CODIGOS = {
+    'preguicosa': """
+import modulos.utils_pandas.utils
+""",
+    'imediata': """
+import importlib
+import modulos.utils_pandas.utils as u
+for nm_modulo in u._FUNCS_POR_MODULO:
+    importlib.import_module(nm_modulo)
+"""
+}
+
+EPILOGO = """
+print(time.perf_counter() - inicio)
+"""
+
+
+def medir(codigo: str, repeticoes: int) -> list:
+    lst_tempos = []
+
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, '-c', PREAMBULO + codigo + EPILOGO],
+            check=True, capture_output=True, text=True)
+        lst_tempos.append(float(saida.stdout))
+
+    return lst_tempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeticoes', type=int, default=10)
+    args = parser.parse_args()
+
+    dic_medianas = {}
+
+    for nm_modo, codigo in CODIGOS.items():
+        lst_tempos = medir(codigo, args.repeticoes)
+        dic_medianas[nm_modo] = statistics.median(lst_tempos)
+        print(f'{nm_modo:>10}: mediana {dic_medianas[nm_modo] * 1000:8.1f} ms  '
+              f'(mín {min(lst_tempos) * 1000:.1f} ms, máx {max(lst_tempos) * 1000:.1f} ms)')
+
+    print(f'{"razão":>10}: {dic_medianas["imediata"] / dic_medianas["preguicosa"]:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+import os
+import sys
+import types
+
+
+# Os módulos são importados como modulos.utils_pandas.*, com a pasta scripts no papel de 'modulos'
+if 'modulos' not in sys.modules:
+    modulos = types.ModuleType('modulos')
+    modulos.__path__ = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+    sys.modules['modulos'] = modulos
@@ -0,0 +1,54 @@
+import mmap
+
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_acesso import _fim_linha, _limites_blocos, le_csv, le_csv_grande
+
+
+def _linhas(fim_linha):
+    linhas = ['id,txt,vlr']
+
+    for i in range(60):
+        if i % 3 == 0:
+            # Campo entre aspas com quebras de linha, vírgulas e aspas escapadas
+            txt = f'"linha {i}{fim_linha}continua, com ""aspas""{fim_linha}e fim"'
+        else:
+            txt = f'texto {i}'
+        linhas.append(f'{i},{txt},{i * 1.25}')
+
+    return fim_linha.join(linhas) + fim_linha
+
+
+@pytest.fixture(params=['\n', '\r\n'], ids=['lf', 'crlf'])
+def arquivo(request, tmp_path):
+    (tmp_path / 'grande.csv').write_bytes(_linhas(request.param).encode('utf-8'))
+    return str(tmp_path), 'grande.csv'
+
+
+@pytest.mark.parametrize('tamanho_bloco', [7, 50, 333])
+@pytest.mark.parametrize('processos', [False, True])
+def test_le_csv_grande_igual_a_le_csv(arquivo, tamanho_bloco, processos):
+    pasta, nm_arquivo = arquivo
+
+    esperado = le_csv(pasta, nm_arquivo)
+    obtido = le_csv_grande(pasta, nm_arquivo, tamanho_bloco=tamanho_bloco, max_workers=4, processos=processos)
+
+    pd.testing.assert_frame_equal(obtido, esperado)
+    assert obtido['txt'].str.contains('\n').sum() == 20
+
+
+def test_blocos_cortados_dentro_de_aspas_terminam_fora_delas(arquivo):
+    pasta, nm_arquivo = arquivo
+
+    with open(f'{pasta}/{nm_arquivo}', 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        fim_cabecalho = _fim_linha(mm, 0)
+        blocos = _limites_blocos(mm, fim_cabecalho, 50)
+        conteudo = bytes(mm)
+
+    assert len(blocos) > 10
+    assert blocos[0][0] == fim_cabecalho and blocos[-1][1] == len(conteudo)
+
+    for inicio, fim in blocos:
+        assert conteudo[inicio:fim].count(b'"') % 2 == 0
+        assert conteudo[fim - 1:fim] == b'\n'
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_arrow import (
+    DTYPE_STR_ARROW,
+    concatenar_cols_str_arrow,
+    padronizar_str_arrow,
+    substituir_valores_arrow
+)
+from modulos.utils_pandas.utils_criacao_colunas import criar_col_chv
+from modulos.utils_pandas.utils_operacoes import padronizar_string
+from modulos.utils_pandas.utils_transformacao_cols import corrigir_valores_col
+
+
+TEXTOS = [
+    'São Paulo', '  Água-Branca  ', 'AÇÚCAR.REFINADO', 'pão\tde  queijo',
+    'Übersee', 'já-é', '', None, 'ônibus 1.5']
+
+
+def _arrow(valores):
+    return pd.Series(valores, dtype=DTYPE_STR_ARROW)
+
+
+def test_padronizar_str_arrow_igual_ao_caminho_object():
+    serie = _arrow(TEXTOS)
+
+    resultado = padronizar_str_arrow(serie)
+
+    assert resultado.dtype == DTYPE_STR_ARROW
+    assert resultado.isna().tolist() == serie.isna().tolist()
+
+    validos = serie.notna()
+    esperado = serie[validos].astype(object).apply(padronizar_string)
+    pd.testing.assert_series_equal(resultado[validos].astype(object), esperado)
+
+
+def test_substituir_valores_arrow_igual_ao_caminho_object():
+    dic_correcao = {'São Paulo': 'SP', 'já-é': 'ja_e', '': 'vazio', 'inexistente': 'x', 1: 'ignorada'}
+    serie = _arrow(TEXTOS)
+
+    resultado = substituir_valores_arrow(serie, dic_correcao)
+
+    assert resultado.dtype == DTYPE_STR_ARROW
+    # Ausentes continuam ausentes; o caminho object os transforma em 'None' com astype('str')
+    assert resultado.isna().tolist() == serie.isna().tolist()
+
+    validos = serie.notna()
+    esperado = serie[validos].astype(object).astype('str').replace(dic_correcao)
+    pd.testing.assert_series_equal(resultado[validos].astype(object), esperado)
+
+
+def test_substituir_valores_arrow_aceita_none_como_valor_corrigido():
+    resultado = substituir_valores_arrow(_arrow(['a', 'b', None]), {'a': None})
+
+    assert resultado.isna().tolist() == [True, False, True]
+    assert resultado[1] == 'b'
+
+
+@pytest.mark.parametrize('arrow', [False, True])
+def test_corrigir_valores_col_mesmo_resultado_nos_dois_caminhos(arrow):
+    valores = ['São Paulo', 'Rio', 'já-é']
+    df = pd.DataFrame({'uf': _arrow(valores) if arrow else valores})
+
+    novo_df = corrigir_valores_col(df, 'uf', {'São Paulo': 'SP', 'já-é': 'JE'})
+
+    assert novo_df['uf'].astype(object).tolist() == ['SP', 'Rio', 'JE']
+    assert (novo_df['uf'].dtype == DTYPE_STR_ARROW) == arrow
+
+
+def test_concatenar_cols_str_arrow_igual_ao_caminho_object():
+    dic_cols = {
+        'a': ['São', None, 'Ç', 'x'],
+        'b': ['Água', 'b', None, ''],
+        'c': ['1', '2', '3', None]}
+
+    df_arrow = pd.DataFrame({c: _arrow(v) for c, v in dic_cols.items()})
+    # No caminho object, ausentes são NaN e viram 'nan' com astype(str)
+    df_object = pd.DataFrame({c: [np.nan if vlr is None else vlr for vlr in v] for c, v in dic_cols.items()})
+
+    resultado = concatenar_cols_str_arrow(df_arrow, list(dic_cols), ' | ')
+    esperado = criar_col_chv(df_object, list(dic_cols))['chv']
+
+    assert resultado.dtype == DTYPE_STR_ARROW
+    assert resultado.tolist() == esperado.tolist()
+    assert resultado.tolist()[:2] == ['São | Água | 1', 'nan | b | 2']
+
+
+def test_criar_col_chv_usa_arrow_apenas_com_todas_as_cols_arrow():
+    df = pd.DataFrame({'a': _arrow(['é', 'b']), 'b': ['c', 'd']})
+
+    assert criar_col_chv(df, ['a']).chv.dtype == DTYPE_STR_ARROW
+    assert criar_col_chv(df, ['a', 'b']).chv.tolist() == ['é | c', 'b | d']
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_benford import (
+    LIMITES_MAD,
+    DistribDigitos,
+    digitos_iniciais,
+    proporcoes_benford,
+    tb_benford,
+    tb_benford_streaming
+)
+
+
+@pytest.mark.parametrize('valores, qtd_digitos, esperado', [
+    ([0.29, 0.57, 0.58, 0.3], 2, [29, 57, 58, 30]),
+    ([0.3, 1000, 999.99, 1e-5], 1, [3, 1, 9, 1]),
+    ([123.45, -0.0123, 1e300, 10], 2, [12, 12, 10, 10]),
+    ([0, np.nan, np.inf, -np.inf], 1, [0, 0, 0, 0]),
+    ([5e-324, 1e-310, 2.3e-308], 1, [0, 0, 2])
+])
+def test_digitos_iniciais(valores, qtd_digitos, esperado):
+    assert digitos_iniciais(valores, qtd_digitos).tolist() == esperado
+
+
+@pytest.mark.parametrize('qtd_digitos', [1, 2])
+def test_digitos_iniciais_como_texto(qtd_digitos):
+    # Valores com até 6 casas decimais, cujo texto tem os dígitos exatos
+    valores = np.round(np.random.default_rng(0).lognormal(0, 5, 20000), 6)
+    valores = valores[valores >= 1e-5]
+
+    texto = [f'{v:.6e}'.replace('.', '')[:qtd_digitos] for v in valores]
+
+    assert digitos_iniciais(valores, qtd_digitos).tolist() == [int(t) for t in texto]
+
+
+@pytest.fixture
+def df_valores():
+    rng = np.random.default_rng(0)
+    qtd = 6000
+
+    return pd.DataFrame({
+        'conta': rng.choice(['a', 'b', None], qtd),
+        'ano': rng.choice([2022.0, 2023.0, np.nan], qtd),
+        'vlr': np.where(rng.random(qtd) < 0.05, np.nan, 10 ** rng.uniform(-2, 6, qtd))
+    })
+
+
+def _pedacos(df, tam):
+    return [df.iloc[i:i + tam] for i in range(0, len(df), tam)]
+
+
+@pytest.mark.parametrize('qtd_digitos', [1, 2])
+@pytest.mark.parametrize('cols_grupo', [None, ['conta'], ['conta', 'ano']])
+def test_tb_benford_streaming_igual_ao_frame_inteiro(df_valores, cols_grupo, qtd_digitos):
+    esperado = tb_benford(df_valores, 'vlr', cols_grupo, qtd_digitos)
+    obtido = tb_benford_streaming(_pedacos(df_valores, 700), 'vlr', cols_grupo, qtd_digitos)
+
+    pd.testing.assert_frame_equal(obtido, esperado)
+
+    # Grupos com chave ausente aparecem uma única vez
+    if cols_grupo is not None:
+        assert not esperado[cols_grupo].duplicated().any()
+        assert esperado[cols_grupo].isna().any(axis=None)
+
+
+def test_mesclar_igual_a_atualizar_tudo(df_valores):
+    metade = len(df_valores) // 2
+
+    inteiro = DistribDigitos('vlr', ['conta']).atualizar(df_valores)
+    mesclado = (
+        DistribDigitos('vlr', ['conta']).atualizar(df_valores.iloc[metade:])
+        .mesclar(DistribDigitos('vlr', ['conta']).atualizar(df_valores.iloc[:metade])))
+
+    colunas = ['conta', 'digito', 'freq_abs', 'freq_rel']
+    pd.testing.assert_frame_equal(
+        mesclado.tb_freq()[colunas].sort_values(['conta', 'digito'], na_position='first').reset_index(drop=True),
+        inteiro.tb_freq()[colunas].sort_values(['conta', 'digito'], na_position='first').reset_index(drop=True))
+
+
+def test_tb_desvios_medidas(df_valores):
+    desvios = tb_benford(df_valores, 'vlr').iloc[0]
+
+    digitos = digitos_iniciais(df_valores['vlr'])
+    contagens = np.bincount(digitos[digitos > 0], minlength=10)[1:]
+    n = contagens.sum()
+    esperadas = proporcoes_benford().to_numpy()
+    observadas = contagens / n
+
+    z = (np.abs(observadas - esperadas) - 1 / (2 * n)).clip(0) / np.sqrt(esperadas * (1 - esperadas) / n)
+
+    assert desvios['qtd'] == n
+    assert desvios['mad'] == pytest.approx(np.abs(observadas - esperadas).mean())
+    assert desvios['qui2'] == pytest.approx(((contagens - n * esperadas) ** 2 / (n * esperadas)).sum())
+    assert desvios['gl'] == 8
+    assert desvios['z_max'] == pytest.approx(z.max())
+    assert desvios['digito_z_max'] == np.argmax(z) + 1
+
+
+@pytest.mark.parametrize('qtd_digitos', [1, 2])
+def test_conformidade_mad(qtd_digitos):
+    rng = np.random.default_rng(1)
+    qtd = 200000
+
+    df = pd.DataFrame({
+        'grupo': np.repeat(['benford', 'uniforme'], qtd),
+        # log10 uniforme segue a lei de Benford; valores uniformes em [1, 10) não
+        'vlr': np.concatenate([10 ** rng.uniform(0, 6, qtd), rng.uniform(1, 10, qtd)])
+    })
+
+    desvios = tb_benford(df, 'vlr', ['grupo'], qtd_digitos).set_index('grupo')
+
+    assert desvios.loc['benford', 'conformidade'] == 'próxima'
+    assert desvios.loc['uniforme', 'conformidade'] == 'não conforme'
+    assert desvios.loc['benford', 'mad'] < LIMITES_MAD[qtd_digitos][0]
+    assert desvios.loc['uniforme', 'mad'] > LIMITES_MAD[qtd_digitos][2]
+
+
+def test_grupo_sem_valores():
+    df = pd.DataFrame({'grupo': ['a', 'a', 'b'], 'vlr': [12.0, 3.0, np.nan]})
+
+    desvios = tb_benford(df, 'vlr', ['grupo']).set_index('grupo')
+
+    assert desvios.loc['b', 'qtd'] == 0
+    assert np.isnan(desvios.loc['b', 'mad'])
+    assert desvios.loc['b', 'conformidade'] is None
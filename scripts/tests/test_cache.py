@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_cache import CacheResultados, impressao_digital
+from modulos.utils_pandas.utils_transformacao_df import tb_freq
+
+
+def test_impressao_digital_com_listas():
+    df = pd.DataFrame({'id': [1, 2], 'itens': [[1, 2], ['a']], 'extra': [{'x': 1}, None]})
+
+    assert impressao_digital(df) == impressao_digital(df.copy(deep=True))
+
+    alterado = df.copy(deep=True)
+    alterado.at[1, 'itens'] = ['b']
+    assert impressao_digital(df) != impressao_digital(alterado)
+
+
+def test_impressao_digital_com_objetos_sem_pickle():
+    df = pd.DataFrame({'f': [lambda x: x, None]})
+
+    assert len(impressao_digital(df)) == 32
+
+
+@pytest.mark.parametrize('valores_a, valores_b', [
+    ([1, 'b'], ['1', 'b']),
+    ([np.nan, 'b'], [None, 'b']),
+    ([1.0, None], ['1.0', None]),
+    ([True, 'x'], ['True', 'x'])
+])
+def test_impressao_digital_distingue_tipos_em_object(valores_a, valores_b):
+    df_a = pd.DataFrame({'c': pd.Series(valores_a, dtype=object)})
+    df_b = pd.DataFrame({'c': pd.Series(valores_b, dtype=object)})
+
+    assert impressao_digital(df_a) != impressao_digital(df_b)
+
+
+def test_memoizar_nao_confunde_tipos():
+    cache = CacheResultados()
+
+    df_int = pd.DataFrame({'c': pd.Series([1, 'b', 1], dtype=object)})
+    df_str = pd.DataFrame({'c': pd.Series(['1', 'b', '1'], dtype=object)})
+
+    tb_int = tb_freq(df_int, ['c'], cache=cache)
+    tb_str = tb_freq(df_str, ['c'], cache=cache)
+
+    assert len(cache) == 2
+    assert tb_str['c'].tolist() == ['1', 'b']
+    assert tb_int['c'].tolist() == [1, 'b']
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_distrib import (
+    DistribStreaming,
+    EsbocoQuantis,
+    MomentosCorrentes,
+    tb_distrib_data_streaming,
+    tb_distrib_streaming
+)
+from modulos.utils_pandas.utils_transformacao_df import tb_distrib, tb_distrib_data
+
+
+def _pedacos(df, tam):
+    return [df.iloc[i:i + tam] for i in range(0, len(df), tam)]
+
+
+@pytest.fixture
+def df_num():
+    rng = np.random.default_rng(0)
+    qtd = 50000
+
+    return pd.DataFrame({
+        'vlr': np.where(rng.random(qtd) < 0.02, np.nan, rng.lognormal(3, 1, qtd)),
+        'qtd': rng.integers(-100, 100, qtd)
+    })
+
+
+def test_exato_sem_compactar(df_num):
+    pequeno = df_num.iloc[:150]
+
+    esboco = EsbocoQuantis(k=200)
+    for pedaco in _pedacos(pequeno, 40):
+        esboco.atualizar(pedaco['vlr'])
+
+    assert esboco.exato
+    pd.testing.assert_frame_equal(tb_distrib_streaming(_pedacos(pequeno, 40)), tb_distrib(pequeno))
+
+
+def test_erro_de_posto_limitado_apos_compactar(df_num):
+    valores = df_num['vlr'].dropna().to_numpy()
+
+    esboco = EsbocoQuantis(k=200, semente=0)
+    for pedaco in np.array_split(valores, 50):
+        esboco.atualizar(pedaco)
+
+    assert not esboco.exato
+    assert esboco.n == len(valores)
+
+    qs = np.linspace(0.01, 0.99, 99)
+    postos = np.searchsorted(np.sort(valores), esboco.quantis(qs)) / len(valores)
+
+    assert np.abs(postos - qs).max() < 0.02
+
+
+def test_mesclar_esbocos(df_num):
+    valores = df_num['vlr'].dropna().to_numpy()
+    metade = len(valores) // 2
+
+    esboco = EsbocoQuantis(semente=0).atualizar(valores[:metade]).mesclar(EsbocoQuantis(semente=1).atualizar(valores[metade:]))
+
+    postos = np.searchsorted(np.sort(valores), esboco.quantis([0.25, 0.5, 0.75])) / len(valores)
+
+    assert esboco.n == len(valores)
+    assert np.abs(postos - [0.25, 0.5, 0.75]).max() < 0.02
+
+
+def test_momentos_mesclados_como_describe(df_num):
+    momentos = MomentosCorrentes()
+    for pedaco in _pedacos(df_num, 3000):
+        momentos.mesclar(MomentosCorrentes().atualizar(pedaco['vlr']))
+
+    descricao = df_num['vlr'].describe()
+
+    assert momentos.n == descricao['count']
+    assert momentos.media == pytest.approx(descricao['mean'], rel=1e-12)
+    assert momentos.desvio == pytest.approx(descricao['std'], rel=1e-9)
+    assert momentos.minimo == descricao['min']
+    assert momentos.maximo == descricao['max']
+
+
+def test_tb_distrib_streaming_momentos_e_quartis(df_num):
+    esperado = tb_distrib(df_num).set_index('index')
+    obtido = tb_distrib_streaming(_pedacos(df_num, 4000), semente=0).set_index('index')
+
+    assert list(obtido.index) == list(esperado.index)
+    assert list(obtido.columns) == list(esperado.columns)
+
+    linhas_exatas = ['count', 'mean', 'std', 'min', 'max']
+    pd.testing.assert_frame_equal(obtido.loc[linhas_exatas], esperado.loc[linhas_exatas], rtol=1e-9)
+
+
+def test_datas_com_extremos_exatos():
+    rng = np.random.default_rng(0)
+    qtd = 30000
+
+    datas = pd.Timestamp('1990-01-01') + pd.to_timedelta(rng.integers(0, 20000, qtd), unit='D')
+    df = pd.DataFrame({'dt': datas + pd.to_timedelta(rng.integers(0, 86400, qtd), unit='s')})
+    df.loc[::11, 'dt'] = pd.NaT
+
+    distrib = DistribStreaming(cols_num=[], cols_data=['dt'], k=50, semente=0)
+    for pedaco in _pedacos(df, 1000):
+        distrib.atualizar(pedaco)
+
+    assert not distrib._esbocos['dt'].exato
+
+    esperado = tb_distrib_data(df, 'dt')
+    obtido = distrib.tb_distrib_data('dt')
+
+    assert obtido['dt'].iloc[0] == esperado['dt'].iloc[0] == df['dt'].min().date()
+    assert obtido['dt'].iloc[-1] == esperado['dt'].iloc[-1] == df['dt'].max().date()
+
+
+def test_datas_exatas_sem_compactar():
+    df = pd.DataFrame({'dt': pd.to_datetime(['2023-01-05 10:00', None, '2021-03-01 00:00', '2024-12-31 23:59', '2022-07-14 08:30'])})
+
+    pd.testing.assert_frame_equal(
+        tb_distrib_data_streaming(_pedacos(df, 2), 'dt'), tb_distrib_data(df, 'dt'))
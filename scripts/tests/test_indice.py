@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_indice import IndiceChave
+from modulos.utils_pandas.utils_sanitizacao import obter_duplicatas
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+
+    return pd.DataFrame({
+        'uf': rng.choice(['SP', 'RJ', 'MG', None], 500),
+        'ano': rng.integers(2020, 2024, 500),
+        'vlr': rng.normal(size=500),
+        'nome': rng.choice(['a', 'b'], 500)
+    })
+
+
+@pytest.fixture
+def direita():
+    return pd.DataFrame({
+        'uf': ['SP', 'RJ', 'RJ', 'BA'],
+        'ano': [2020, 2021, 2021, 2022],
+        'nome': ['x', 'y', 'z', 'w'],
+        'regiao': ['SE', 'SE', 'SE2', 'NE']
+    })
+
+
+@pytest.mark.parametrize('how', ['left', 'inner'])
+@pytest.mark.parametrize('sufixos', [('_x', '_y'), ('', '_dir')])
+def test_mesclar_como_merge(df, direita, how, sufixos):
+    indice = IndiceChave(df, ['uf', 'ano'])
+
+    esperado = pd.merge(df, direita, on=['uf', 'ano'], how=how, suffixes=sufixos)
+    obtido = indice.mesclar(df, direita, how=how, sufixos=sufixos)
+
+    pd.testing.assert_frame_equal(obtido, esperado.reset_index(drop=True))
+
+
+def test_validar_recusa_outro_dataframe(df):
+    indice = IndiceChave(df, ['uf', 'ano'])
+    indice.validar(df)
+
+    with pytest.raises(ValueError):
+        indice.validar(df.sample(frac=1, random_state=0))
+
+    alterado = df.copy()
+    alterado.loc[0, 'ano'] = 1999
+    with pytest.raises(ValueError):
+        indice.validar(alterado)
+
+    with pytest.raises(ValueError):
+        indice.validar(df.iloc[:-1])
+
+
+def test_validar_recusa_chave_alterada_fora_da_amostra(df):
+    indice = IndiceChave(df, ['uf', 'ano'])
+    amostral = IndiceChave(df, ['uf', 'ano'], validacao_amostral=True)
+
+    # Linha fora da amostra de 64 linhas igualmente espaçadas
+    pos = 5
+    assert pos not in amostral._amostra
+
+    alterado = df.copy()
+    alterado.iloc[pos, alterado.columns.get_loc('ano')] = 1999
+
+    with pytest.raises(ValueError):
+        indice.validar(alterado)
+
+    with pytest.raises(ValueError):
+        obter_duplicatas(alterado, ['uf', 'ano'], indice=indice)
+
+    # Com a validação amostral, pedida explicitamente, a alteração passa despercebida
+    amostral.validar(alterado)
@@ -0,0 +1,89 @@
+import asyncio
+import os
+
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas import utils_ingestao
+from modulos.utils_pandas.utils_acesso import le_pastas_csv
+from modulos.utils_pandas.utils_ingestao import le_pastas_csv_async
+
+
+@pytest.fixture
+def pastas(tmp_path):
+    lst_pastas = []
+
+    for i in range(3):
+        pasta = tmp_path / f'p{i}'
+        pasta.mkdir()
+        lst_pastas.append(str(pasta))
+
+        for j in range(4):
+            linhas = ''.join(f'{i}{j}{k},texto {k},{k * 1.5}\n' for k in range(50 * (j + 1)))
+            (pasta / f'arq{i}{j}.csv').write_text('id,txt,vlr\n' + linhas)
+
+        (pasta / 'notas.txt').write_text('ignorado')
+
+    return lst_pastas
+
+
+class _OrcamentoComPico(utils_ingestao._OrcamentoBytes):
+    instancias = []
+
+    def __init__(self, max_bytes):
+        super().__init__(max_bytes)
+        self.pico = 0
+        _OrcamentoComPico.instancias.append(self)
+
+    async def reservar(self, qtd):
+        await super().reservar(qtd)
+        self.pico = max(self.pico, self.em_voo)
+
+
+def _ordenar(df):
+    return df.sort_values(['Tabela', 'id'], ignore_index=True)
+
+
+def test_mesmos_dados_de_le_pastas_csv(pastas):
+    async def ler():
+        return [df async for df in le_pastas_csv_async(pastas, max_concorrencia=3)]
+
+    lst_dfs = asyncio.run(ler())
+
+    assert len(lst_dfs) == 12
+    assert sorted(df['Tabela'].iloc[0] for df in lst_dfs) == sorted(
+        nm for pasta in pastas for nm in os.listdir(pasta) if nm.endswith('.csv'))
+
+    pd.testing.assert_frame_equal(_ordenar(pd.concat(lst_dfs)), _ordenar(le_pastas_csv(pastas)))
+
+
+def test_orcamento_de_bytes_respeitado(pastas, monkeypatch):
+    monkeypatch.setattr(utils_ingestao, '_OrcamentoBytes', _OrcamentoComPico)
+    _OrcamentoComPico.instancias.clear()
+
+    tamanhos = [os.path.getsize(os.path.join(p, nm)) for p in pastas for nm in os.listdir(p) if nm.endswith('.csv')]
+    max_bytes = 2 * max(tamanhos)
+
+    async def ler():
+        lst_dfs = []
+
+        async for df in le_pastas_csv_async(pastas, max_concorrencia=8, max_bytes_em_voo=max_bytes):
+            # Consumidor lento: os arquivos lidos se acumulam até o limite do orçamento
+            await asyncio.sleep(0.01)
+            lst_dfs.append(df)
+
+        return lst_dfs
+
+    lst_dfs = asyncio.run(ler())
+    orcamento, = _OrcamentoComPico.instancias
+
+    assert len(lst_dfs) == 12
+    assert max(tamanhos) <= orcamento.pico <= max_bytes
+    assert orcamento.em_voo == 0
+
+
+def test_arquivo_maior_que_o_orcamento(pastas):
+    async def ler():
+        return [df async for df in le_pastas_csv_async(pastas[:1], max_bytes_em_voo=10)]
+
+    assert len(asyncio.run(ler())) == 4
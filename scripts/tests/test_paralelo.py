@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from modulos.utils_pandas.utils_paralelo import aplicar_por_coluna, montar_df
+from modulos.utils_pandas.utils_transformacao_cols import converter_tipo_cols
+
+
+def _dobrar(serie, fator=2):
+    return serie * fator
+
+
+@pytest.mark.parametrize('qtd_cols', [0, 1, 3])
+def test_aplicar_por_coluna_recusa_paralelo_invalido(qtd_cols):
+    lst_series = [pd.Series([1, 2])] * qtd_cols
+
+    with pytest.raises(ValueError, match='paralelo'):
+        aplicar_por_coluna(_dobrar, 'proc', lst_series)
+
+
+def test_converter_tipo_cols_recusa_paralelo_invalido_com_uma_coluna():
+    df = pd.DataFrame({'qtd': ['1', '2']})
+
+    with pytest.raises(ValueError, match='paralelo'):
+        converter_tipo_cols(df, {'int64': 'qtd'}, paralelo='proc')
+
+
+@pytest.mark.parametrize('paralelo', [None, 'threads', 'processos', 'executor'])
+def test_aplicar_por_coluna_mantem_ordem(paralelo):
+    lst_series = [pd.Series([i, i + 1]) for i in range(4)]
+
+    if paralelo == 'executor':
+        with ThreadPoolExecutor() as ex:
+            resultado = aplicar_por_coluna(_dobrar, ex, lst_series, [1, 2, 3, 4])
+    else:
+        resultado = aplicar_por_coluna(_dobrar, paralelo, lst_series, [1, 2, 3, 4])
+
+    assert [s.tolist() for s in resultado] == [[0, 1], [2, 4], [6, 9], [12, 16]]
+
+
+def test_montar_df_substitui_e_acrescenta():
+    df = pd.DataFrame({'a': [1, 2], 'b': [3, 4]}, index=[10, 20])
+
+    novo_df = montar_df(df, {'a': df['a'] * 10, 'c': df['b'] + 1})
+
+    assert novo_df.columns.tolist() == ['a', 'b', 'c']
+    assert novo_df.index.tolist() == [10, 20]
+    assert novo_df['a'].tolist() == [10, 20]
+    assert df['a'].tolist() == [1, 2]
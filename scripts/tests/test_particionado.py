@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from modulos.utils_pandas.utils_particionado import grava_particionado, le_particionado, listar_particoes
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'dt': pd.to_datetime(['2023-01-05', '2023-01-20', '2023-02-01', '2023-03-10', '2023-03-11', '2023-03-12']),
+        'vlr': [1.5, np.nan, 3.0, -4.25, 5.0, 6.0],
+        'qtd': np.array([1, 2, 3, 4, 5, 6], dtype='int64'),
+        'ativo': [True, False, True, True, False, True],
+        'desc': ['a', None, 'ç', 'd', 'e', 'f'],
+        'Tabela': ['x.csv', 'y.csv', 'x.csv', 'x.csv', 'y.csv', 'x.csv']
+    })
+
+
+def _ordenar(df):
+    return df.sort_values('qtd', ignore_index=True)
+
+
+def test_ida_e_volta_preserva_tipos(df, tmp_path):
+    pasta = str(tmp_path / 'ds')
+
+    assert grava_particionado(df, pasta, 'dt') == ['ano_mes', 'Tabela']
+
+    lido = _ordenar(le_particionado(pasta))
+    cols = ['dt', 'vlr', 'qtd', 'ativo', 'desc']
+
+    pd.testing.assert_frame_equal(lido[cols], df[cols], check_dtype=True)
+    assert lido['ano_mes'].tolist() == ['202301', '202301', '202302', '202303', '202303', '202303']
+    assert lido['Tabela'].tolist() == df['Tabela'].tolist()
+
+    particoes = listar_particoes(pasta)
+    assert particoes[['ano_mes', 'Tabela']].values.tolist() == [
+        ['202301', 'x.csv'], ['202301', 'y.csv'], ['202302', 'x.csv'], ['202303', 'x.csv'], ['202303', 'y.csv']]
+    assert (particoes['qtd_arquivos'] == 1).all()
+
+
+def test_filtros_descartam_particoes(df, tmp_path):
+    pasta = str(tmp_path / 'ds')
+    grava_particionado(df, pasta, 'dt')
+
+    # Uma partição corrompida só quebra a leitura se for aberta (a descoberta do esquema
+    # lê só o primeiro arquivo, que é de outra partição)
+    pasta_corrompida = os.path.join(pasta, 'ano_mes=202303', 'Tabela=y.csv')
+    for nm_arquivo in os.listdir(pasta_corrompida):
+        with open(os.path.join(pasta_corrompida, nm_arquivo), 'wb') as arquivo:
+            arquivo.write(b'corrompido')
+
+    lido = le_particionado(pasta, [('ano_mes', '>=', '202302'), ('Tabela', '==', 'x.csv')])
+    assert sorted(lido['qtd']) == [3, 4, 6]
+
+    lido = le_particionado(pasta, [('Tabela', '==', 'y.csv'), ('ano_mes', '<', '202303')], cols=['qtd', 'desc'])
+    assert lido.to_dict('list') == {'qtd': [2], 'desc': [None]}
+
+    with pytest.raises(Exception):
+        le_particionado(pasta)
+
+
+def test_substituir_so_regrava_particoes_tocadas(df, tmp_path):
+    pasta = str(tmp_path / 'ds')
+    grava_particionado(df, pasta, 'dt')
+
+    novos = df[(df['dt'].dt.month == 3) & (df['Tabela'] == 'x.csv')].assign(vlr=100.0)
+    grava_particionado(novos, pasta, 'dt', modo='substituir')
+
+    lido = _ordenar(le_particionado(pasta))
+    pd.testing.assert_frame_equal(lido[['qtd']], df[['qtd']])
+    assert lido.loc[lido['qtd'].isin([4, 6]), 'vlr'].tolist() == [100.0, 100.0]
+    assert lido.loc[~lido['qtd'].isin([4, 6]), 'vlr'].equals(df.loc[~df['qtd'].isin([4, 6]), 'vlr'])
+    assert (listar_particoes(pasta)['qtd_arquivos'] == 1).all()
+
+
+def test_acrescentar_mantem_arquivos(df, tmp_path):
+    pasta = str(tmp_path / 'ds')
+    grava_particionado(df, pasta, 'dt')
+    grava_particionado(df.iloc[:1], pasta, 'dt', modo='acrescentar')
+
+    particoes = listar_particoes(pasta).set_index(['ano_mes', 'Tabela'])['qtd_arquivos']
+
+    assert particoes.loc[('202301', 'x.csv')] == 2
+    assert particoes.drop(('202301', 'x.csv')).eq(1).all()
+    assert len(le_particionado(pasta)) == len(df) + 1
+
+
+def test_modo_invalido(df, tmp_path):
+    with pytest.raises(ValueError):
+        grava_particionado(df, str(tmp_path), 'dt', modo='sobrescrever')
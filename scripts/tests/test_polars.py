@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+
+pl = pytest.importorskip('polars')
+
+from modulos.utils_pandas import utils_polars
+from modulos.utils_pandas import utils_criacao_colunas, utils_transformacao_cols
+
+
+DADOS = {
+    'cod': [1, 2, None, 4],
+    'qtd': [1, 2, 3, 4],
+    'vlr': [1.5, None, 2.675, -3.0],
+    'uf': ['SP', None, 'rj', 'SP'],
+    'nome': ['Ana-Maria', 'JOSÉ  da Silva', 'x.y', ' b '],
+    'dt': ['2023-01-02', '2023-02-03', None, '2024-05-06'],
+    'ativo': [True, False, True, False]
+}
+
+# (função, argumentos) com a mesma chamada nos dois backends
+CASOS = [
+    ('criar_col_chv', (['uf', 'cod'],)),
+    ('criar_col_chv', (['nome', 'qtd', 'vlr', 'ativo'],)),
+    ('criar_col_dif', ('vlr', 'qtd')),
+    ('criar_col_dif_bool', ('cod', 'qtd')),
+    ('criar_col_pct', ('qtd',)),
+    ('criar_col_pct', ('qtd', 'pct', True)),
+    ('criar_col_qtd_digitos', ('cod',)),
+    ('criar_col_qtd_digitos', ('vlr',)),
+    ('criar_cols_num_formatadas', (['vlr', 'qtd', 'cod'],)),
+    ('criar_col_soma_acc', ('vlr',)),
+    ('criar_col_verdadeira', ('v',)),
+    ('criar_col_soma_cols', (['vlr', 'qtd'],)),
+    ('criar_col_media_cols', (['vlr', 'qtd'],)),
+    ('criar_col_moda_cols', (['qtd', 'cod'],)),
+    ('converter_tipo_cols', ({'datetime': ['dt']},)),
+    ('converter_tipo_cols', ({'datetime': 'dt', 'float64': 'qtd'},)),
+    ('converter_tipo_cols', ({'float64': ['qtd'], 'str': ['cod', 'vlr', 'uf']},)),
+    ('mapeia_valores', ('uf', {'SP': 'São Paulo', 'rj': 'Rio'})),
+    ('corrigir_valores_col', ('uf', {'SP': 'sp'}, 'uf_corrigida')),
+    ('corrigir_valores_col', ('cod', {'1.0': 'um'})),
+    ('preencher_ausentes_cols', (['vlr', 'cod'], 0)),
+    ('padronizar_str_cols', (['nome'], {'nome': 'nome_pad'})),
+    ('remover_texto_col', ('nome', 'a')),
+    ('remover_textos_cols', (['nome'], ['a', 'Si', 'Silva'])),
+    ('remover_textos_cols', (['nome'], [r'\s+', '[.-]'], True)),
+    ('formatar_data_para_ano_mes', ('dt', 'ano_mes'))
+]
+
+
+def _pandas(nm_func):
+    for modulo in (utils_criacao_colunas, utils_transformacao_cols):
+        if hasattr(modulo, nm_func):
+            return getattr(modulo, nm_func)
+
+
+def _ausentes_como_none(df):
+    # Em colunas object, o pandas às vezes marca ausentes com NaN e o Polars sempre com None
+    novo_df = df.copy()
+
+    for nm_col in novo_df.select_dtypes(include='object').columns:
+        novo_df[nm_col] = novo_df[nm_col].astype(object).where(novo_df[nm_col].notna(), None)
+
+    return novo_df
+
+
+def _comparar(df_pandas, df_polars):
+    if isinstance(df_polars, pl.LazyFrame):
+        df_polars = df_polars.collect()
+
+    pd.testing.assert_frame_equal(
+        _ausentes_como_none(df_pandas), _ausentes_como_none(df_polars.to_pandas()), check_dtype=False)
+
+
+@pytest.fixture(params=['eager', 'lazy'])
+def frames(request):
+    df_pl = pl.DataFrame(DADOS)
+    df_pd = df_pl.to_pandas()
+
+    return df_pd, (df_pl if request.param == 'eager' else df_pl.lazy())
+
+
+@pytest.mark.parametrize('nm_func, args', CASOS, ids=[f'{f}-{i}' for i, (f, _) in enumerate(CASOS)])
+def test_mesmo_resultado_do_pandas(frames, nm_func, args):
+    df_pd, df_pl = frames
+
+    _comparar(_pandas(nm_func)(df_pd, *args), getattr(utils_polars, nm_func)(df_pl, *args))
+
+
+def test_condicoes(frames):
+    df_pd, df_pl = frames
+
+    _comparar(
+        utils_criacao_colunas.criar_col_bool(df_pd, 'grande', df_pd['qtd'] > 2),
+        utils_polars.criar_col_bool(df_pl, 'grande', pl.col('qtd') > 2))
+
+    _comparar(
+        utils_transformacao_cols.preencher_com_ausente(df_pd, 'vlr', df_pd['qtd'] > 2),
+        utils_polars.preencher_com_ausente(df_pl, 'vlr', pl.col('qtd') > 2))
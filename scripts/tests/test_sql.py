@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_acesso import le_pastas_csv
+from modulos.utils_pandas.utils_sql import FontePastasCsv
+from modulos.utils_pandas.utils_transformacao_df import (
+    conta_distintos_cols_nao_chave,
+    tb_distintos,
+    tb_freq,
+    tb_freq_data,
+    tb_soma_agg
+)
+
+
+pytest.importorskip('duckdb')
+
+
+@pytest.fixture
+def pasta_csv(tmp_path):
+    (tmp_path / 'a.csv').write_text(
+        'cod,uf,dt,vlr,qtd\n'
+        '001,SP,2023-01-02,1.5,1\n'
+        '002,RJ,2023-02-03,,2\n'
+        '001,SP,2024-03-04,2.5,3\n'
+        '003,NA,2024-05-06,4,4\n',
+        encoding='utf-8')
+    (tmp_path / 'b.csv').write_bytes(
+        'cod,uf,dt,vlr,qtd\n'
+        '002,São Paulo,2023-07-08,10,5\n'
+        '004,,2022-09-10,-3.25,6\n'.encode('latin1'))
+    (tmp_path / 'ignorado.txt').write_text('cod\n9\n')
+
+    return str(tmp_path)
+
+
+def _comparar(df_pandas, df_duckdb):
+    pd.testing.assert_frame_equal(
+        df_pandas.reset_index(drop=True), df_duckdb.reset_index(drop=True), check_dtype=False)
+
+
+def test_tipos_seguem_o_pandas(pasta_csv):
+    from modulos.utils_pandas.utils_sql import _conexao, _tipos_fonte
+
+    with _conexao(FontePastasCsv([pasta_csv])) as con:
+        tipos = _tipos_fonte(con)
+        cods = sorted(v for v, in con.execute('SELECT cod FROM fonte').fetchall())
+
+    assert tipos == {
+        'cod': 'BIGINT', 'uf': 'VARCHAR', 'dt': 'VARCHAR', 'vlr': 'DOUBLE', 'qtd': 'BIGINT', 'Tabela': 'VARCHAR'}
+    assert cods == sorted(le_pastas_csv([pasta_csv])['cod'])
+
+
+@pytest.mark.parametrize('cols', [['cod'], ['uf'], ['cod', 'Tabela'], ['dt']])
+def test_tb_freq(pasta_csv, cols):
+    df = le_pastas_csv([pasta_csv])
+
+    _comparar(
+        tb_freq(df, cols).sort_values(cols),
+        tb_freq(FontePastasCsv([pasta_csv]), cols, motor='duckdb').sort_values(cols))
+
+
+@pytest.mark.parametrize('nm_col_somada', ['vlr', 'qtd'])
+def test_tb_soma_agg(pasta_csv, nm_col_somada):
+    df = le_pastas_csv([pasta_csv])
+
+    _comparar(
+        tb_soma_agg(df, ['cod'], nm_col_somada),
+        tb_soma_agg(FontePastasCsv([pasta_csv]), ['cod'], nm_col_somada, motor='duckdb'))
+
+
+def test_tb_distintos(pasta_csv):
+    df = le_pastas_csv([pasta_csv])
+
+    _comparar(
+        tb_distintos(df).sort_values('col'),
+        tb_distintos(FontePastasCsv([pasta_csv]), motor='duckdb').sort_values('col'))
+
+
+@pytest.mark.parametrize('periodo', ['a', 'm'])
+def test_tb_freq_data(pasta_csv, periodo):
+    df = le_pastas_csv([pasta_csv])
+
+    _comparar(
+        tb_freq_data(df, 'dt', 'cod', periodo),
+        tb_freq_data(FontePastasCsv([pasta_csv]), 'dt', 'cod', periodo, motor='duckdb'))
+
+
+def test_conta_distintos_cols_nao_chave(pasta_csv):
+    df = le_pastas_csv([pasta_csv])
+
+    _comparar(
+        conta_distintos_cols_nao_chave(df, ['cod']),
+        conta_distintos_cols_nao_chave(FontePastasCsv([pasta_csv]), ['cod'], motor='duckdb'))
@@ -0,0 +1,73 @@
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_transformacao_cols import (
+    converter_tipo_cols,
+    remover_texto_col,
+    remover_textos_cols
+)
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'data': ['2023-01-02', '2023-02-03', None],
+        'outra_data': ['2024-05-06', None, '2024-07-08'],
+        'qtd': ['1', '2', '3']
+    })
+
+
+@pytest.mark.parametrize('paralelo', [None, 'threads'])
+@pytest.mark.parametrize('dic_dtypes', [
+    {'datetime': 'data', 'int64': 'qtd'},
+    {'datetime': ['data'], 'int64': ['qtd']}
+])
+def test_converter_tipo_cols_aceita_coluna_unica(df, dic_dtypes, paralelo):
+    novo_df = converter_tipo_cols(df, dic_dtypes, paralelo)
+
+    assert novo_df['data'].dtype == 'datetime64[ns]'
+    assert novo_df['qtd'].tolist() == [1, 2, 3]
+    assert novo_df['outra_data'].dtype == object
+
+
+@pytest.mark.parametrize('paralelo', [None, 'threads'])
+def test_converter_tipo_cols_varias_datas(df, paralelo):
+    novo_df = converter_tipo_cols(df, {'datetime': ['data', 'outra_data']}, paralelo)
+
+    assert (novo_df[['data', 'outra_data']].dtypes == 'datetime64[ns]').all()
+
+
+TEXTOS = ['R$ 10,00', 'R$5 pago', None, 'AB.C-D', 'São Paulo (SP)']
+
+
+@pytest.fixture(params=['object', 'string[pyarrow]'])
+def df_texto(request):
+    pytest.importorskip('pyarrow')
+    return pd.DataFrame({'txt': TEXTOS}, dtype=request.param)
+
+
+def _valores(serie):
+    return [None if pd.isna(v) else v for v in serie]
+
+
+@pytest.mark.parametrize('lst_textos, regex, esperado', [
+    (['R$', 'R$ ', '.'], False, ['10,00', '5 pago', None, 'ABC-D', 'São Paulo (SP)']),
+    ([r'\s*\(SP\)', r'[.-]'], True, ['R$ 10,00', 'R$5 pago', None, 'ABCD', 'São Paulo']),
+    ([r'(?<=R\$)\s*', r'(?<=\d),\d+'], True, ['R$10', 'R$5 pago', None, 'AB.C-D', 'São Paulo (SP)'])
+])
+def test_remover_textos_cols(df_texto, lst_textos, regex, esperado):
+    novo_df = remover_textos_cols(df_texto, ['txt'], lst_textos, regex)
+
+    assert _valores(novo_df['txt']) == esperado
+    assert novo_df['txt'].dtype == df_texto['txt'].dtype
+
+
+@pytest.mark.parametrize('texto, regex, esperado', [
+    ('R$', False, [' 10,00', '5 pago', None, 'AB.C-D', 'São Paulo (SP)']),
+    (r'(?<=R\$)\s*', True, ['R$10,00', 'R$5 pago', None, 'AB.C-D', 'São Paulo (SP)'])
+])
+def test_remover_texto_col(df_texto, texto, regex, esperado):
+    novo_df = remover_texto_col(df_texto, 'txt', texto, regex)
+
+    assert _valores(novo_df['txt']) == esperado
+    assert novo_df['txt'].dtype == df_texto['txt'].dtype
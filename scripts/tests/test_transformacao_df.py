@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modulos.utils_pandas.utils_transformacao_df import selecionar_top_n, tb_distrib, tb_zerados
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    qtd = 400
+
+    novo_df = pd.DataFrame({
+        'conta': rng.choice(['a', 'b', 'c', None], qtd),
+        'ano': rng.choice([2022, 2023], qtd),
+        # Poucos valores distintos, para haver muitos empates no limite do top-n
+        'vlr': rng.integers(0, 8, qtd).astype(float)
+    })
+    novo_df.loc[rng.choice(qtd, 20, replace=False), 'vlr'] = np.nan
+
+    return novo_df
+
+
+@pytest.mark.parametrize('manter', ['first', 'last', 'all'])
+@pytest.mark.parametrize('n', [1, 3, 50, 500])
+@pytest.mark.parametrize('cols_grupo', [['conta'], ['conta', 'ano']])
+def test_selecionar_top_n_como_nlargest_por_grupo(df, manter, n, cols_grupo):
+    esperado = (
+        df
+        .groupby(cols_grupo, group_keys=False)
+        .apply(lambda g: g.nlargest(n, 'vlr', keep=manter), include_groups=False))
+
+    obtido = selecionar_top_n(df, 'vlr', n, cols_grupo, manter)
+
+    assert sorted(obtido.index) == sorted(esperado.index)
+
+    # Ordem de saída: grupos em ordem crescente e, dentro de cada grupo, valores decrescentes
+    pd.testing.assert_frame_equal(
+        obtido,
+        obtido.sort_values([*cols_grupo, 'vlr'], ascending=[*[True] * len(cols_grupo), False], kind='stable'))
+
+
+@pytest.mark.parametrize('manter', ['first', 'last', 'all'])
+def test_selecionar_top_n_sem_grupo(df, manter):
+    pd.testing.assert_frame_equal(
+        selecionar_top_n(df, 'vlr', 10, manter=manter), df.nlargest(10, 'vlr', keep=manter))
+
+
+@pytest.mark.parametrize('cols_grupo', [None, ['conta']])
+def test_selecionar_top_n_zero(df, cols_grupo):
+    obtido = selecionar_top_n(df, 'vlr', 0, cols_grupo)
+
+    assert obtido.empty
+    assert list(obtido.columns) == list(df.columns)
+
+
+@pytest.fixture
+def df_sinais():
+    return pd.DataFrame({
+        'a': [0.0, 1e-7, -1e-7, 2.5, -3.0, np.nan, 1e-6],
+        'b': [1, 0, -1, 0, 5, 7, -2],
+        'txt': list('abcdefg')
+    })
+
+
+@pytest.mark.parametrize('tol_abs, esperado_a', [
+    (1e-6, [4, 1, 1]),
+    (0, [1, 2, 3]),
+    (2.5, [5, 1, 0])
+])
+def test_tb_zerados(df_sinais, tol_abs, esperado_a):
+    tb = tb_zerados(df_sinais, tol_abs=tol_abs)
+
+    assert list(tb.index) == ['qtd_zerados', 'qtd_negativos', 'qtd_positivos']
+    assert list(tb.columns) == ['a', 'b']
+    assert tb['a'].tolist() == esperado_a
+    assert tb['b'].tolist() == ([2, 2, 3] if tol_abs < 1 else [5, 0, 2])
+
+    # Ausentes não entram em nenhuma contagem
+    assert tb['a'].sum() == df_sinais['a'].notna().sum()
+
+
+@pytest.mark.parametrize('tol_abs', [1e-6, 0.5])
+def test_tb_distrib_alinhado_ao_describe(df_sinais, tol_abs):
+    tb = tb_distrib(df_sinais, qtd_zerados=True, tol_abs=tol_abs)
+    descricao = df_sinais.describe()
+
+    assert tb['index'].tolist() == [*descricao.index, 'qtd_zerados', 'qtd_negativos', 'qtd_positivos']
+    pd.testing.assert_frame_equal(
+        tb.iloc[:len(descricao)].set_index('index').rename_axis(None), descricao, check_dtype=False)
+    pd.testing.assert_frame_equal(
+        tb.iloc[len(descricao):].set_index('index').rename_axis(None),
+        tb_zerados(df_sinais, tol_abs=tol_abs), check_dtype=False)
+
+
+def test_tb_distrib_sem_qtd_zerados(df_sinais):
+    pd.testing.assert_frame_equal(tb_distrib(df_sinais), df_sinais.describe().reset_index())
@@ -1,66 +1,205 @@
-from modulos.utils_pandas.utils_acesso import (
-    le_csv,
-    le_pastas_csv
-)
-
-from modulos.utils_pandas.utils_criacao_colunas import (
-    criar_col_bool,
-    criar_col_chv,
-    criar_col_dif,
-    criar_col_dif_bool,
-    criar_col_pct,
-    criar_col_qtd_digitos,
-    criar_cols_num_formatadas,
-    criar_col_soma_acc,
-    criar_col_verdadeira,
-    criar_col_soma_cols,
-    criar_col_media_cols,
-    criar_col_moda_cols
-)
-
-
-from modulos.utils_pandas.utils_operacoes import (
-    formatar_num,
-    padronizar_string
-)
-
-
-from modulos.utils_pandas.utils_sanitizacao import (
-    mostrar_intervalo,
-    mostrar_n_cols_por_linha,
-    mostrar_top_valores,
-    mostrar_visao_geral,
-    obter_duplicatas,
-    testa_granularidade
-)
-
-
-from modulos.utils_pandas.utils_transformacao_cols import (
-    converter_tipo_cols,
-    mapeia_valores,
-    corrigir_valores_col,
-    preencher_ausentes_cols,
-    preencher_com_ausente,
-    padronizar_str_cols,
-    remover_texto_col,
-    formatar_data_para_ano_mes
-)
-
-
-from modulos.utils_pandas.utils_transformacao_df import (
-    agrupar_chv_lista,
-    conta_distintos_cols_nao_chave,
-    soma_agg,
-    tb_ausentes,
-    tb_ausentes_distintos,
-    tb_distintos,
-    tb_distrib,
-    tb_distrib_data,
-    tb_freq,
-    tb_freq_data,
-    tb_freq_digitos,
-    tb_soma_agg,
-    tb_visao_geral,
-    tb_zerados,
-    transformar_linhas_em_colunas
-)
\ No newline at end of file
+"""
+Fachada do pacote utils_pandas.
+
+Os submódulos (e, com eles, pandas, NumPy e unidecode) só são importados
+na primeira vez em que uma de suas funções é acessada, via __getattr__
+do módulo. Assim, importar este módulo é praticamente instantâneo.
+"""
+
+import importlib
+
+from typing import TYPE_CHECKING
+
+
+_FUNCS_POR_MODULO = {
+    'modulos.utils_pandas.utils_acesso': (
+        'le_csv',
+        'le_csv_grande',
+        'le_pastas_csv'
+    ),
+
+    'modulos.utils_pandas.utils_arrow': (
+        'converter_cols_str_arrow',
+        'eh_str_arrow'
+    ),
+
+    'modulos.utils_pandas.utils_benford': (
+        'DistribDigitos',
+        'digitos_iniciais',
+        'proporcoes_benford',
+        'tb_benford',
+        'tb_benford_streaming',
+        'tb_digitos_iniciais'
+    ),
+
+    'modulos.utils_pandas.utils_cache': (
+        'CacheResultados',
+        'definir_cache_padrao',
+        'impressao_digital'
+    ),
+
+    'modulos.utils_pandas.utils_criacao_colunas': (
+        'criar_col_bool',
+        'criar_col_chv',
+        'criar_col_dif',
+        'criar_col_dif_bool',
+        'criar_col_pct',
+        'criar_col_qtd_digitos',
+        'criar_cols_num_formatadas',
+        'criar_col_soma_acc',
+        'criar_col_verdadeira',
+        'criar_col_soma_cols',
+        'criar_col_media_cols',
+        'criar_col_moda_cols'
+    ),
+
+    'modulos.utils_pandas.utils_distrib': (
+        'DistribStreaming',
+        'EsbocoQuantis',
+        'tb_distrib_data_streaming',
+        'tb_distrib_streaming'
+    ),
+
+    'modulos.utils_pandas.utils_esquema': (
+        'EsquemaCsv',
+        'obter_esquema',
+        'registrar_esquema',
+        'remover_esquema'
+    ),
+
+    'modulos.utils_pandas.utils_indice': (
+        'IndiceChave',
+    ),
+
+    'modulos.utils_pandas.utils_ingestao': (
+        'le_pastas_csv_async',
+    ),
+
+    'modulos.utils_pandas.utils_operacoes': (
+        'escapar_literal',
+        'formatar_num',
+        'montar_padrao_alternancia',
+        'padronizar_string'
+    ),
+
+    'modulos.utils_pandas.utils_paralelo': (
+        'aplicar_por_coluna',
+    ),
+
+    'modulos.utils_pandas.utils_particionado': (
+        'grava_particionado',
+        'le_particionado',
+        'listar_particoes'
+    ),
+
+    'modulos.utils_pandas.utils_saida': (
+        'ResultadoAusentes',
+        'ResultadoColsPorLinha',
+        'ResultadoGranularidade',
+        'ResultadoIntervalo',
+        'ResultadoVisaoGeral',
+        'SaidaJson',
+        'SaidaLogger',
+        'SaidaNotebook',
+        'SaidaResultado',
+        'definir_saida_padrao'
+    ),
+
+    'modulos.utils_pandas.utils_sanitizacao': (
+        'mostrar_intervalo',
+        'mostrar_n_cols_por_linha',
+        'mostrar_top_valores',
+        'mostrar_visao_geral',
+        'obter_duplicatas',
+        'testa_granularidade'
+    ),
+
+    'modulos.utils_pandas.utils_sql': (
+        'FontePastasCsv',
+    ),
+
+    'modulos.utils_pandas.utils_transformacao_cols': (
+        'converter_tipo_cols',
+        'mapeia_valores',
+        'corrigir_valores_col',
+        'preencher_ausentes_cols',
+        'preencher_com_ausente',
+        'padronizar_str_cols',
+        'remover_texto_col',
+        'remover_textos_cols',
+        'formatar_data_para_ano_mes'
+    ),
+
+    'modulos.utils_pandas.utils_transformacao_df': (
+        'agrupar_chv_lista',
+        'conta_distintos_cols_nao_chave',
+        'selecionar_top_n',
+        'soma_agg',
+        'tb_ausentes',
+        'tb_ausentes_distintos',
+        'tb_distintos',
+        'tb_distrib',
+        'tb_distrib_data',
+        'tb_freq',
+        'tb_freq_data',
+        'tb_freq_digitos',
+        'tb_soma_agg',
+        'tb_visao_geral',
+        'tb_zerados',
+        'transformar_linhas_em_colunas'
+    )
+}
+
+_MODULO_POR_FUNC = {
+    nm_func: nm_modulo
+    for nm_modulo, lst_funcs in _FUNCS_POR_MODULO.items()
+    for nm_func in lst_funcs
+}
+
+__all__ = list(_MODULO_POR_FUNC)
+
+
+def __getattr__(nome: str):
+    """
+    Importa, na primeira utilização, o submódulo que define o atributo pedido.
+
+    Parâmetros:
+        nome (str): O nome do atributo acessado.
+
+    Retorno:
+        O objeto definido no submódulo.
+    """
+    try:
+        nm_modulo = _MODULO_POR_FUNC[nome]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {nome!r}') from None
+
+    obj = getattr(importlib.import_module(nm_modulo), nome)
+
+    # Guarda no namespace para que os próximos acessos não passem por aqui
+    globals()[nome] = obj
+    return obj
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+if TYPE_CHECKING:
+    from modulos.utils_pandas.utils_acesso import *
+    from modulos.utils_pandas.utils_arrow import *
+    from modulos.utils_pandas.utils_benford import *
+    from modulos.utils_pandas.utils_cache import *
+    from modulos.utils_pandas.utils_criacao_colunas import *
+    from modulos.utils_pandas.utils_distrib import *
+    from modulos.utils_pandas.utils_esquema import *
+    from modulos.utils_pandas.utils_indice import *
+    from modulos.utils_pandas.utils_ingestao import *
+    from modulos.utils_pandas.utils_operacoes import *
+    from modulos.utils_pandas.utils_paralelo import *
+    from modulos.utils_pandas.utils_particionado import *
+    from modulos.utils_pandas.utils_saida import *
+    from modulos.utils_pandas.utils_sanitizacao import *
+    from modulos.utils_pandas.utils_sql import *
+    from modulos.utils_pandas.utils_transformacao_cols import *
+    from modulos.utils_pandas.utils_transformacao_df import *
@@ -1,20 +1,94 @@
+import io
+import mmap
 import os
 import pandas as pd
 
-def le_csv(pasta_arquivo, nm_arquivo):
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-    caminho_arquivo = os.path.join(pasta_arquivo, nm_arquivo)
+from modulos.utils_pandas.utils_arrow import converter_backend_arrow, converter_cols_str_arrow
+from modulos.utils_pandas.utils_esquema import obter_esquema
+
+
+def _tem_bytes(df):
+    # O motor pyarrow não falha com texto fora do UTF-8: devolve a coluna como bytes
+    for nm_col, serie in df.items():
+        if isinstance(serie.dtype, pd.ArrowDtype):
+            if serie.dtype.pyarrow_dtype in ('binary', 'large_binary'):
+                return True
+        elif serie.dtype == object:
+            vlr = serie.first_valid_index()
+            if vlr is not None and isinstance(serie.loc[vlr], bytes):
+                return True
+
+    return False
+
+
+def _ler_csv(fonte, nm_arquivo, str_arrow = False, esquema = None):
+    """
+    Lê um CSV a partir de um caminho ou de bytes já carregados, tentando UTF-8 e depois latin1.
+
+    Args:
+        fonte (str ou bytes): Caminho do arquivo ou conteúdo do arquivo.
+        nm_arquivo (str): Nome do arquivo, gravado na coluna 'Tabela' e usado para buscar o esquema registrado.
+        str_arrow (bool, optional): Se True, o texto já sai do parser como string[pyarrow] (ver le_csv).
+        esquema (EsquemaCsv, optional): Esquema de leitura. Se não especificado, usa o registrado para nm_arquivo, se houver.
+
+    Returns:
+        pandas.DataFrame: O DataFrame lido, com a coluna 'Tabela'.
+    """
+    if esquema is None:
+        esquema = obter_esquema(nm_arquivo)
+
+    kwargs = {'sep': ','} if esquema is None else esquema.kwargs_read_csv()
+
+    if str_arrow:
+        # Com o motor pyarrow, o texto vai do arquivo para Arrow sem virar objetos Python
+        kwargs = {'engine': 'pyarrow', **kwargs, 'dtype_backend': 'pyarrow'}
+
+    def ler(encoding):
+        origem = io.BytesIO(fonte) if isinstance(fonte, bytes) else fonte
+        return pd.read_csv(origem, encoding=encoding, **kwargs)
 
     try:
-        df = pd.read_csv(caminho_arquivo, sep = ',', encoding='utf-8')
+        df = ler('utf-8')
+        if kwargs.get('engine') == 'pyarrow' and _tem_bytes(df):
+            raise UnicodeDecodeError('utf-8', b'', 0, 1, 'texto fora do UTF-8')
     except UnicodeDecodeError:
-        df = pd.read_csv(caminho_arquivo, sep = ',', encoding='latin1')
-    finally:
-        df['Tabela'] = nm_arquivo
-    
+        df = ler('latin1')
+
+    if str_arrow:
+        df = converter_backend_arrow(df)
+
+    df['Tabela'] = nm_arquivo
+
+    if str_arrow:
+        # Restam 'Tabela' e as colunas que o esquema fixou como 'str'
+        df = converter_cols_str_arrow(df)
+
     return df
 
-def le_pastas_csv(lst_pastas):
+
+def le_csv(pasta_arquivo, nm_arquivo, str_arrow = False, esquema = None):
+    """
+    Lê um arquivo CSV e adiciona a coluna 'Tabela' com o nome do arquivo.
+
+    Args:
+        pasta_arquivo (str): Pasta do arquivo.
+        nm_arquivo (str): Nome do arquivo.
+        str_arrow (bool, optional): Se True, lê com o motor pyarrow e dtype_backend='pyarrow', e as colunas de texto
+            saem do parser como string[pyarrow], sem passar por objetos Python. Nesse modo o motor pyarrow
+            reconhece datas ISO (aaaa-mm-dd), que saem como datetime64[ns] em vez de texto.
+        esquema (EsquemaCsv, optional): Esquema com colunas, tipos, formatos de data e separadores, aplicado
+            direto no parser. Se não especificado, usa o registrado com registrar_esquema para nm_arquivo, se houver.
+
+    Returns:
+        pandas.DataFrame: O DataFrame lido.
+    """
+    caminho_arquivo = os.path.join(pasta_arquivo, nm_arquivo)
+
+    return _ler_csv(caminho_arquivo, nm_arquivo, str_arrow, esquema)
+
+def le_pastas_csv(lst_pastas, str_arrow = False, esquema = None):
 
     lst_dfs = []
 
@@ -22,8 +96,115 @@ def le_pastas_csv(lst_pastas):
 
         for nm_arquivo in os.listdir(pasta):
             if nm_arquivo.endswith('.csv'):
-                
-                df = le_csv(pasta, nm_arquivo)
+
+                df = le_csv(pasta, nm_arquivo, str_arrow, esquema)
                 lst_dfs.append(df)
 
     return pd.concat(lst_dfs)
+
+
+def _contar_aspas(mm, inicio, fim, passo = 1 << 24):
+    # Conta em janelas para não copiar o trecho inteiro do arquivo de uma vez
+    return sum(mm[i:min(i + passo, fim)].count(b'"') for i in range(inicio, fim, passo))
+
+
+def _fim_linha(mm, inicio, paridade = 0):
+    """
+    Retorna a posição logo após o primeiro fim de linha a partir de inicio que não esteja
+    dentro de um campo entre aspas, dada a paridade de aspas acumulada até inicio.
+    Retorna None se não houver.
+    """
+    while True:
+        pos_nl = mm.find(b'\n', inicio)
+        if pos_nl == -1:
+            return None
+
+        paridade = (paridade + _contar_aspas(mm, inicio, pos_nl)) % 2
+        if paridade == 0:
+            return pos_nl + 1
+
+        inicio = pos_nl + 1
+
+
+def _limites_blocos(mm, inicio, tamanho_bloco):
+    """
+    Divide o arquivo, a partir de inicio, em trechos de cerca de tamanho_bloco bytes
+    que terminam em fim de linha fora de campos entre aspas.
+    """
+    limites = [inicio]
+
+    for alvo in range(inicio + tamanho_bloco, len(mm), tamanho_bloco):
+        if alvo <= limites[-1]:
+            continue
+
+        # Cada limite fica com paridade par, então basta contar desde o último
+        paridade = _contar_aspas(mm, limites[-1], alvo) % 2
+        limite = _fim_linha(mm, alvo, paridade)
+
+        if limite is None:
+            break
+
+        if limite < len(mm):
+            limites.append(limite)
+
+    limites.append(len(mm))
+
+    return list(zip(limites[:-1], limites[1:]))
+
+
+def _ler_bloco(caminho_arquivo, fim_cabecalho, inicio, fim, nm_arquivo, str_arrow, esquema):
+    # Abre o próprio mapeamento, para funcionar também em outro processo
+    with open(caminho_arquivo, 'rb') as arquivo, \
+            mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        conteudo = mm[:fim_cabecalho] + mm[inicio:fim]
+
+    return _ler_csv(conteudo, nm_arquivo, str_arrow, esquema)
+
+
+def le_csv_grande(pasta_arquivo, nm_arquivo, str_arrow = False, esquema = None,
+                  tamanho_bloco = 64 * 2**20, max_workers = None, processos = False):
+    """
+    Lê um arquivo CSV grande em paralelo: o arquivo é mapeado em memória e dividido em trechos
+    de cerca de tamanho_bloco bytes, terminados em fim de linha fora de campos entre aspas.
+    Cada trecho é lido com o cabeçalho do arquivo, com a mesma tentativa de UTF-8 e depois latin1
+    de le_csv, e os trechos são concatenados na ordem do arquivo.
+
+    Sem esquema, os tipos são inferidos trecho a trecho; uma coluna pode sair como object se os
+    trechos inferirem tipos diferentes. Um EsquemaCsv fixa os tipos em todos os trechos.
+
+    Args:
+        pasta_arquivo (str): Pasta do arquivo.
+        nm_arquivo (str): Nome do arquivo.
+        str_arrow (bool, optional): Se True, o texto já sai do parser como string[pyarrow] (ver le_csv).
+        esquema (EsquemaCsv, optional): Esquema de leitura, como em le_csv.
+        tamanho_bloco (int, optional): Tamanho aproximado de cada trecho, em bytes. Padrão é 64 MiB.
+        max_workers (int, optional): Quantidade de trechos lidos ao mesmo tempo. Padrão do executor se não especificado.
+        processos (bool, optional): Se True, lê os trechos em processos em vez de threads. Defaults to False.
+
+    Returns:
+        pandas.DataFrame: O DataFrame lido, igual ao de le_csv (com índice de 0 a n-1).
+    """
+    caminho_arquivo = os.path.join(pasta_arquivo, nm_arquivo)
+
+    if os.path.getsize(caminho_arquivo) <= tamanho_bloco:
+        return _ler_csv(caminho_arquivo, nm_arquivo, str_arrow, esquema)
+
+    with open(caminho_arquivo, 'rb') as arquivo, \
+            mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+
+        fim_cabecalho = _fim_linha(mm, 0)
+        if fim_cabecalho is None:
+            return _ler_csv(caminho_arquivo, nm_arquivo, str_arrow, esquema)
+
+        blocos = _limites_blocos(mm, fim_cabecalho, tamanho_bloco)
+
+    executor = ProcessPoolExecutor if processos else ThreadPoolExecutor
+
+    with executor(max_workers=max_workers) as ex:
+        futuros = [
+            ex.submit(_ler_bloco, caminho_arquivo, fim_cabecalho, inicio, fim, nm_arquivo, str_arrow, esquema)
+            for inicio, fim in blocos]
+
+        lst_dfs = [futuro.result() for futuro in futuros]
+
+    return pd.concat(lst_dfs, ignore_index=True)
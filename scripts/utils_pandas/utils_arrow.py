@@ -0,0 +1,181 @@
+import pandas as pd
+
+from typing import Dict, List, Optional
+from pandas.core.frame import DataFrame
+
+
+DTYPE_STR_ARROW = 'string[pyarrow]'
+
+
+def eh_str_arrow(serie: pd.Series) -> bool:
+    """
+    Indica se a série é de texto armazenada em Arrow (string[pyarrow]).
+
+    Parâmetros:
+        serie (pd.Series): A série.
+
+    Retorno:
+        bool: True se a série usa o dtype string[pyarrow].
+    """
+    return isinstance(serie.dtype, pd.StringDtype) and serie.dtype.storage == 'pyarrow'
+
+
+def converter_cols_str_arrow(df: DataFrame, cols: Optional[List[str]] = None) -> DataFrame:
+    """
+    Converte colunas de texto (object com apenas strings) para string[pyarrow].
+
+    Parâmetros:
+        df (DataFrame): DataFrame de entrada.
+        cols (List[str], optional): Colunas a converter. Se não especificado, usa as colunas object
+            cujos valores não ausentes são todos strings.
+
+    Retorno:
+        DataFrame: DataFrame com as colunas de texto em string[pyarrow].
+    """
+    novo_df = df.copy()
+
+    if cols is None:
+        cols = [
+            c for c in novo_df.select_dtypes(include='object').columns
+            if pd.api.types.infer_dtype(novo_df[c], skipna=True) == 'string']
+
+    for c in cols:
+        novo_df[c] = novo_df[c].astype(DTYPE_STR_ARROW)
+
+    return novo_df
+
+
+def converter_backend_arrow(df: DataFrame) -> DataFrame:
+    """
+    Ajusta um DataFrame lido com dtype_backend='pyarrow': colunas de texto passam para string[pyarrow]
+    (de Arrow para Arrow, sem criar objetos Python), datas e timestamps para datetime64[ns] e as demais
+    para os tipos NumPy que a leitura padrão produziria (por exemplo, inteiros com ausentes viram float64).
+
+    Parâmetros:
+        df (DataFrame): DataFrame com colunas pd.ArrowDtype.
+
+    Retorno:
+        DataFrame: DataFrame com as colunas convertidas.
+    """
+    import pyarrow as pa
+
+    dic_cols = {}
+
+    for nm_col, serie in df.items():
+        if not isinstance(serie.dtype, pd.ArrowDtype):
+            continue
+
+        tp = serie.dtype.pyarrow_dtype
+
+        if pa.types.is_string(tp) or pa.types.is_large_string(tp):
+            dic_cols[nm_col] = serie.astype(DTYPE_STR_ARROW)
+        elif pa.types.is_date(tp) or pa.types.is_timestamp(tp):
+            dic_cols[nm_col] = serie.astype('datetime64[ns]')
+        else:
+            dic_cols[nm_col] = pd.Series(pa.array(serie.array).to_pandas(), index=serie.index, name=nm_col)
+
+    novo_df = df.copy(deep=False)
+    for nm_col, serie in dic_cols.items():
+        novo_df[nm_col] = serie
+
+    return novo_df
+
+
+def _para_arrow(serie: pd.Series):
+    import pyarrow as pa
+
+    return pa.array(serie.array)
+
+
+def _de_arrow(arr, serie: pd.Series) -> pd.Series:
+    return pd.Series(pd.arrays.ArrowStringArray(arr), index=serie.index, name=serie.name)
+
+
+def padronizar_str_arrow(serie: pd.Series) -> pd.Series:
+    """
+    Equivalente vetorizado de padronizar_string para séries string[pyarrow], com kernels do Arrow.
+    A remoção de acentos usa a decomposição NFKD e descarta as marcas combinantes, o que cobre
+    a acentuação do português; ao contrário do unidecode, não translitera outros alfabetos.
+
+    Parâmetros:
+        serie (pd.Series): Série string[pyarrow].
+
+    Retorno:
+        pd.Series: Série string[pyarrow] padronizada.
+    """
+    import pyarrow.compute as pc
+
+    arr = _para_arrow(serie)
+
+    # Remove acentuação
+    arr = pc.replace_substring_regex(pc.utf8_normalize(arr, 'NFKD'), r'\p{Mn}', '')
+    # Converte para minúsculas
+    arr = pc.utf8_lower(arr)
+    # Substitui traço por espaço e ponto por vazio
+    arr = pc.replace_substring(arr, '-', ' ')
+    arr = pc.replace_substring(arr, '.', '')
+    # Remove espaços das pontas e une palavras com underline
+    arr = pc.replace_substring_regex(pc.utf8_trim_whitespace(arr), r'\s+', '_')
+
+    return _de_arrow(arr, serie)
+
+
+def substituir_valores_arrow(serie: pd.Series, dic_correcao: Dict[str, str]) -> pd.Series:
+    """
+    Substitui valores inteiros de uma série string[pyarrow] segundo um dicionário, sem sair do Arrow.
+    Chaves que não são texto nunca casam com a série e são ignoradas; os valores corrigidos precisam
+    ser texto ou None (ver corrigir_valores_col, que usa o caminho object nos demais casos).
+
+    Parâmetros:
+        serie (pd.Series): Série string[pyarrow].
+        dic_correcao (Dict[str, str]): Dicionário valor original -> valor corrigido.
+
+    Retorno:
+        pd.Series: Série string[pyarrow] com os valores substituídos.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arr = _para_arrow(serie)
+
+    dic_correcao = {k: v for k, v in dic_correcao.items() if isinstance(k, str)}
+
+    chaves = pa.array(list(dic_correcao.keys()), type=arr.type)
+    valores = pa.array(list(dic_correcao.values()), type=arr.type)
+
+    idx = pc.index_in(arr, value_set=chaves)
+    arr = pc.if_else(pc.is_null(idx), arr, pc.take(valores, idx))
+
+    return _de_arrow(arr, serie)
+
+
+def aceita_substituicao_arrow(dic_correcao: Dict) -> bool:
+    """
+    Indica se os valores corrigidos são todos texto (ou None) e cabem em uma série string[pyarrow].
+    """
+    return all(v is None or isinstance(v, str) for v in dic_correcao.values())
+
+
+def concatenar_cols_str_arrow(df: DataFrame, cols: List[str], sep: str = ' | ') -> pd.Series:
+    """
+    Concatena colunas string[pyarrow] linha a linha com um separador, sem sair do Arrow.
+    Valores ausentes viram 'nan', como na concatenação feita com astype(str).
+
+    Parâmetros:
+        df (DataFrame): DataFrame de entrada.
+        cols (List[str]): Colunas string[pyarrow] a concatenar.
+        sep (str, optional): Separador. Padrão é ' | '.
+
+    Retorno:
+        pd.Series: Série string[pyarrow] com as colunas concatenadas.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    lst_arrs = [_para_arrow(df[c]) for c in cols]
+
+    arr = pc.binary_join_element_wise(
+        *lst_arrs, pa.scalar(sep, type=lst_arrs[0].type),
+        null_handling='replace', null_replacement='nan')
+
+    return _de_arrow(arr, df[cols[0]]).rename(None)
@@ -0,0 +1,303 @@
+import numpy as np
+import pandas as pd
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from pandas.core.frame import DataFrame
+
+
+# Análise de dígitos iniciais (lei de Benford). Os dígitos saem de conta com
+# log10 sobre os valores, sem conversão para texto, e as contagens de todos os
+# grupos saem de um único np.bincount por pedaço. O acumulador soma pedaços
+# (por exemplo, de pd.read_csv(..., chunksize=...)), então o histórico inteiro
+# pode ser processado com memória limitada ao número de grupos.
+
+
+# Limites de MAD de Nigrini para conformidade com a lei de Benford
+LIMITES_MAD = {
+    1: (0.006, 0.012, 0.015),
+    2: (0.0012, 0.0018, 0.0022)
+}
+
+CONFORMIDADES = ('próxima', 'aceitável', 'marginal', 'não conforme')
+
+
+def digitos_iniciais(valores, qtd_digitos: int = 1, vlr_min: float = 0) -> np.ndarray:
+    """
+    Extrai os primeiros dígitos de cada valor, por conta: d = floor(|x| * 10**(k - 1 - floor(log10|x|))).
+    O valor escalado é arredondado em 9 casas antes do floor, para que 0.29 * 100 = 28.999...
+    dê 29, e erros de arredondamento do log10 perto de potências de 10 são corrigidos em seguida.
+
+    Parâmetros:
+        valores: Array ou série numérica.
+        qtd_digitos (int, optional): Quantidade de dígitos iniciais (1 ou 2). Padrão é 1.
+        vlr_min (float, optional): Valores com |x| menor que este são ignorados. Padrão é 0.
+
+    Retorno:
+        np.ndarray: Os dígitos (por exemplo 1 a 9, ou 10 a 99), com 0 nos valores ignorados
+            (zero, subnormais, ausentes, infinitos ou abaixo de vlr_min).
+    """
+    absolutos = np.abs(np.asarray(valores, dtype=float))
+
+    # Subnormais (abaixo de ~2.2e-308) pediriam 10**324, que estoura para infinito
+    validos = np.isfinite(absolutos) & (absolutos >= np.finfo(float).tiny) & (absolutos >= vlr_min)
+
+    absolutos = np.where(validos, absolutos, 1.0)
+    expoentes = qtd_digitos - 1 - np.floor(np.log10(absolutos))
+
+    # Multiplicar ou dividir por uma potência de 10 exata evita erros como 0.3 / 0.1 = 2.999...
+    # As correções de ±1 no expoente podem pedir 10**309 perto dos extremos; esses casos não são usados
+    def escalar(expoentes):
+        with np.errstate(over='ignore'):
+            return np.floor(np.round(np.where(
+                expoentes >= 0,
+                absolutos * 10.0 ** np.maximum(expoentes, 0),
+                absolutos / 10.0 ** np.maximum(-expoentes, 0)), 9))
+
+    digitos = escalar(expoentes)
+
+    minimo, maximo = 10 ** (qtd_digitos - 1), 10 ** qtd_digitos
+    digitos = np.where(digitos >= maximo, escalar(expoentes - 1), digitos)
+    digitos = np.where(digitos < minimo, escalar(expoentes + 1), digitos)
+
+    return np.where(validos, digitos, 0).astype('int64')
+
+
+def proporcoes_benford(qtd_digitos: int = 1) -> pd.Series:
+    """
+    Proporções esperadas pela lei de Benford: log10(1 + 1/d).
+
+    Parâmetros:
+        qtd_digitos (int, optional): Quantidade de dígitos iniciais. Padrão é 1.
+
+    Retorno:
+        pd.Series: Proporção esperada, indexada pelo dígito.
+    """
+    digitos = np.arange(10 ** (qtd_digitos - 1), 10 ** qtd_digitos)
+    return pd.Series(np.log10(1 + 1 / digitos), index=pd.Index(digitos, name='digito'), name='freq_esperada')
+
+
+def _normalizar_chave(chave: tuple) -> tuple:
+    # NaN != NaN: ausentes viram None para que a mesma chave caia no mesmo grupo em todos os pedaços
+    return tuple(None if pd.isna(v) else v for v in chave)
+
+
+class DistribDigitos:
+    """
+    Acumula, pedaço a pedaço, a distribuição dos dígitos iniciais de uma coluna por grupo.
+
+    Parâmetros:
+        col (str): Coluna de valores, por exemplo o valor da transação.
+        cols_grupo (List[str], optional): Colunas de grupo, por exemplo ['conta', 'ano_mes'].
+            Se não especificado, há um único grupo.
+        qtd_digitos (int, optional): Quantidade de dígitos iniciais (1 ou 2). Padrão é 1.
+        vlr_min (float, optional): Valores com |x| menor que este são ignorados. Padrão é 0.
+    """
+
+    def __init__(self, col: str, cols_grupo: Optional[List[str]] = None, qtd_digitos: int = 1, vlr_min: float = 0):
+        if qtd_digitos not in LIMITES_MAD:
+            raise ValueError(f'qtd_digitos deve ser um de {tuple(LIMITES_MAD)}, não {qtd_digitos!r}')
+
+        self.col = col
+        self.cols_grupo = [] if cols_grupo is None else list(cols_grupo)
+        self.qtd_digitos = qtd_digitos
+        self.vlr_min = vlr_min
+
+        self._primeiro = 10 ** (qtd_digitos - 1)
+        self._qtd_bins = 9 * self._primeiro
+
+        self._linhas: Dict[tuple, int] = {}
+        self._contagens = np.zeros((0, self._qtd_bins), dtype='int64')
+
+    def _linhas_globais(self, lst_chaves: List[tuple]) -> np.ndarray:
+        linhas = np.empty(len(lst_chaves), dtype='int64')
+
+        for i, chave in enumerate(lst_chaves):
+            linhas[i] = self._linhas.setdefault(_normalizar_chave(chave), len(self._linhas))
+
+        if len(self._linhas) > len(self._contagens):
+            # Capacidade dobra, para não realocar a matriz a cada pedaço
+            nova_capacidade = max(len(self._linhas), 2 * len(self._contagens))
+            novas = np.zeros((nova_capacidade, self._qtd_bins), dtype='int64')
+            novas[:len(self._contagens)] = self._contagens
+            self._contagens = novas
+
+        return linhas
+
+    def _somar(self, lst_chaves: List[tuple], contagens: np.ndarray) -> None:
+        linhas = self._linhas_globais(lst_chaves)
+        np.add.at(self._contagens, linhas, contagens)
+
+    def atualizar(self, df: DataFrame) -> 'DistribDigitos':
+        """
+        Acrescenta um pedaço de dados.
+
+        Parâmetros:
+            df (DataFrame): O pedaço.
+
+        Retorno:
+            DistribDigitos: O próprio acumulador.
+        """
+        digitos = digitos_iniciais(df[self.col], self.qtd_digitos, self.vlr_min)
+
+        if self.cols_grupo:
+            grupos = df.groupby(self.cols_grupo, sort=False, dropna=False)
+            codigos = grupos.ngroup().to_numpy(dtype='int64')
+            lst_chaves = list(grupos.size().index)
+            if len(self.cols_grupo) == 1:
+                lst_chaves = [(c,) for c in lst_chaves]
+        else:
+            codigos = np.zeros(len(df), dtype='int64')
+            lst_chaves = [()]
+
+        # Uma única contagem para todos os grupos: posição = grupo * qtd_bins + (dígito - primeiro)
+        validos = digitos > 0
+        posicoes = codigos[validos] * self._qtd_bins + (digitos[validos] - self._primeiro)
+        contagens = np.bincount(posicoes, minlength=len(lst_chaves) * self._qtd_bins)
+
+        self._somar(lst_chaves, contagens.reshape(len(lst_chaves), self._qtd_bins))
+
+        return self
+
+    def mesclar(self, outro: 'DistribDigitos') -> 'DistribDigitos':
+        """
+        Incorpora outro acumulador (por exemplo, de outro arquivo ou processo) a este.
+
+        Parâmetros:
+            outro (DistribDigitos): O acumulador incorporado.
+
+        Retorno:
+            DistribDigitos: O próprio acumulador.
+        """
+        self._somar(list(outro._linhas), outro._contagens[:len(outro._linhas)])
+        return self
+
+    def _chaves_contagens(self) -> Tuple[DataFrame, np.ndarray]:
+        chaves = pd.DataFrame(list(self._linhas), columns=self.cols_grupo)
+        return chaves, self._contagens[:len(self._linhas)]
+
+    def tb_freq(self) -> DataFrame:
+        """
+        Retorna a distribuição dos dígitos por grupo, comparada à esperada.
+
+        Retorno:
+            DataFrame: Colunas de grupo, digito, freq_abs, freq_rel (em %), freq_esperada (em %) e dif (freq_rel - freq_esperada).
+        """
+        chaves, contagens = self._chaves_contagens()
+        esperadas = proporcoes_benford(self.qtd_digitos).to_numpy() * 100
+
+        qtds = contagens.sum(axis=1, keepdims=True)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            freq_rel = contagens * 100 / qtds
+
+        novo_df = chaves.loc[chaves.index.repeat(self._qtd_bins)].reset_index(drop=True)
+        novo_df['digito'] = np.tile(np.arange(self._primeiro, self._primeiro + self._qtd_bins), len(chaves))
+        novo_df['freq_abs'] = contagens.ravel()
+        novo_df['freq_rel'] = freq_rel.ravel()
+        novo_df['freq_esperada'] = np.tile(esperadas, len(chaves))
+        novo_df['dif'] = novo_df['freq_rel'] - novo_df['freq_esperada']
+
+        return novo_df
+
+    def tb_desvios(self) -> DataFrame:
+        """
+        Retorna, por grupo, as medidas de desvio em relação à lei de Benford.
+
+        - mad: desvio absoluto médio entre as proporções observadas e esperadas;
+        - qui2: estatística qui-quadrado, com gl = qtd de dígitos - 1 graus de liberdade;
+        - z_max: maior estatística z (com correção de continuidade) entre os dígitos, e digito_z_max;
+        - conformidade: faixa de Nigrini para o mad.
+
+        Retorno:
+            DataFrame: Colunas de grupo, qtd, mad, qui2, gl, z_max, digito_z_max e conformidade.
+        """
+        chaves, contagens = self._chaves_contagens()
+        esperadas = proporcoes_benford(self.qtd_digitos).to_numpy()
+
+        qtds = contagens.sum(axis=1)
+        n = qtds[:, None].astype(float)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            observadas = contagens / n
+
+            mad = np.abs(observadas - esperadas).mean(axis=1)
+            qui2 = ((contagens - n * esperadas) ** 2 / (n * esperadas)).sum(axis=1)
+
+            z = (
+                np.maximum(np.abs(observadas - esperadas) - 1 / (2 * n), 0)
+                / np.sqrt(esperadas * (1 - esperadas) / n))
+
+        tem_valores = qtds > 0
+        pos_z_max = np.argmax(np.where(np.isnan(z), -np.inf, z), axis=1)
+
+        novo_df = chaves.copy()
+        novo_df['qtd'] = qtds
+        novo_df['mad'] = np.where(tem_valores, mad, np.nan)
+        novo_df['qui2'] = np.where(tem_valores, qui2, np.nan)
+        novo_df['gl'] = self._qtd_bins - 1
+        novo_df['z_max'] = np.where(tem_valores, z[np.arange(len(z)), pos_z_max], np.nan)
+        novo_df['digito_z_max'] = pos_z_max + self._primeiro
+
+        faixas = np.searchsorted(LIMITES_MAD[self.qtd_digitos], novo_df['mad'].to_numpy(), side='right')
+        novo_df['conformidade'] = np.where(
+            tem_valores, np.array(CONFORMIDADES, dtype=object)[np.minimum(faixas, len(CONFORMIDADES) - 1)], None)
+
+        return novo_df
+
+
+def tb_digitos_iniciais(df: DataFrame, col: str, cols_grupo: Optional[List[str]] = None,
+                        qtd_digitos: int = 1, vlr_min: float = 0) -> DataFrame:
+    """
+    Calcula a frequência dos primeiros dígitos de uma coluna numérica, por grupo, comparada à lei de Benford.
+
+    Parâmetros:
+        df (DataFrame): DataFrame de entrada.
+        col (str): Nome da coluna contendo os valores a serem analisados.
+        cols_grupo (List[str], optional): Colunas de grupo, por exemplo ['conta', 'ano_mes']. Defaults to None.
+        qtd_digitos (int, optional): Quantidade de dígitos iniciais (1 ou 2). Defaults to 1.
+        vlr_min (float, optional): Valores com |x| menor que este são ignorados. Defaults to 0.
+
+    Retorno:
+        DataFrame: Ver DistribDigitos.tb_freq.
+    """
+    return DistribDigitos(col, cols_grupo, qtd_digitos, vlr_min).atualizar(df).tb_freq()
+
+
+def tb_benford(df: DataFrame, col: str, cols_grupo: Optional[List[str]] = None,
+               qtd_digitos: int = 1, vlr_min: float = 0) -> DataFrame:
+    """
+    Calcula, por grupo, as medidas de desvio dos primeiros dígitos de uma coluna em relação à lei de Benford.
+
+    Parâmetros:
+        df (DataFrame): DataFrame de entrada.
+        col (str): Nome da coluna contendo os valores a serem analisados.
+        cols_grupo (List[str], optional): Colunas de grupo, por exemplo ['conta', 'ano_mes']. Defaults to None.
+        qtd_digitos (int, optional): Quantidade de dígitos iniciais (1 ou 2). Defaults to 1.
+        vlr_min (float, optional): Valores com |x| menor que este são ignorados. Defaults to 0.
+
+    Retorno:
+        DataFrame: Ver DistribDigitos.tb_desvios.
+    """
+    return DistribDigitos(col, cols_grupo, qtd_digitos, vlr_min).atualizar(df).tb_desvios()
+
+
+def tb_benford_streaming(pedacos: Iterable[DataFrame], col: str, cols_grupo: Optional[List[str]] = None,
+                         qtd_digitos: int = 1, vlr_min: float = 0) -> DataFrame:
+    """
+    Versão de tb_benford para dados lidos em pedaços.
+
+    Parâmetros:
+        pedacos (Iterable[DataFrame]): Pedaços dos dados, por exemplo pd.read_csv(..., chunksize=...).
+        col (str): Nome da coluna contendo os valores a serem analisados.
+        cols_grupo (List[str], optional): Colunas de grupo. Defaults to None.
+        qtd_digitos (int, optional): Quantidade de dígitos iniciais (1 ou 2). Defaults to 1.
+        vlr_min (float, optional): Valores com |x| menor que este são ignorados. Defaults to 0.
+
+    Retorno:
+        DataFrame: Ver DistribDigitos.tb_desvios.
+    """
+    distrib = DistribDigitos(col, cols_grupo, qtd_digitos, vlr_min)
+
+    for df in pedacos:
+        distrib.atualizar(df)
+
+    return distrib.tb_desvios()
@@ -0,0 +1,357 @@
+import copy
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+from pandas.core.frame import DataFrame
+
+from modulos.utils_pandas.utils_saida import emitir
+from modulos.utils_pandas.utils_sql import FontePastasCsv
+
+
+# Cache de resultados das funções tb_* e afins. A chave é a impressão digital
+# do conteúdo do DataFrame de entrada (hash dos buffers das colunas) mais os
+# demais argumentos, então um DataFrame alterado gera outra chave e o
+# resultado antigo simplesmente deixa de ser usado até ser descartado.
+
+
+def _atualizar_serie(h, serie: pd.Series) -> None:
+    dtype = serie.dtype
+
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+        # Tipos NumPy: o próprio buffer da coluna, sem conversão
+        h.update(np.ascontiguousarray(serie.to_numpy()).view(np.uint8).data)
+    else:
+        if dtype == object:
+            # hash_pandas_object converte valores mistos em texto: 1 e '1', NaN e None colidiriam
+            tipo = pd.api.types.infer_dtype(serie, skipna=False)
+            h.update(tipo.encode())
+
+            if tipo.startswith('mixed'):
+                tipos = serie.map(lambda vlr: type(vlr).__name__)
+                h.update(pd.util.hash_pandas_object(tipos, index=False).to_numpy().data)
+
+        try:
+            h.update(pd.util.hash_pandas_object(serie, index=False).to_numpy().data)
+        except TypeError:
+            # Células não hasheáveis (listas, dicionários): pickle dos valores ou, se nem isso
+            # for possível, o repr; um repr com endereço de memória só faz o cache não ser achado
+            try:
+                h.update(pickle.dumps(serie.tolist(), protocol=4))
+            except Exception:
+                h.update(repr(serie.tolist()).encode())
+
+
+def impressao_digital(obj) -> str:
+    """
+    Calcula uma impressão digital do conteúdo de um DataFrame ou Series: nomes, tipos,
+    índice e valores de cada coluna. Para uma FontePastasCsv, usa caminho, tamanho e
+    data de modificação dos arquivos.
+
+    Parâmetros:
+        obj (DataFrame, Series ou FontePastasCsv): O objeto.
+
+    Retorno:
+        str: Hash hexadecimal (blake2b, 128 bits).
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    if isinstance(obj, FontePastasCsv):
+        for caminho in sorted(obj.arquivos()):
+            info = os.stat(caminho)
+            h.update(repr((caminho, info.st_size, info.st_mtime_ns)).encode())
+
+        return h.hexdigest()
+
+    if isinstance(obj, pd.Series):
+        obj = obj.to_frame()
+
+    h.update(repr((type(obj).__name__, obj.shape)).encode())
+    h.update(pd.util.hash_pandas_object(obj.index.to_series(), index=False).to_numpy().data)
+
+    for nm_col, serie in obj.items():
+        h.update(repr((nm_col, str(serie.dtype))).encode())
+        _atualizar_serie(h, serie)
+
+    return h.hexdigest()
+
+
+def _chave_valor(vlr) -> str:
+    if isinstance(vlr, (DataFrame, pd.Series, FontePastasCsv)):
+        return f'<{type(vlr).__name__} {impressao_digital(vlr)}>'
+
+    if isinstance(vlr, pd.Index):
+        return f'<Index {list(vlr)!r}>'
+
+    if isinstance(vlr, (list, tuple)):
+        return '[' + ', '.join(_chave_valor(v) for v in vlr) + ']'
+
+    if isinstance(vlr, dict):
+        return '{' + ', '.join(f'{k!r}: {_chave_valor(v)}' for k, v in vlr.items()) + '}'
+
+    return repr(vlr)
+
+
+def _tamanho(vlr) -> int:
+    if isinstance(vlr, (DataFrame, pd.Series)):
+        return int(np.sum(vlr.memory_usage(deep=True)))
+
+    if isinstance(vlr, (list, tuple)):
+        return sys.getsizeof(vlr) + sum(_tamanho(v) for v in vlr)
+
+    return sys.getsizeof(vlr)
+
+
+class CacheResultados:
+    """
+    Cache de resultados com uma camada em memória (LRU) e uma camada opcional em disco (pickle).
+    A camada em disco é FIFO: os arquivos saem em ordem de gravação (data de modificação, que
+    também marca a idade do resultado), e uma leitura não adia o descarte.
+    Os valores devolvidos são sempre cópias, então alterar um resultado não altera o cache.
+
+    Parâmetros:
+        max_itens (int, optional): Quantidade máxima de resultados em memória. Padrão é 128.
+        max_bytes (int, optional): Tamanho máximo, em bytes, dos resultados em memória. Sem limite se não especificado.
+        max_idade (float, optional): Idade máxima, em segundos, de um resultado (em memória e em disco). Sem limite se não especificado.
+        pasta (str, optional): Pasta da camada em disco. Sem camada em disco se não especificado.
+        max_bytes_disco (int, optional): Tamanho máximo, em bytes, da camada em disco. Sem limite se não especificado.
+    """
+
+    def __init__(self, max_itens: int = 128, max_bytes: Optional[int] = None, max_idade: Optional[float] = None,
+                 pasta: Optional[str] = None, max_bytes_disco: Optional[int] = None):
+        self.max_itens = max_itens
+        self.max_bytes = max_bytes
+        self.max_idade = max_idade
+        self.pasta = pasta
+        self.max_bytes_disco = max_bytes_disco
+
+        self._memoria: 'OrderedDict[str, Tuple[float, int, Any]]' = OrderedDict()
+        self._bytes = 0
+
+        if pasta is not None:
+            os.makedirs(pasta, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._memoria)
+
+    def _expirado(self, instante: float) -> bool:
+        return self.max_idade is not None and time.time() - instante > self.max_idade
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.pasta, f'{chave}.pkl')
+
+    def _remover_memoria(self, chave: str) -> None:
+        _, tam, _ = self._memoria.pop(chave)
+        self._bytes -= tam
+
+    def _descartar_memoria(self) -> None:
+        while self._memoria and (
+                len(self._memoria) > self.max_itens
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            self._remover_memoria(next(iter(self._memoria)))
+
+    def _descartar_disco(self) -> None:
+        lst_arquivos = []
+
+        for nm_arquivo in os.listdir(self.pasta):
+            if nm_arquivo.endswith('.pkl'):
+                info = os.stat(os.path.join(self.pasta, nm_arquivo))
+                lst_arquivos.append((info.st_mtime, info.st_size, nm_arquivo))
+
+        lst_arquivos.sort()
+        total = sum(tam for _, tam, _ in lst_arquivos)
+
+        # Os gravados há mais tempo saem primeiro
+        for instante, tam, nm_arquivo in lst_arquivos:
+            if not (self._expirado(instante) or (self.max_bytes_disco is not None and total > self.max_bytes_disco)):
+                break
+
+            os.remove(os.path.join(self.pasta, nm_arquivo))
+            total -= tam
+
+    def obter(self, chave: str) -> Tuple[bool, Any]:
+        """
+        Procura um resultado, primeiro em memória e depois em disco.
+
+        Parâmetros:
+            chave (str): A chave do resultado.
+
+        Retorno:
+            Tuple[bool, Any]: (True, cópia do valor) se encontrado, senão (False, None).
+        """
+        if chave in self._memoria:
+            instante, _, vlr = self._memoria[chave]
+
+            if not self._expirado(instante):
+                self._memoria.move_to_end(chave)
+                return True, copy.deepcopy(vlr)
+
+            self._remover_memoria(chave)
+
+        if self.pasta is not None:
+            caminho = self._caminho(chave)
+
+            try:
+                instante = os.path.getmtime(caminho)
+
+                if self._expirado(instante):
+                    os.remove(caminho)
+                    return False, None
+
+                with open(caminho, 'rb') as arquivo:
+                    vlr = pickle.load(arquivo)
+
+            except FileNotFoundError:
+                return False, None
+
+            self._guardar_memoria(chave, vlr, instante)
+            return True, copy.deepcopy(vlr)
+
+        return False, None
+
+    def _guardar_memoria(self, chave: str, vlr: Any, instante: Optional[float] = None) -> None:
+        if chave in self._memoria:
+            self._remover_memoria(chave)
+
+        tam = _tamanho(vlr)
+        self._memoria[chave] = (time.time() if instante is None else instante, tam, vlr)
+        self._bytes += tam
+        self._descartar_memoria()
+
+    def guardar(self, chave: str, vlr: Any) -> None:
+        """
+        Guarda uma cópia do resultado em memória e, se houver pasta, em disco.
+
+        Parâmetros:
+            chave (str): A chave do resultado.
+            vlr (Any): O resultado.
+
+        Retorno:
+            None
+        """
+        vlr = copy.deepcopy(vlr)
+        self._guardar_memoria(chave, vlr)
+
+        if self.pasta is not None:
+            caminho = self._caminho(chave)
+            caminho_tmp = f'{caminho}.{os.getpid()}.tmp'
+
+            with open(caminho_tmp, 'wb') as arquivo:
+                pickle.dump(vlr, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(caminho_tmp, caminho)
+            self._descartar_disco()
+
+    def limpar(self, disco: bool = True) -> None:
+        """
+        Remove todos os resultados da memória e, se disco=True, da pasta.
+        """
+        self._memoria.clear()
+        self._bytes = 0
+
+        if disco and self.pasta is not None:
+            for nm_arquivo in os.listdir(self.pasta):
+                if nm_arquivo.endswith('.pkl'):
+                    os.remove(os.path.join(self.pasta, nm_arquivo))
+
+
+_cache_padrao = CacheResultados()
+
+
+def definir_cache_padrao(cache: CacheResultados) -> None:
+    """
+    Define o cache usado pelas funções chamadas com cache=True.
+
+    Parâmetros:
+        cache (CacheResultados): O cache, por exemplo com pasta para persistir entre sessões.
+
+    Retorno:
+        None
+    """
+    global _cache_padrao
+    _cache_padrao = cache
+
+
+class _SaidaGravada:
+    """
+    Repassa os resultados para a saída original e guarda uma cópia deles, para que
+    sejam emitidos de novo quando o resultado vier do cache.
+    """
+
+    def __init__(self, saida):
+        self.saida = saida
+        self.resultados: List[Any] = []
+
+    def emitir(self, resultado):
+        self.resultados.append(resultado)
+        return emitir(resultado, self.saida)
+
+
+def memoizar(func: Callable) -> Callable:
+    """
+    Decorador que faz a função aceitar cache=None (sem cache, o padrão), cache=True
+    (cache padrão) ou cache=CacheResultados(...).
+
+    A chave combina o nome da função e todos os argumentos, com DataFrames representados
+    pela sua impressão digital. O argumento saida não entra na chave: os resultados
+    emitidos durante o cálculo são guardados e emitidos de novo, na saida da chamada,
+    quando o retorno vem do cache.
+    """
+    assinatura = inspect.signature(func)
+    tem_saida = 'saida' in assinatura.parameters
+
+    @functools.wraps(func)
+    def envoltorio(*args, **kwargs):
+        argumentos = assinatura.bind(*args, **kwargs)
+        argumentos.apply_defaults()
+
+        cache = argumentos.arguments.get('cache')
+        if cache is None or cache is False:
+            return func(*args, **kwargs)
+
+        if cache is True:
+            cache = _cache_padrao
+
+        saida = argumentos.arguments.get('saida') if tem_saida else None
+
+        partes = [
+            f'{nm}={_chave_valor(vlr)}'
+            for nm, vlr in argumentos.arguments.items()
+            if nm not in ('cache', 'saida')]
+
+        chave = hashlib.blake2b(
+            '\n'.join([func.__module__, func.__qualname__, *partes]).encode(),
+            digest_size=16).hexdigest()
+
+        achou, vlr = cache.obter(chave)
+
+        if achou:
+            retorno, lst_resultados = vlr
+
+            for resultado in lst_resultados:
+                emitir(resultado, saida)
+
+            return retorno
+
+        if tem_saida:
+            saida_gravada = _SaidaGravada(saida)
+            argumentos.arguments['saida'] = saida_gravada
+            lst_resultados = saida_gravada.resultados
+        else:
+            lst_resultados = []
+
+        retorno = func(*argumentos.args, **argumentos.kwargs)
+        cache.guardar(chave, (retorno, lst_resultados))
+
+        return retorno
+
+    return envoltorio
@@ -5,6 +5,9 @@ from pandas.core.frame import DataFrame
 
 from typing import List, Dict
 
+from modulos.utils_pandas.utils_arrow import concatenar_cols_str_arrow, eh_str_arrow
+from modulos.utils_pandas.utils_paralelo import aplicar_por_coluna, montar_df
+
 
 def criar_col_bool(df, nm_col_bool, condicao):
 
@@ -17,6 +20,7 @@ def criar_col_bool(df, nm_col_bool, condicao):
 def criar_col_chv(df: DataFrame, cols: list) -> DataFrame:
     """
     Cria uma nova coluna 'chv' concatenando os valores das colunas especificadas.
+    Se todas as colunas forem string[pyarrow], concatena com um kernel do Arrow e a chave também fica em Arrow.
 
     Parâmetros:
         df (DataFrame): DataFrame onde a coluna será criada.
@@ -28,7 +32,10 @@ def criar_col_chv(df: DataFrame, cols: list) -> DataFrame:
 
     novo_df = df.copy()
 
-    novo_df['chv'] = novo_df[cols].apply(lambda x: ' | '.join(x.astype(str)), axis=1)
+    if all(eh_str_arrow(novo_df[c]) for c in cols):
+        novo_df['chv'] = concatenar_cols_str_arrow(novo_df, cols, ' | ')
+    else:
+        novo_df['chv'] = novo_df[cols].apply(lambda x: ' | '.join(x.astype(str)), axis=1)
     return novo_df
 
 
@@ -104,8 +111,13 @@ def criar_col_qtd_digitos(df: DataFrame, nm_col_num: str, nm_col_criada: str = N
     return novo_df
 
 
+def _formatar_col_num(serie, num_digitos):
+    return serie.map(lambda x: f'{x:.{num_digitos}f}')
+
+
 def criar_cols_num_formatadas(df: pd.DataFrame, lst_cols_num: List[str] = None,
-                              dic_cols_criadas: Dict[str, str] = None, num_digitos: int = 2) -> pd.DataFrame:
+                              dic_cols_criadas: Dict[str, str] = None, num_digitos: int = 2,
+                              paralelo=None) -> pd.DataFrame:
     """
     Formata as colunas numéricas de um DataFrame com um número específico de dígitos decimais.
 
@@ -114,20 +126,27 @@ def criar_cols_num_formatadas(df: pd.DataFrame, lst_cols_num: List[str] = None,
         lst_cols_num (List[str], optional): Lista das colunas numéricas a serem formatadas. Se não especificado, todas as colunas numéricas serão formatadas. Defaults to None.
         dic_cols_criadas (Dict[str, str], optional): Dicionário que mapeia as colunas originais para as colunas formatadas. Defaults to None.
         num_digitos (int, optional): Número de dígitos decimais a serem mantidos. Defaults to 2.
+        paralelo (optional): None (padrão), 'threads', 'processos' ou um Executor; formata as colunas em paralelo (ver utils_paralelo). A formatação é Python puro, então 'processos' é o que acelera.
 
     Returns:
         pd.DataFrame: DataFrame com as colunas numéricas formatadas.
     """
-    novo_df = df.copy()
-
     if lst_cols_num is None:
-        lst_cols_num = novo_df.select_dtypes(include=['float64', 'int64']).columns.tolist()
+        lst_cols_num = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
 
     if dic_cols_criadas is None:
         dic_cols_criadas = {c: c for c in lst_cols_num}
 
+    if paralelo is not None:
+        lst_formatadas = aplicar_por_coluna(
+            _formatar_col_num, paralelo, [df[c] for c in lst_cols_num], num_digitos=num_digitos)
+
+        return montar_df(df, {dic_cols_criadas[c]: serie for c, serie in zip(lst_cols_num, lst_formatadas)})
+
+    novo_df = df.copy()
+
     for col_num in lst_cols_num:
-        novo_df[dic_cols_criadas[col_num]] = novo_df[col_num].map(lambda x: f'{x:.{num_digitos}f}')
+        novo_df[dic_cols_criadas[col_num]] = _formatar_col_num(novo_df[col_num], num_digitos)
 
     return novo_df
 
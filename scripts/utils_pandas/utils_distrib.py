@@ -0,0 +1,344 @@
+import numpy as np
+import pandas as pd
+
+from typing import Dict, Iterable, List, Optional, Sequence
+from pandas.core.frame import DataFrame
+
+
+# Distribuições calculadas em fluxo (pedaço a pedaço), com memória limitada:
+# momentos correntes exatos (contagem, média, desvio, mínimo e máximo) e
+# percentis aproximados por um esboço de quantis do tipo KLL. Enquanto o
+# esboço não precisou compactar nada, os percentis são exatos e iguais aos
+# do describe() do pandas.
+
+
+PERCENTIS_PADRAO = (0.25, 0.5, 0.75)
+
+
+class EsbocoQuantis:
+    """
+    Esboço de quantis KLL: guarda os valores em níveis, em que cada valor do nível h
+    representa 2**h valores originais. Quando um nível passa da sua capacidade, ele é
+    ordenado e metade dos valores (os de posição par ou ímpar, ao acaso) sobe de nível.
+    O espaço fica em O(k log(n/k)) e o erro de posto é da ordem de 1/k.
+
+    Parâmetros:
+        k (int, optional): Capacidade do nível mais alto; controla a precisão. Padrão é 200.
+        semente (int, optional): Semente do gerador aleatório, para resultados reprodutíveis.
+    """
+
+    def __init__(self, k: int = 200, semente: Optional[int] = None):
+        self.k = k
+        self.n = 0
+        self._niveis = [np.empty(0)]
+        self._rng = np.random.default_rng(semente)
+
+    def _capacidade(self, h: int) -> int:
+        qtd_niveis = len(self._niveis)
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (qtd_niveis - 1 - h))))
+
+    def _compactar(self) -> None:
+        h = 0
+        while h < len(self._niveis):
+            nivel = self._niveis[h]
+
+            if len(nivel) > self._capacidade(h):
+                if h + 1 == len(self._niveis):
+                    self._niveis.append(np.empty(0))
+
+                nivel = np.sort(nivel)
+
+                # Com quantidade ímpar, um valor fica no nível atual
+                resto, nivel = nivel[:len(nivel) % 2], nivel[len(nivel) % 2:]
+                inicio = self._rng.integers(2)
+
+                self._niveis[h + 1] = np.concatenate([self._niveis[h + 1], nivel[inicio::2]])
+                self._niveis[h] = resto
+
+            h += 1
+
+    def atualizar(self, valores) -> 'EsbocoQuantis':
+        """
+        Acrescenta valores ao esboço. Valores ausentes são ignorados.
+
+        Parâmetros:
+            valores: Array ou série numérica.
+
+        Retorno:
+            EsbocoQuantis: O próprio esboço.
+        """
+        valores = np.asarray(valores, dtype=float)
+        valores = valores[~np.isnan(valores)]
+
+        self.n += len(valores)
+        self._niveis[0] = np.concatenate([self._niveis[0], valores])
+        self._compactar()
+
+        return self
+
+    def mesclar(self, outro: 'EsbocoQuantis') -> 'EsbocoQuantis':
+        """
+        Incorpora outro esboço (por exemplo, calculado sobre outro arquivo) a este.
+
+        Parâmetros:
+            outro (EsbocoQuantis): O esboço incorporado.
+
+        Retorno:
+            EsbocoQuantis: O próprio esboço.
+        """
+        while len(self._niveis) < len(outro._niveis):
+            self._niveis.append(np.empty(0))
+
+        for h, nivel in enumerate(outro._niveis):
+            self._niveis[h] = np.concatenate([self._niveis[h], nivel])
+
+        self.n += outro.n
+        self._compactar()
+
+        return self
+
+    @property
+    def exato(self) -> bool:
+        """
+        True enquanto nenhum valor foi compactado, isto é, os quantis ainda são exatos.
+        """
+        return all(len(nivel) == 0 for nivel in self._niveis[1:])
+
+    def quantis(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Retorna os quantis pedidos, com interpolação linear como no pandas.
+
+        Parâmetros:
+            qs (Sequence[float]): Quantis entre 0 e 1.
+
+        Retorno:
+            np.ndarray: Os valores dos quantis (NaN se o esboço estiver vazio).
+        """
+        qs = np.asarray(qs, dtype=float)
+
+        if self.n == 0:
+            return np.full(qs.shape, np.nan)
+
+        if self.exato:
+            return np.quantile(self._niveis[0], qs)
+
+        valores = np.concatenate(self._niveis)
+        pesos = np.concatenate([np.full(len(nivel), 2.0 ** h) for h, nivel in enumerate(self._niveis)])
+
+        ordem = np.argsort(valores, kind='stable')
+        valores, pesos = valores[ordem], pesos[ordem]
+
+        # Cada valor ocupa o centro do intervalo de postos que representa
+        postos = np.cumsum(pesos) - pesos / 2
+        return np.interp(qs * pesos.sum(), postos, valores)
+
+
+class MomentosCorrentes:
+    """
+    Contagem, média, soma dos quadrados dos desvios, mínimo e máximo, atualizados
+    pedaço a pedaço e mesclados com a fórmula de Chan et al.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo = np.nan
+        self.maximo = np.nan
+
+    def _combinar(self, n, media, m2, minimo, maximo) -> None:
+        if n == 0:
+            return
+
+        n_total = self.n + n
+        delta = media - self.media
+
+        self.m2 += m2 + delta ** 2 * self.n * n / n_total
+        self.media += delta * n / n_total
+        self.n = n_total
+        self.minimo = np.fmin(self.minimo, minimo)
+        self.maximo = np.fmax(self.maximo, maximo)
+
+    def atualizar(self, valores) -> 'MomentosCorrentes':
+        valores = np.asarray(valores, dtype=float)
+        valores = valores[~np.isnan(valores)]
+
+        if len(valores):
+            media = valores.mean()
+            self._combinar(len(valores), media, ((valores - media) ** 2).sum(), valores.min(), valores.max())
+
+        return self
+
+    def mesclar(self, outro: 'MomentosCorrentes') -> 'MomentosCorrentes':
+        self._combinar(outro.n, outro.media, outro.m2, outro.minimo, outro.maximo)
+        return self
+
+    @property
+    def desvio(self) -> float:
+        return np.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else np.nan
+
+
+class DistribStreaming:
+    """
+    Acumula, pedaço a pedaço, a distribuição de colunas numéricas e de data, com memória limitada.
+    Datas são guardadas como a quantidade de dias desde 1970-01-01, sem conversão para objetos date.
+    Os esboços guardam float64, que representa esses dias sem perda (em nanossegundos, as datas
+    passariam de 2**53 e seriam arredondadas).
+
+    Parâmetros:
+        cols_num (List[str], optional): Colunas numéricas. Se não especificado, usa as colunas numéricas do primeiro pedaço.
+        cols_data (List[str], optional): Colunas de data. Defaults to None.
+        k (int, optional): Precisão dos esboços de quantis (ver EsbocoQuantis). Padrão é 200.
+        semente (int, optional): Semente dos esboços, para resultados reprodutíveis.
+    """
+
+    def __init__(self, cols_num: Optional[List[str]] = None, cols_data: Optional[List[str]] = None,
+                 k: int = 200, semente: Optional[int] = None):
+        self.cols_num = None if cols_num is None else list(cols_num)
+        self.cols_data = [] if cols_data is None else list(cols_data)
+        self.k = k
+        self._semente = semente
+        self._esbocos: Dict[str, EsbocoQuantis] = {}
+        self._momentos: Dict[str, MomentosCorrentes] = {}
+
+    def _iniciar_col(self, col: str) -> None:
+        if col not in self._esbocos:
+            self._esbocos[col] = EsbocoQuantis(self.k, self._semente)
+            self._momentos[col] = MomentosCorrentes()
+
+    def atualizar(self, df: DataFrame) -> 'DistribStreaming':
+        """
+        Acrescenta um pedaço de dados (por exemplo, de pd.read_csv(..., chunksize=...)).
+
+        Parâmetros:
+            df (DataFrame): O pedaço.
+
+        Retorno:
+            DistribStreaming: O próprio acumulador.
+        """
+        if self.cols_num is None:
+            self.cols_num = [
+                c for c in df.select_dtypes(include='number').columns
+                if c not in self.cols_data]
+
+        for col in self.cols_num:
+            self._iniciar_col(col)
+            valores = df[col].to_numpy(dtype=float, na_value=np.nan)
+            self._esbocos[col].atualizar(valores)
+            self._momentos[col].atualizar(valores)
+
+        for col in self.cols_data:
+            self._iniciar_col(col)
+            datas = pd.to_datetime(df[col]).dt.normalize().dropna()
+            dias = datas.to_numpy(dtype='datetime64[D]').astype('int64')
+            self._esbocos[col].atualizar(dias)
+            self._momentos[col].atualizar(dias)
+
+        return self
+
+    def mesclar(self, outro: 'DistribStreaming') -> 'DistribStreaming':
+        """
+        Incorpora outro acumulador (por exemplo, de outro arquivo ou processo) a este.
+
+        Parâmetros:
+            outro (DistribStreaming): O acumulador incorporado.
+
+        Retorno:
+            DistribStreaming: O próprio acumulador.
+        """
+        if self.cols_num is None:
+            self.cols_num = outro.cols_num
+
+        for col in outro._esbocos:
+            self._iniciar_col(col)
+            self._esbocos[col].mesclar(outro._esbocos[col])
+            self._momentos[col].mesclar(outro._momentos[col])
+
+        return self
+
+    def tb_distrib(self, percentis: Sequence[float] = PERCENTIS_PADRAO) -> DataFrame:
+        """
+        Retorna a tabela de estatísticas descritivas, no mesmo formato de tb_distrib.
+
+        Parâmetros:
+            percentis (Sequence[float], optional): Percentis calculados. Padrão é (0.25, 0.5, 0.75).
+
+        Retorno:
+            DataFrame: Estatísticas por coluna numérica.
+        """
+        lst_linhas = ['count', 'mean', 'std', 'min', *[f'{p * 100:g}%' for p in percentis], 'max']
+        dic_cols = {}
+
+        for col in self.cols_num or []:
+            momentos = self._momentos[col]
+            dic_cols[col] = [
+                float(momentos.n), momentos.media if momentos.n else np.nan, momentos.desvio,
+                momentos.minimo, *self._esbocos[col].quantis(percentis), momentos.maximo]
+
+        return pd.DataFrame(dic_cols, index=lst_linhas).reset_index()
+
+    def tb_distrib_data(self, col_dat: str) -> DataFrame:
+        """
+        Retorna os percentis de uma coluna de data, no mesmo formato de tb_distrib_data.
+
+        Parâmetros:
+            col_dat (str): Nome da coluna de data (informada em cols_data).
+
+        Retorno:
+            DataFrame: DataFrame contendo os percentis da coluna de data.
+        """
+        qs = [0, 0.25, 0.5, 0.75, 1]
+        dias = self._esbocos[col_dat].quantis(qs)
+
+        # Extremos exatos, mesmo depois de o esboço compactar
+        momentos = self._momentos[col_dat]
+        dias[0], dias[-1] = momentos.minimo, momentos.maximo
+
+        # A data é a parte inteira dos dias; o arredondamento evita que 18999.9999999 vire o dia anterior
+        quartis = pd.to_datetime(np.floor(np.round(dias, 9)), unit='D')
+
+        return pd.DataFrame({'percentil': qs, col_dat: quartis.date})
+
+
+def tb_distrib_streaming(pedacos: Iterable[DataFrame], cols_num: Optional[List[str]] = None,
+                         k: int = 200, semente: Optional[int] = None) -> DataFrame:
+    """
+    Versão de tb_distrib para dados lidos em pedaços, com memória limitada.
+
+    Parâmetros:
+        pedacos (Iterable[DataFrame]): Pedaços dos dados, por exemplo pd.read_csv(..., chunksize=...).
+        cols_num (List[str], optional): Colunas numéricas. Se não especificado, usa as do primeiro pedaço.
+        k (int, optional): Precisão dos esboços de quantis. Padrão é 200.
+        semente (int, optional): Semente dos esboços.
+
+    Retorno:
+        DataFrame: DataFrame contendo as estatísticas descritivas.
+    """
+    distrib = DistribStreaming(cols_num, k=k, semente=semente)
+
+    for df in pedacos:
+        distrib.atualizar(df)
+
+    return distrib.tb_distrib()
+
+
+def tb_distrib_data_streaming(pedacos: Iterable[DataFrame], col_dat: str,
+                              k: int = 200, semente: Optional[int] = None) -> DataFrame:
+    """
+    Versão de tb_distrib_data para dados lidos em pedaços, com memória limitada.
+
+    Parâmetros:
+        pedacos (Iterable[DataFrame]): Pedaços dos dados.
+        col_dat (str): Nome da coluna de data.
+        k (int, optional): Precisão do esboço de quantis. Padrão é 200.
+        semente (int, optional): Semente do esboço.
+
+    Retorno:
+        DataFrame: DataFrame contendo os percentis da coluna de data.
+    """
+    distrib = DistribStreaming(cols_num=[], cols_data=[col_dat], k=k, semente=semente)
+
+    for df in pedacos:
+        distrib.atualizar(df)
+
+    return distrib.tb_distrib_data(col_dat)
@@ -0,0 +1,119 @@
+import fnmatch
+import importlib.util
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class EsquemaCsv:
+    """
+    Contrato de leitura de um CSV: colunas, tipos, formatos de data e separadores.
+    Passado para o leitor, faz os dados saírem tipados do parser e evita materializar
+    colunas que não são usadas.
+
+    Parâmetros:
+        dtypes (Dict[str, str], optional): Coluna -> dtype do pandas.
+        cols_data (Dict[str, Optional[str]], optional): Coluna de data -> formato (por exemplo '%d/%m/%Y').
+            Com formato None, o pandas infere.
+        decimal (str, optional): Separador decimal. Padrão é '.'.
+        milhar (str, optional): Separador de milhar, por exemplo '.' em '1.234,56'. Padrão é None.
+        sep (str, optional): Separador de campos. Padrão é ','.
+        somente_cols_declaradas (bool, optional): Se True (padrão), lê apenas as colunas declaradas em
+            dtypes e cols_data (usecols).
+        motor (str, optional): Motor do read_csv. Se não especificado, usa 'pyarrow' quando disponível,
+            exceto com separador de milhar, que o motor pyarrow não suporta.
+    """
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    cols_data: Dict[str, Optional[str]] = field(default_factory=dict)
+    decimal: str = '.'
+    milhar: Optional[str] = None
+    sep: str = ','
+    somente_cols_declaradas: bool = True
+    motor: Optional[str] = None
+
+    @property
+    def cols(self) -> List[str]:
+        return list(dict.fromkeys([*self.dtypes, *self.cols_data]))
+
+    def obter_motor(self) -> str:
+        if self.motor is not None:
+            return self.motor
+
+        if self.milhar is None and importlib.util.find_spec('pyarrow') is not None:
+            return 'pyarrow'
+
+        return 'c'
+
+    def kwargs_read_csv(self) -> Dict[str, Any]:
+        """
+        Monta os argumentos de pd.read_csv que aplicam este esquema.
+
+        Retorno:
+            Dict[str, Any]: Argumentos nomeados para pd.read_csv.
+        """
+        kwargs = {
+            'sep': self.sep,
+            'decimal': self.decimal,
+            'engine': self.obter_motor()
+        }
+
+        if self.somente_cols_declaradas and self.cols:
+            kwargs['usecols'] = self.cols
+
+        if self.dtypes:
+            kwargs['dtype'] = self.dtypes
+
+        if self.milhar is not None:
+            kwargs['thousands'] = self.milhar
+
+        if self.cols_data:
+            kwargs['parse_dates'] = list(self.cols_data)
+
+            dic_formatos = {c: fmt for c, fmt in self.cols_data.items() if fmt is not None}
+            if dic_formatos:
+                kwargs['date_format'] = dic_formatos
+
+        return kwargs
+
+
+_esquemas: Dict[str, EsquemaCsv] = {}
+
+
+def registrar_esquema(padrao: str, esquema: EsquemaCsv) -> None:
+    """
+    Registra o esquema usado para os arquivos cujo nome casa com o padrão.
+
+    Parâmetros:
+        padrao (str): Nome do arquivo (valor da coluna 'Tabela') ou padrão fnmatch, por exemplo 'extrato_*.csv'.
+        esquema (EsquemaCsv): O esquema.
+
+    Retorno:
+        None
+    """
+    _esquemas[padrao] = esquema
+
+
+def remover_esquema(padrao: str) -> None:
+    _esquemas.pop(padrao, None)
+
+
+def obter_esquema(nm_arquivo: str) -> Optional[EsquemaCsv]:
+    """
+    Retorna o esquema registrado para um arquivo: o do nome exato ou, senão,
+    o do primeiro padrão registrado que casar com o nome.
+
+    Parâmetros:
+        nm_arquivo (str): Nome do arquivo.
+
+    Retorno:
+        Optional[EsquemaCsv]: O esquema, ou None se nenhum padrão casar.
+    """
+    if nm_arquivo in _esquemas:
+        return _esquemas[nm_arquivo]
+
+    for padrao, esquema in _esquemas.items():
+        if fnmatch.fnmatch(nm_arquivo, padrao):
+            return esquema
+
+    return None
@@ -0,0 +1,202 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from typing import List, Optional, Tuple, Union
+from pandas.core.frame import DataFrame
+
+
+class IndiceChave:
+    """
+    Índice de chave composta construído uma única vez: cada linha recebe um código inteiro
+    (0 a qtd_chaves - 1, na ordem da primeira ocorrência) e as posições das linhas ficam
+    agrupadas por código (formato CSR: ordem e inicio). Buscas, junções e agregações pela
+    mesma chave passam a trabalhar com inteiros, sem recalcular hash de textos a cada vez.
+
+    Valores ausentes formam chave própria, como na coluna 'chv' de criar_col_chv.
+
+    Para conferir depois que um DataFrame é o mesmo que foi indexado (ver validar), o índice
+    guarda um hash dos rótulos e das colunas da chave de todas as linhas.
+
+    Parâmetros:
+        df (DataFrame): DataFrame indexado. O índice não guarda referência a ele.
+        cols (List[str]): Colunas da chave.
+        validacao_amostral (bool, optional): Se True, o hash cobre só uma amostra fixa de até 64 linhas:
+            validar fica mais barato, mas não percebe alterações da chave fora da amostra. Padrão é False.
+    """
+
+    def __init__(self, df: DataFrame, cols: List[str], validacao_amostral: bool = False):
+        self.cols = list(cols)
+        self.n = len(df)
+
+        self.codigos = df.groupby(self.cols, sort=False, dropna=False).ngroup().to_numpy(dtype='int64')
+        self.contagens = np.bincount(self.codigos, minlength=0)
+
+        # Posições das linhas de cada código: ordem[inicio[c]:inicio[c + 1]]
+        self.ordem = np.argsort(self.codigos, kind='stable')
+        self.inicio = np.concatenate([[0], np.cumsum(self.contagens)])
+
+        self.chaves = df[self.cols].iloc[self.ordem[self.inicio[:-1]]].reset_index(drop=True)
+        self._indice = None
+
+        self._amostra = (
+            np.unique(np.linspace(0, self.n - 1, min(self.n, 64)).astype('int64'))
+            if validacao_amostral else slice(None))
+        self._hash_chave = self._hash(df)
+
+    def _hash(self, df: DataFrame) -> str:
+        hashes = pd.util.hash_pandas_object(df[self.cols].iloc[self._amostra], index=True).to_numpy()
+        return hashlib.blake2b(hashes.data, digest_size=16).hexdigest()
+
+    def __repr__(self) -> str:
+        return f'IndiceChave(cols={self.cols!r}, n={self.n}, qtd_chaves={self.qtd_chaves})'
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def qtd_chaves(self) -> int:
+        return len(self.contagens)
+
+    def validar(self, df: DataFrame, cols: Optional[List[str]] = None) -> None:
+        """
+        Verifica se o índice corresponde ao DataFrame e às colunas informadas: mesma quantidade de
+        linhas e mesmos rótulos e valores da chave (em todas as linhas ou, com validacao_amostral,
+        nas linhas da amostra). O hash das colunas da chave custa pouco perto das buscas e
+        junções que o índice poupa.
+        """
+        if cols is not None and list(cols) != self.cols:
+            raise ValueError(f'O índice é das colunas {self.cols}, não de {list(cols)}')
+
+        if len(df) != self.n:
+            raise ValueError(f'O índice tem {self.n} linhas e o DataFrame, {len(df)}')
+
+        if self._hash(df) != self._hash_chave:
+            raise ValueError('O DataFrame não é o indexado: o índice ou a chave mudaram desde a criação do índice')
+
+    def posicoes(self, codigo: int) -> np.ndarray:
+        """
+        Retorna as posições (iloc) das linhas com o código informado.
+        """
+        return self.ordem[self.inicio[codigo]:self.inicio[codigo + 1]]
+
+    def localizar(self, chaves: Union[DataFrame, List[tuple]], cols: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Retorna o código de cada chave informada, ou -1 se ela não existir no índice.
+
+        Parâmetros:
+            chaves (DataFrame ou List[tuple]): Chaves procuradas; em um DataFrame, nas colunas cols.
+            cols (List[str], optional): Colunas das chaves no DataFrame, na ordem das colunas do índice.
+                Se não especificado, usa as colunas do índice.
+
+        Retorno:
+            np.ndarray: Os códigos.
+        """
+        if self._indice is None:
+            self._indice = pd.MultiIndex.from_frame(self.chaves)
+
+        if isinstance(chaves, DataFrame):
+            chaves = chaves[self.cols if cols is None else list(cols)]
+            chaves = pd.MultiIndex.from_frame(chaves.set_axis(self.cols, axis=1))
+        else:
+            chaves = pd.MultiIndex.from_tuples(chaves, names=self.cols)
+
+        return self._indice.get_indexer(chaves)
+
+    def duplicadas(self) -> np.ndarray:
+        """
+        Retorna a máscara das linhas cuja chave aparece mais de uma vez.
+        """
+        return self.contagens[self.codigos] > 1
+
+    def agregar(self, df: DataFrame, cols_vlr: List[str], func: str = 'sum') -> DataFrame:
+        """
+        Agrega colunas numéricas por chave, como groupby(cols, sort=False, dropna=False).agg(func).
+        Valores ausentes são ignorados.
+
+        Parâmetros:
+            df (DataFrame): O DataFrame indexado.
+            cols_vlr (List[str]): Colunas agregadas.
+            func (str, optional): 'sum', 'count' ou 'mean'. Padrão é 'sum'.
+
+        Retorno:
+            DataFrame: Uma linha por chave, na ordem dos códigos, com as colunas da chave e as agregadas.
+        """
+        if func not in ('sum', 'count', 'mean'):
+            raise ValueError(f"func deve ser 'sum', 'count' ou 'mean', não {func!r}")
+
+        self.validar(df)
+        novo_df = self.chaves.copy()
+
+        for nm_col in cols_vlr:
+            valores = df[nm_col].to_numpy(dtype=float, na_value=np.nan)
+            validos = ~np.isnan(valores)
+
+            qtd = np.bincount(self.codigos, weights=validos, minlength=self.qtd_chaves)
+            soma = np.bincount(self.codigos, weights=np.where(validos, valores, 0), minlength=self.qtd_chaves)
+
+            if func == 'sum':
+                novo_df[nm_col] = soma
+            elif func == 'count':
+                novo_df[nm_col] = qtd.astype('int64')
+            else:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    novo_df[nm_col] = soma / qtd
+
+        return novo_df
+
+    def mesclar(self, df: DataFrame, direita: DataFrame, cols_direita: Optional[List[str]] = None,
+                how: str = 'left', sufixos: Tuple[str, str] = ('_x', '_y')) -> DataFrame:
+        """
+        Junta ao DataFrame indexado as linhas de outro DataFrame com a mesma chave, como
+        pd.merge(df, direita, how=how), na mesma ordem de linhas. Só a tabela da direita passa
+        por hash; as linhas de df são expandidas a partir dos códigos do índice.
+
+        Parâmetros:
+            df (DataFrame): O DataFrame indexado.
+            direita (DataFrame): O DataFrame juntado, por exemplo um mapa de categorias.
+            cols_direita (List[str], optional): Colunas da chave em direita, na ordem das colunas do índice.
+                Se não especificado, usa as colunas do índice.
+            how (str, optional): 'left' ou 'inner'. Padrão é 'left'.
+            sufixos (Tuple[str, str], optional): Sufixos das colunas não chave presentes nos dois lados,
+                como em pd.merge. Padrão é ('_x', '_y').
+
+        Retorno:
+            DataFrame: O resultado da junção, com as colunas de df seguidas das colunas não chave de direita.
+        """
+        if how not in ('left', 'inner'):
+            raise ValueError(f"how deve ser 'left' ou 'inner', não {how!r}")
+
+        self.validar(df)
+
+        if cols_direita is None:
+            cols_direita = self.cols
+
+        # Linhas da direita agrupadas por código do índice (as sem correspondência ficam de fora)
+        codigos_dir = self.localizar(direita, cols_direita)
+        pos_dir = np.flatnonzero(codigos_dir >= 0)
+        pos_dir = pos_dir[np.argsort(codigos_dir[pos_dir], kind='stable')]
+        contagens_dir = np.bincount(codigos_dir[codigos_dir >= 0], minlength=self.qtd_chaves)
+        inicio_dir = np.concatenate([[0], np.cumsum(contagens_dir)])
+
+        qtd_pares = contagens_dir[self.codigos]
+        repeticoes = np.maximum(qtd_pares, 1) if how == 'left' else qtd_pares
+
+        pos_esq = np.repeat(np.arange(self.n), repeticoes)
+        deslocamento = np.arange(len(pos_esq)) - np.repeat(np.cumsum(repeticoes) - repeticoes, repeticoes)
+
+        codigos_rep = self.codigos[pos_esq]
+        tem_par = qtd_pares[pos_esq] > 0
+        pos_dir_rep = np.full(len(pos_esq), -1)
+        pos_dir_rep[tem_par] = pos_dir[inicio_dir[codigos_rep[tem_par]] + deslocamento[tem_par]]
+
+        cols_vlr_dir = [c for c in direita.columns if c not in cols_direita]
+        sobrepostas = set(df.columns) & set(cols_vlr_dir)
+
+        return pd.concat([
+            df.iloc[pos_esq].reset_index(drop=True)
+            .rename(columns={c: f'{c}{sufixos[0]}' for c in sobrepostas}),
+            direita[cols_vlr_dir].reset_index(drop=True).reindex(pos_dir_rep).reset_index(drop=True)
+            .rename(columns={c: f'{c}{sufixos[1]}' for c in sobrepostas})],
+            axis=1)
@@ -0,0 +1,112 @@
+import asyncio
+import os
+
+from typing import AsyncIterator, List
+from pandas.core.frame import DataFrame
+
+from modulos.utils_pandas.utils_acesso import _ler_csv
+
+
+# Ingestão assíncrona: a leitura dos bytes (rede ou disco) de vários arquivos
+# acontece ao mesmo tempo, e a interpretação do CSV roda em um executor
+# enquanto os próximos arquivos ainda estão sendo lidos.
+
+
+class _OrcamentoBytes:
+    """
+    Limita a quantidade de bytes lidos e ainda não consumidos. Um arquivo maior que o
+    orçamento inteiro é aceito quando não há nada mais em voo, para não travar.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.em_voo = 0
+        self._condicao = asyncio.Condition()
+
+    async def reservar(self, qtd: int) -> None:
+        async with self._condicao:
+            await self._condicao.wait_for(lambda: self.em_voo == 0 or self.em_voo + qtd <= self.max_bytes)
+            self.em_voo += qtd
+
+    async def liberar(self, qtd: int) -> None:
+        async with self._condicao:
+            self.em_voo -= qtd
+            self._condicao.notify_all()
+
+
+def _ler_bytes(caminho_arquivo: str) -> bytes:
+    with open(caminho_arquivo, 'rb') as arquivo:
+        return arquivo.read()
+
+
+async def _listar_csv(lst_pastas: List[str]) -> List[tuple]:
+    lst_nomes = await asyncio.gather(*[asyncio.to_thread(os.listdir, pasta) for pasta in lst_pastas])
+
+    lst_arquivos = [
+        os.path.join(pasta, nm_arquivo)
+        for pasta, nomes in zip(lst_pastas, lst_nomes)
+        for nm_arquivo in nomes
+        if nm_arquivo.endswith('.csv')]
+
+    lst_tamanhos = await asyncio.gather(*[asyncio.to_thread(os.path.getsize, a) for a in lst_arquivos])
+
+    return list(zip(lst_arquivos, lst_tamanhos))
+
+
+async def le_pastas_csv_async(lst_pastas: List[str], str_arrow: bool = False, esquema=None,
+                              max_concorrencia: int = 8, max_bytes_em_voo: int = 512 * 2**20,
+                              executor=None) -> AsyncIterator[DataFrame]:
+    """
+    Versão assíncrona de le_pastas_csv: lê os arquivos .csv das pastas de forma concorrente e
+    devolve cada DataFrame (com a coluna 'Tabela') assim que ele fica pronto, na ordem de conclusão.
+
+    Uso:
+        lst_dfs = [df async for df in le_pastas_csv_async(lst_pastas)]
+        df = pd.concat(lst_dfs)
+
+    Parâmetros:
+        lst_pastas (List[str]): Lista de pastas.
+        str_arrow (bool, optional): Se True, o texto já sai do parser como string[pyarrow] (ver le_csv).
+        esquema (EsquemaCsv, optional): Esquema de leitura, como em le_csv.
+        max_concorrencia (int, optional): Quantidade máxima de arquivos sendo lidos ao mesmo tempo. Padrão é 8.
+        max_bytes_em_voo (int, optional): Quantidade máxima de bytes de arquivos lidos e ainda não consumidos
+            (em leitura, em interpretação ou aguardando o consumidor). Padrão é 512 MiB.
+        executor (optional): Executor da interpretação dos CSVs, por exemplo um ProcessPoolExecutor.
+            Se não especificado, usa o executor padrão do loop (threads).
+
+    Retorno:
+        AsyncIterator[DataFrame]: Os DataFrames de cada arquivo.
+    """
+    loop = asyncio.get_running_loop()
+    semaforo = asyncio.Semaphore(max_concorrencia)
+    orcamento = _OrcamentoBytes(max_bytes_em_voo)
+
+    async def processar(caminho_arquivo, tam):
+        await orcamento.reservar(tam)
+
+        try:
+            async with semaforo:
+                conteudo = await asyncio.to_thread(_ler_bytes, caminho_arquivo)
+
+            df = await loop.run_in_executor(
+                executor, _ler_csv, conteudo, os.path.basename(caminho_arquivo), str_arrow, esquema)
+        except BaseException:
+            await orcamento.liberar(tam)
+            raise
+
+        return df, tam
+
+    tarefas = [asyncio.ensure_future(processar(*arquivo)) for arquivo in await _listar_csv(lst_pastas)]
+
+    try:
+        for proxima in asyncio.as_completed(tarefas):
+            df, tam = await proxima
+
+            # Os bytes só saem do orçamento depois que o consumidor pede o próximo arquivo
+            try:
+                yield df
+            finally:
+                await orcamento.liberar(tam)
+    finally:
+        for tarefa in tarefas:
+            tarefa.cancel()
@@ -1,7 +1,7 @@
 from unidecode import unidecode
 import re
 
-from typing import Union
+from typing import List, Union
 
 
 def formatar_num(num: Union[int, float], num_digitos: int) -> str:
@@ -45,3 +45,39 @@ def padronizar_string(s: str) -> str:
     # # Remove caracteres especiais exceto espaço, nova linha e ponto
     # s = re.sub('[^a-zA-Z0-9 \n\.]', '', s)
     return s
+
+
+def escapar_literal(texto: str) -> str:
+    """
+    Escapa os metacaracteres de expressão regular de um texto literal.
+    Diferente de re.escape, escapa apenas os metacaracteres, de modo que o
+    padrão resultante também é aceito pelo RE2 (usado pelo Arrow).
+
+    Parâmetros:
+        texto (str): O texto literal.
+
+    Retorno:
+        str: O texto com os metacaracteres escapados.
+    """
+    return re.sub(r'([\\.^$|?*+()\[\]{}])', r'\\\1', texto)
+
+
+def montar_padrao_alternancia(lst_textos: List[str], regex: bool = False) -> str:
+    """
+    Monta uma única expressão regular que casa com qualquer um dos textos,
+    para remover ou substituir todos eles em uma só passada.
+
+    Parâmetros:
+        lst_textos (List[str]): Os textos (ou padrões, se regex=True).
+        regex (bool): Se False, os textos são tratados como literais e escapados;
+            os mais longos vêm primeiro para que prevaleçam sobre seus prefixos.
+
+    Retorno:
+        str: O padrão de alternância.
+    """
+    lst_textos = [t for t in lst_textos if t != '']
+
+    if regex:
+        return '|'.join(f'(?:{t})' for t in lst_textos)
+
+    return '|'.join(escapar_literal(t) for t in sorted(set(lst_textos), key=len, reverse=True))
@@ -0,0 +1,75 @@
+import functools
+
+import pandas as pd
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List
+from pandas.core.frame import DataFrame
+
+
+# Execução de transformações coluna a coluna em paralelo. As colunas são
+# independentes entre si, então cada uma vira uma tarefa:
+#   - 'threads' serve para kernels que liberam o GIL (NumPy, Arrow, to_datetime);
+#   - 'processos' serve para caminhos em Python puro (padronizar_string, map),
+#     ao custo de serializar cada coluna para o processo filho.
+# As funções passadas precisam estar no nível do módulo para irem a outro processo.
+
+
+PARALELOS = ('threads', 'processos')
+
+
+def aplicar_por_coluna(func: Callable, paralelo, *iteraveis: Iterable, **kwargs) -> List[pd.Series]:
+    """
+    Aplica func a cada coluna, como map(func, *iteraveis): o primeiro iterável traz as séries e
+    os demais, se houver, argumentos próprios de cada coluna.
+
+    Parâmetros:
+        func (Callable): Função aplicada a cada série.
+        paralelo: None (sequencial), 'threads', 'processos' ou um concurrent.futures.Executor
+            já criado (que não é encerrado aqui).
+        *iteraveis (Iterable): As séries e os argumentos por coluna.
+        **kwargs: Argumentos nomeados repassados para func em todas as colunas.
+
+    Retorno:
+        List[pd.Series]: Os resultados, na ordem das séries.
+    """
+    func = functools.partial(func, **kwargs)
+    iteraveis = [list(it) for it in iteraveis]
+
+    if paralelo is not None and not isinstance(paralelo, Executor) and paralelo not in PARALELOS:
+        raise ValueError(f'paralelo deve ser None, um Executor ou um de {PARALELOS}, não {paralelo!r}')
+
+    if paralelo is None or len(iteraveis[0]) <= 1:
+        return list(map(func, *iteraveis))
+
+    if isinstance(paralelo, Executor):
+        return list(paralelo.map(func, *iteraveis))
+
+    executor = ThreadPoolExecutor if paralelo == 'threads' else ProcessPoolExecutor
+
+    with executor() as ex:
+        return list(ex.map(func, *iteraveis))
+
+
+def montar_df(df: DataFrame, dic_cols: Dict[str, pd.Series]) -> DataFrame:
+    """
+    Monta, de uma só vez, um DataFrame com as colunas de df, substituindo ou acrescentando
+    as colunas de dic_cols (as substituídas mantêm a posição; as novas vão para o fim).
+
+    Parâmetros:
+        df (DataFrame): O DataFrame original, que não é alterado.
+        dic_cols (Dict[str, pd.Series]): Coluna -> valores, alinhados ao índice de df.
+
+    Retorno:
+        DataFrame: O novo DataFrame.
+    """
+    if df.columns.has_duplicates:
+        novo_df = df.copy()
+        for nm_col, serie in dic_cols.items():
+            novo_df[nm_col] = serie
+        return novo_df
+
+    dados = {nm_col: dic_cols.get(nm_col, df[nm_col]) for nm_col in df.columns}
+    dados.update({nm_col: serie for nm_col, serie in dic_cols.items() if nm_col not in dados})
+
+    return pd.DataFrame(dados, index=df.index)
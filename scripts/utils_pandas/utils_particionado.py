@@ -0,0 +1,147 @@
+import uuid
+
+import pandas as pd
+
+from typing import List, Optional
+from pandas.core.frame import DataFrame
+
+from modulos.utils_pandas.utils_arrow import converter_cols_str_arrow
+from modulos.utils_pandas.utils_transformacao_cols import formatar_data_para_ano_mes
+
+
+# Conjuntos de dados em Parquet particionados no formato hive
+# (pasta/ano_mes=202301/Tabela=extrato.csv/parte-....parquet). Cada partição
+# é gravada e lida de forma independente, então processos em máquinas
+# diferentes podem gravar partições disjuntas na mesma pasta, e a leitura
+# com filtros só abre os arquivos das partições pedidas. Os valores das
+# partições são sempre lidos como texto.
+
+
+MODOS = ('substituir', 'acrescentar')
+
+
+def _particionamento(cols_particao: List[str]):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(pa.schema([(c, pa.string()) for c in cols_particao]), flavor='hive')
+
+
+def _abrir(pasta: str):
+    import pyarrow.dataset as ds
+
+    # A primeira varredura só descobre os nomes das partições; os tipos são fixados como texto
+    cols_particao = ds.dataset(pasta, format='parquet', partitioning='hive').partitioning.schema.names
+
+    return ds.dataset(pasta, format='parquet', partitioning=_particionamento(cols_particao)), cols_particao
+
+
+def grava_particionado(df: DataFrame, pasta: str, col_data: Optional[str] = None,
+                       cols_particao: Optional[List[str]] = None, nm_col_periodo: str = 'ano_mes',
+                       modo: str = 'substituir') -> List[str]:
+    """
+    Grava um DataFrame como conjunto de dados Parquet particionado por período e por tabela de origem.
+
+    Parâmetros:
+        df (DataFrame): O DataFrame, por exemplo o retorno de le_pastas_csv.
+        pasta (str): Pasta raiz do conjunto de dados.
+        col_data (str, optional): Coluna de data; dela sai a coluna de período (aaaamm, via formatar_data_para_ano_mes).
+        cols_particao (List[str], optional): Colunas de partição. Se não especificado, usa a coluna de período
+            (se col_data for informada) e 'Tabela' (se existir).
+        nm_col_periodo (str, optional): Nome da coluna de período criada. Padrão é 'ano_mes'.
+        modo (str, optional): 'substituir' apaga os arquivos das partições presentes em df antes de gravar,
+            sem tocar nas demais; 'acrescentar' só adiciona arquivos. Padrão é 'substituir'.
+
+    Retorno:
+        List[str]: As colunas de partição usadas.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if modo not in MODOS:
+        raise ValueError(f'modo deve ser um de {MODOS}, não {modo!r}')
+
+    novo_df = df
+
+    if col_data is not None:
+        novo_df = formatar_data_para_ano_mes(novo_df, col_data, nm_col_periodo)
+
+    if cols_particao is None:
+        cols_particao = [c for c in [nm_col_periodo, 'Tabela'] if c in novo_df.columns]
+
+    if not cols_particao:
+        raise ValueError('Nenhuma coluna de partição: informe col_data ou cols_particao')
+
+    novo_df = novo_df.copy()
+    for nm_col in cols_particao:
+        novo_df[nm_col] = novo_df[nm_col].astype('string')
+
+    ds.write_dataset(
+        pa.Table.from_pandas(novo_df, preserve_index=False),
+        pasta,
+        format='parquet',
+        partitioning=_particionamento(cols_particao),
+        basename_template=f'parte-{uuid.uuid4().hex}-{{i}}.parquet',
+        existing_data_behavior='delete_matching' if modo == 'substituir' else 'overwrite_or_ignore')
+
+    return cols_particao
+
+
+def le_particionado(pasta: str, filtros=None, cols: Optional[List[str]] = None, str_arrow: bool = False) -> DataFrame:
+    """
+    Lê um conjunto de dados gravado com grava_particionado.
+
+    Os filtros sobre colunas de partição descartam pastas inteiras sem abri-las; os filtros
+    sobre as demais colunas são aplicados na leitura, pulando os grupos de linhas cujas
+    estatísticas (mínimo e máximo) excluem o filtro.
+
+    Parâmetros:
+        pasta (str): Pasta raiz do conjunto de dados.
+        filtros (optional): Lista de tuplas (coluna, operador, valor), combinadas com E, como em pd.read_parquet,
+            por exemplo [('ano_mes', '>=', '202301'), ('Tabela', '==', 'extrato.csv')]; ou uma expressão
+            pyarrow.dataset. Valores das colunas de partição são texto.
+        cols (List[str], optional): Colunas lidas. Se não especificado, lê todas.
+        str_arrow (bool, optional): Se True, converte as colunas de texto para string[pyarrow].
+
+    Retorno:
+        DataFrame: Os dados filtrados.
+    """
+    import pyarrow.parquet as pq
+
+    dataset, _ = _abrir(pasta)
+
+    if isinstance(filtros, list):
+        filtros = pq.filters_to_expression(filtros)
+
+    df = dataset.to_table(columns=cols, filter=filtros).to_pandas()
+
+    if str_arrow:
+        df = converter_cols_str_arrow(df)
+
+    return df
+
+
+def listar_particoes(pasta: str) -> DataFrame:
+    """
+    Lista as partições de um conjunto de dados, por exemplo para distribuí-las entre processos.
+
+    Parâmetros:
+        pasta (str): Pasta raiz do conjunto de dados.
+
+    Retorno:
+        DataFrame: Uma linha por partição, com as colunas de partição e qtd_arquivos.
+    """
+    import pyarrow.dataset as ds
+
+    dataset, cols_particao = _abrir(pasta)
+
+    lst_particoes = [
+        ds.get_partition_keys(fragmento.partition_expression)
+        for fragmento in dataset.get_fragments()]
+
+    return (
+        pd.DataFrame(lst_particoes, columns=cols_particao)
+        .value_counts(dropna=False)
+        .rename('qtd_arquivos')
+        .reset_index()
+        .sort_values(cols_particao, ignore_index=True))
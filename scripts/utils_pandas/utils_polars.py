@@ -0,0 +1,423 @@
+"""
+Backend Polars das funções de criação e transformação de colunas.
+
+As funções têm as mesmas assinaturas das versões pandas (utils_criacao_colunas
+e utils_transformacao_cols) e aceitam tanto pl.DataFrame quanto pl.LazyFrame,
+devolvendo o mesmo tipo recebido. Assim, um pipeline escrito com .pipe(...)
+roda em Polars trocando apenas o módulo de onde as funções são importadas.
+
+Onde a versão pandas recebe uma condição booleana já calculada (criar_col_bool,
+preencher_com_ausente), esta recebe uma expressão Polars (pl.Expr).
+
+Os resultados são os da versão pandas aplicada a df.to_pandas(): inteiros com
+nulos se comportam como float64, textos gerados seguem astype(str) ('nan' para
+ausentes numéricos, 'None' para os demais) e datas ficam em nanossegundos.
+"""
+
+import polars as pl
+
+from typing import Any, Dict, List, Optional, Union
+
+from modulos.utils_pandas.utils_operacoes import montar_padrao_alternancia
+
+
+Frame = Union[pl.DataFrame, pl.LazyFrame]
+
+_TIPOS = {
+    'str': pl.Utf8,
+    'string': pl.Utf8,
+    'object': pl.Utf8,
+    'float': pl.Float64,
+    'float64': pl.Float64,
+    'float32': pl.Float32,
+    'int': pl.Int64,
+    'int64': pl.Int64,
+    'int32': pl.Int32,
+    'bool': pl.Boolean,
+    'category': pl.Categorical
+}
+
+
+def _lista(cols) -> List[str]:
+    return [cols] if isinstance(cols, str) else list(cols)
+
+
+def _schema(df: Frame) -> Dict[str, Any]:
+    return dict(df.collect_schema())
+
+
+def _como_str(nm_col: str, tp) -> pl.Expr:
+    # Mesmo texto de astype(str) do pandas sobre o to_pandas() do frame: ausentes numéricos
+    # viram 'nan' (inteiros com ausentes viram float64, '1.0'), os demais 'None'
+    col = pl.col(nm_col)
+
+    if tp.is_float():
+        return col.fill_nan(None).cast(pl.Utf8).fill_null('nan')
+
+    if tp.is_integer():
+        return (
+            pl.when(col.null_count() > 0)
+            .then(col.cast(pl.Float64).cast(pl.Utf8))
+            .otherwise(col.cast(pl.Utf8))
+            .fill_null('nan'))
+
+    if tp == pl.Boolean:
+        return pl.when(col).then(pl.lit('True')).when(~col).then(pl.lit('False')).otherwise(pl.lit('None'))
+
+    return col.cast(pl.Utf8).fill_null('None')
+
+
+def _para_datetime(nm_col: str, tp) -> pl.Expr:
+    # Nanossegundos, como o datetime64[ns] do pd.to_datetime
+    if tp == pl.Utf8:
+        return pl.col(nm_col).str.to_datetime(time_unit='ns')
+
+    return pl.col(nm_col).cast(pl.Datetime('ns'))
+
+
+# ---------------------------------------------------------------------------
+# utils_criacao_colunas
+# ---------------------------------------------------------------------------
+
+def criar_col_bool(df: Frame, nm_col_bool: str, condicao: pl.Expr) -> Frame:
+
+    return df.with_columns(
+        pl.when(condicao).then(True).otherwise(False).alias(nm_col_bool))
+
+
+def criar_col_chv(df: Frame, cols: list) -> Frame:
+    """
+    Cria uma nova coluna 'chv' concatenando os valores das colunas especificadas.
+
+    Parâmetros:
+        df (Frame): DataFrame ou LazyFrame onde a coluna será criada.
+        cols (list): Lista de nomes das colunas a serem concatenadas.
+
+    Retorno:
+        Frame: Frame com a coluna 'chv' criada.
+    """
+    schema = _schema(df)
+
+    return df.with_columns(
+        pl.concat_str([_como_str(c, schema[c]) for c in cols], separator=' | ').alias('chv'))
+
+
+def criar_col_dif(df: Frame, nm_col1: str, nm_col2: str, nm_col_criada: str = 'dif') -> Frame:
+
+    return (
+        df
+        .with_columns(pl.col(nm_col1, nm_col2).cast(pl.Float64))
+        .with_columns((pl.col(nm_col1) - pl.col(nm_col2)).alias(nm_col_criada)))
+
+
+def criar_col_dif_bool(df: Frame, nm_col1: str, nm_col2: str, nm_col_criada: str = 'dif') -> Frame:
+    """
+    Cria uma nova coluna indicando se as colunas especificadas têm valores diferentes.
+
+    Parâmetros:
+        df (Frame): DataFrame ou LazyFrame de entrada.
+        nm_col1 (str): Nome da primeira coluna.
+        nm_col2 (str): Nome da segunda coluna.
+        nm_col_criada (str, opcional): Nome da coluna criada para indicar a diferença. Padrão é 'dif'.
+
+    Retorna:
+        Frame: Frame com a coluna adicional indicando a diferença entre as colunas especificadas.
+    """
+    schema = _schema(df)
+
+    return (
+        df
+        .with_columns(_como_str(nm_col1, schema[nm_col1]), _como_str(nm_col2, schema[nm_col2]))
+        .with_columns((pl.col(nm_col1) != pl.col(nm_col2)).alias(nm_col_criada)))
+
+
+def criar_col_pct(df: Frame, nm_col_num: str, nm_col_criada: str = None, acc: bool = False) -> Frame:
+    """
+    Cria uma nova coluna com a porcentagem dos valores em relação ao total.
+
+    Parâmetros:
+        df (Frame): DataFrame ou LazyFrame onde a coluna será criada.
+        nm_col_num (str): Nome da coluna contendo os valores numéricos.
+        nm_col_criada (str, optional): Nome da coluna criada. Se não especificado, será 'pct_' + nm_col_num.
+        acc (bool, optional): Se True, calcula a porcentagem em relação ao valor máximo; caso contrário, em relação à soma total.
+
+    Retorno:
+        Frame: Frame com a nova coluna criada.
+    """
+    if nm_col_criada is None:
+        nm_col_criada = 'pct_' + nm_col_num
+
+    total = pl.col(nm_col_num).max() if acc else pl.col(nm_col_num).sum()
+
+    return df.with_columns(
+        (pl.col(nm_col_num) * 100 / total).round(2).alias(nm_col_criada))
+
+
+def criar_col_qtd_digitos(df: Frame, nm_col_num: str, nm_col_criada: str = None) -> Frame:
+    """
+    Cria uma nova coluna contendo a quantidade de caracteres de cada valor da coluna especificada.
+
+    Parâmetros:
+        df (Frame): DataFrame ou LazyFrame onde a coluna será criada.
+        nm_col_num (str): Nome da coluna contendo os valores.
+
+    Retorno:
+        Frame: Frame com a nova coluna criada.
+    """
+    if nm_col_criada is None:
+        nm_col_criada = 'qtd_digitos'
+
+    return df.with_columns(
+        _como_str(nm_col_num, _schema(df)[nm_col_num]).str.len_chars().cast(pl.Int64).alias(nm_col_criada))
+
+
+def criar_cols_num_formatadas(df: Frame, lst_cols_num: List[str] = None,
+                              dic_cols_criadas: Dict[str, str] = None, num_digitos: int = 2) -> Frame:
+    """
+    Formata as colunas numéricas com um número específico de dígitos decimais.
+
+    Args:
+        df (Frame): DataFrame ou LazyFrame a ser formatado.
+        lst_cols_num (List[str], optional): Colunas a formatar. Se não especificado, usa as colunas numéricas.
+        dic_cols_criadas (Dict[str, str], optional): Dicionário coluna original -> coluna formatada.
+        num_digitos (int, optional): Número de dígitos decimais. Defaults to 2.
+
+    Returns:
+        Frame: Frame com as colunas numéricas formatadas.
+    """
+    if lst_cols_num is None:
+        lst_cols_num = [c for c, tp in _schema(df).items() if tp.is_numeric()]
+
+    if dic_cols_criadas is None:
+        dic_cols_criadas = {c: c for c in lst_cols_num}
+
+    # Formatação por valor, como no pandas: arredondar em expressões Polars daria
+    # outro resultado nos empates da representação binária (2.675 -> '2.68').
+    # Ausentes viram NaN antes, para saírem como 'nan', e não nulos
+    def formatar(nm_col):
+        return (
+            pl.col(nm_col)
+            .cast(pl.Float64)
+            .fill_null(float('nan'))
+            .map_elements(lambda x: f'{x:.{num_digitos}f}', return_dtype=pl.Utf8)
+            .alias(dic_cols_criadas[nm_col]))
+
+    return df.with_columns([formatar(c) for c in lst_cols_num])
+
+
+def criar_col_soma_acc(df: Frame, nm_col_num: str, nm_col_criada: str = None) -> Frame:
+    """
+    Cria uma nova coluna contendo a soma acumulada dos valores da coluna especificada.
+
+    Parâmetros:
+        df (Frame): DataFrame ou LazyFrame onde a coluna será criada.
+        nm_col_num (str): Nome da coluna contendo os valores numéricos.
+        nm_col_criada (str, optional): Nome da coluna criada. Se não especificado, será 'sum_' + nm_col_num + '_acc'.
+
+    Retorno:
+        Frame: Frame com a nova coluna criada.
+    """
+    if nm_col_criada is None:
+        nm_col_criada = 'sum_' + nm_col_num + '_acc'
+
+    return df.with_columns(pl.col(nm_col_num).cum_sum().alias(nm_col_criada))
+
+
+def criar_col_verdadeira(df: Frame, nm_col_criada: str) -> Frame:
+
+    return df.with_columns(pl.lit(True).alias(nm_col_criada))
+
+
+def criar_col_soma_cols(df: Frame, lst_cols_somadas: List[str], nm_col_criada: str = None) -> Frame:
+
+    if nm_col_criada is None:
+        nm_col_criada = 'sum'
+
+    return df.with_columns(pl.sum_horizontal(lst_cols_somadas).alias(nm_col_criada))
+
+
+def criar_col_media_cols(df: Frame, lst_cols_media: List[str], nm_col_criada: str = None) -> Frame:
+
+    if nm_col_criada is None:
+        nm_col_criada = 'media'
+
+    return df.with_columns(pl.mean_horizontal(lst_cols_media).alias(nm_col_criada))
+
+
+def criar_col_moda_cols(df: Frame, lst_cols_moda: List[str], nm_col_criada: str = None) -> Frame:
+
+    if nm_col_criada is None:
+        nm_col_criada = 'moda'
+
+    # Como mode(axis=1).loc[:, 0] do pandas: em caso de empate, a menor moda
+    return df.with_columns(
+        pl.concat_list(lst_cols_moda)
+        .list.eval(pl.element().drop_nulls().mode().sort().first())
+        .list.first()
+        .alias(nm_col_criada))
+
+
+# ---------------------------------------------------------------------------
+# utils_transformacao_cols
+# ---------------------------------------------------------------------------
+
+def converter_tipo_cols(df: Frame, dic_dtypes: Dict[Any, Any]) -> Frame:
+    """
+    Converte os tipos de colunas de acordo com o dicionário de tipos fornecido.
+
+    Args:
+        df (Frame): DataFrame ou LazyFrame a ser modificado.
+        dic_dtypes (Dict[Any, Any]): Dicionário onde as chaves são os tipos desejados (nomes de dtypes
+            do pandas, 'datetime' ou tipos Polars) e os valores são as colunas a converter.
+
+    Returns:
+        Frame: Frame com as colunas convertidas para os tipos especificados.
+    """
+    schema = _schema(df)
+    lst_exprs = []
+
+    for tp, lst_cols in dic_dtypes.items():
+        for nm_col in _lista(lst_cols):
+            if tp == 'datetime':
+                lst_exprs.append(_para_datetime(nm_col, schema[nm_col]))
+            elif tp == 'str':
+                lst_exprs.append(_como_str(nm_col, schema[nm_col]))
+            else:
+                lst_exprs.append(pl.col(nm_col).cast(_TIPOS.get(tp, tp)))
+
+    return df.with_columns(lst_exprs)
+
+
+def mapeia_valores(df: Frame, col_mapeada: str, dic_mapeamento: Dict[Any, Any], nm_col_criada: Optional[str] = None) -> Frame:
+    """
+    Mapeia valores de uma coluna de acordo com um dicionário; valores fora do dicionário viram nulos.
+
+    Parâmetros:
+        - df: DataFrame ou LazyFrame Polars.
+        - col_mapeada: Nome da coluna a ser mapeada.
+        - dic_mapeamento: Dicionário de mapeamento de valores.
+
+    Retorno:
+        - Frame com os valores mapeados na coluna especificada.
+    """
+    if nm_col_criada is None:
+        nm_col_criada = col_mapeada
+
+    return df.with_columns(
+        pl.col(col_mapeada).replace_strict(dic_mapeamento, default=None).alias(nm_col_criada))
+
+
+def corrigir_valores_col(df: Frame, nm_col_corrigida: str, dic_correcao: Dict[str, str], nm_col_criada: Optional[str] = None) -> Frame:
+    """
+    Corrige valores de uma coluna; valores fora do dicionário são mantidos (como texto).
+
+    Args:
+        nm_col_corrigida (str): Nome da coluna a ser corrigida.
+        dic_correcao (Dict[str, str]): Dicionário contendo os valores a serem corrigidos.
+        nm_col_criada (Optional[str], optional): Nome da nova coluna. Se não fornecido, substitui a original.
+
+    Returns:
+        Frame: Frame com os valores corrigidos.
+    """
+    if nm_col_criada is None:
+        nm_col_criada = nm_col_corrigida
+
+    return df.with_columns(
+        _como_str(nm_col_corrigida, _schema(df)[nm_col_corrigida]).replace(dic_correcao).alias(nm_col_criada))
+
+
+def preencher_ausentes_cols(df: Frame, lst_cols: List[str], vlr_preenchido: Any) -> Frame:
+
+    schema = _schema(df)
+
+    return df.with_columns([
+        (pl.col(c).fill_nan(None) if schema[c].is_float() else pl.col(c)).fill_null(vlr_preenchido)
+        for c in _lista(lst_cols)])
+
+
+def preencher_com_ausente(df: Frame, nm_col_preenchida: str, condicao: pl.Expr) -> Frame:
+
+    return df.with_columns(
+        pl.when(condicao).then(None).otherwise(pl.col(nm_col_preenchida)).alias(nm_col_preenchida))
+
+
+def _padronizar_expr(nm_col: str) -> pl.Expr:
+    # Mesmos passos de padronizar_string; acentos removidos pela decomposição NFKD
+    return (
+        pl.col(nm_col)
+        .str.normalize('NFKD')
+        .str.replace_all(r'\p{Mn}', '')
+        .str.to_lowercase()
+        .str.replace_all('-', ' ', literal=True)
+        .str.replace_all('.', '', literal=True)
+        .str.strip_chars()
+        .str.replace_all(r'\s+', '_'))
+
+
+def padronizar_str_cols(df: Frame, lst_cols_pad: List[str] = None, dic_cols_pad: Dict[str, str] = None) -> Frame:
+
+    lst_exprs = []
+
+    if lst_cols_pad is not None:
+        lst_exprs += [_padronizar_expr(c) for c in lst_cols_pad]
+
+    if dic_cols_pad is not None:
+        lst_exprs += [_padronizar_expr(c).alias(c_criada) for c, c_criada in dic_cols_pad.items()]
+
+    return df.with_columns(lst_exprs)
+
+
+def remover_texto_col(df: Frame, nm_col: str, texto: str, regex: bool = False) -> Frame:
+    """
+    Remove o texto especificado de todas as strings na coluna especificada.
+
+    Args:
+        df (Frame): DataFrame ou LazyFrame.
+        nm_col (str): O nome da coluna que contém as strings.
+        texto (str): O texto a ser removido das strings.
+        regex (bool, optional): Se True, texto é uma expressão regular; caso contrário, é literal.
+
+    Returns:
+        Frame: Frame com o texto removido da coluna.
+    """
+    return df.with_columns(pl.col(nm_col).str.replace_all(texto, '', literal=not regex))
+
+
+def remover_textos_cols(df: Frame, lst_cols: List[str], lst_textos: List[str], regex: bool = False) -> Frame:
+    """
+    Remove vários textos de uma vez das colunas especificadas, com uma única passada por coluna.
+    Textos literais usam replace_many (Aho-Corasick); com regex=True, uma alternância dos padrões.
+
+    Args:
+        df (Frame): DataFrame ou LazyFrame.
+        lst_cols (list): Os nomes das colunas que contêm as strings.
+        lst_textos (list): Os textos a serem removidos.
+        regex (bool, optional): Se True, os textos são expressões regulares; caso contrário, são literais.
+
+    Returns:
+        Frame: Frame com os textos removidos das colunas.
+    """
+    lst_textos = [t for t in lst_textos if t != '']
+    if not lst_textos:
+        return df
+
+    if regex:
+        padrao = montar_padrao_alternancia(lst_textos, regex=True)
+        return df.with_columns([pl.col(c).str.replace_all(padrao, '') for c in lst_cols])
+
+    # Mais longos primeiro, como no caminho pandas
+    lst_textos = sorted(set(lst_textos), key=len, reverse=True)
+
+    return df.with_columns([
+        pl.col(c).str.replace_many(lst_textos, [''] * len(lst_textos), leftmost=True) for c in lst_cols])
+
+
+def formatar_data_para_ano_mes(df: Frame, nm_col_data: str, nm_col_criada: str = None) -> Frame:
+
+    if nm_col_criada is None:
+        nm_col_criada = nm_col_data
+
+    return df.with_columns(
+        _para_datetime(nm_col_data, _schema(df)[nm_col_data])
+        .dt.strftime('%Y%m')
+        .alias(nm_col_criada))
@@ -0,0 +1,258 @@
+import json
+import logging
+import sys
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pandas.core.frame import DataFrame
+
+
+def display(obj) -> None:
+    """
+    Exibe um objeto com o display do IPython, importado só no momento do uso.
+    Fora de um ambiente com IPython, imprime o objeto como texto.
+
+    Parâmetros:
+        obj: O objeto a ser exibido.
+
+    Retorno:
+        None
+    """
+    try:
+        from IPython.display import display as display_ipython
+    except ImportError:
+        print(obj.to_string() if isinstance(obj, DataFrame) else obj)
+    else:
+        display_ipython(obj)
+
+
+# ---------------------------------------------------------------------------
+# Resultados
+#
+# Cada resultado guarda apenas o que foi calculado. O método linhas() devolve
+# a sequência de textos e DataFrames que a saída deve renderizar, na ordem.
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Resultado(ABC):
+
+    @abstractmethod
+    def linhas(self) -> List[Union[str, DataFrame]]:
+        """
+        Retorna os textos e DataFrames que a saída deve renderizar, na ordem.
+        """
+
+    def como_dict(self) -> Dict[str, Any]:
+        """
+        Converte o resultado em um dicionário serializável em JSON.
+
+        Retorno:
+            Dict[str, Any]: Dicionário com o tipo do resultado e seus campos.
+        """
+        dic = {'tipo': type(self).__name__}
+
+        for campo in fields(self):
+            vlr = getattr(self, campo.name)
+            if isinstance(vlr, DataFrame):
+                vlr = vlr.to_dict(orient='records')
+            dic[campo.name] = vlr
+
+        return dic
+
+
+@dataclass
+class ResultadoIntervalo(Resultado):
+    col: str
+    minimo: Any
+    maximo: Any
+
+    def linhas(self):
+        return [f'A coluna {self.col} vai de {self.minimo} até {self.maximo}']
+
+
+@dataclass
+class ResultadoVisaoGeral(Resultado):
+    formato: Tuple[int, int]
+    amostra: DataFrame
+
+    def linhas(self):
+        return [
+            f'Tamanho da base: {self.formato}',
+            f'\nVisualização dos primeiros registros:',
+            self.amostra]
+
+
+@dataclass
+class ResultadoColsPorLinha(Resultado):
+    amostra: DataFrame
+    n_cols: int
+
+    @property
+    def blocos(self) -> List[DataFrame]:
+        """
+        Fatias da amostra com no máximo n_cols colunas cada, geradas só quando renderizadas.
+        """
+        return [
+            self.amostra.iloc[:, i: i + self.n_cols]
+            for i in range(0, self.amostra.shape[1], self.n_cols)]
+
+    def linhas(self):
+        return self.blocos
+
+
+@dataclass
+class ResultadoGranularidade(Resultado):
+    cols: list
+    qtd_linhas: int
+    qtd_combinacoes: int
+
+    @property
+    def granular(self) -> bool:
+        return self.qtd_linhas == self.qtd_combinacoes
+
+    @property
+    def qtd_duplicatas(self) -> int:
+        return self.qtd_linhas - self.qtd_combinacoes
+
+    @property
+    def pct_duplicatas(self) -> float:
+        return round(self.qtd_duplicatas * 100 / self.qtd_linhas, 2)
+
+    def linhas(self):
+        lst_linhas = [
+            'Qtd de linhas da base:',
+            str(self.qtd_linhas),
+            'Qtd de combinacoes distintas:',
+            str(self.qtd_combinacoes)]
+
+        if self.granular:
+            lst_linhas.append(f'\n{self.cols} é granular')
+        else:
+            lst_linhas.append(f'{self.cols} não é granular')
+            lst_linhas.append('\nHá {} duplicatas ({}% da base)'.format(
+                self.qtd_duplicatas,
+                self.pct_duplicatas))
+
+        return lst_linhas
+
+    def como_dict(self):
+        dic = super().como_dict()
+        dic['granular'] = self.granular
+        dic['qtd_duplicatas'] = self.qtd_duplicatas
+        return dic
+
+
+@dataclass
+class ResultadoAusentes(Resultado):
+    qtd_cols_ausentes: int
+    tabela: DataFrame
+
+    def linhas(self):
+        return [f'Há {self.qtd_cols_ausentes} colunas com valores ausentes.']
+
+
+# ---------------------------------------------------------------------------
+# Saídas
+#
+# Uma saída recebe um Resultado em emitir() e devolve o que a função que o
+# produziu deve retornar ao chamador.
+# ---------------------------------------------------------------------------
+
+class SaidaNotebook:
+    """
+    Imprime os textos e exibe os DataFrames com display(). Comportamento padrão.
+    Retorna None, como as funções mostrar_* sempre fizeram.
+    """
+
+    def emitir(self, resultado: Resultado) -> None:
+        for item in resultado.linhas():
+            if isinstance(item, DataFrame):
+                display(item)
+            else:
+                print(item)
+
+
+class SaidaResultado:
+    """
+    Não renderiza nada: apenas devolve o objeto de resultado ao chamador.
+    """
+
+    def emitir(self, resultado: Resultado) -> Resultado:
+        return resultado
+
+
+class SaidaLogger:
+    """
+    Envia os textos para um logger. DataFrames só são convertidos em texto
+    se o nível DEBUG estiver habilitado.
+
+    Parâmetros:
+        logger (logging.Logger, optional): Logger usado. Se não especificado, usa o logger deste módulo.
+        nivel (int, optional): Nível dos textos. Padrão é logging.INFO.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, nivel: int = logging.INFO):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.nivel = nivel
+
+    def emitir(self, resultado: Resultado) -> Resultado:
+        for item in resultado.linhas():
+            if isinstance(item, DataFrame):
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug('\n%s', item.to_string())
+            else:
+                self.logger.log(self.nivel, item.strip())
+
+        return resultado
+
+
+class SaidaJson:
+    """
+    Escreve cada resultado como uma linha JSON em um arquivo ou stream.
+
+    Parâmetros:
+        destino (optional): Objeto com método write(). Padrão é sys.stdout.
+    """
+
+    def __init__(self, destino=None):
+        self.destino = destino if destino is not None else sys.stdout
+
+    def emitir(self, resultado: Resultado) -> Resultado:
+        self.destino.write(json.dumps(resultado.como_dict(), default=str, ensure_ascii=False) + '\n')
+        return resultado
+
+
+_saida_padrao = SaidaNotebook()
+
+
+def definir_saida_padrao(saida) -> None:
+    """
+    Define a saída usada pelas funções quando o parâmetro saida não é informado.
+
+    Parâmetros:
+        saida: Objeto com método emitir(resultado), por exemplo SaidaLogger() em jobs batch.
+
+    Retorno:
+        None
+    """
+    global _saida_padrao
+    _saida_padrao = saida
+
+
+def emitir(resultado: Resultado, saida=None):
+    """
+    Envia um resultado para a saída informada ou, se None, para a saída padrão.
+
+    Parâmetros:
+        resultado (Resultado): O resultado calculado.
+        saida (optional): Objeto com método emitir(resultado).
+
+    Retorno:
+        O retorno de saida.emitir(resultado).
+    """
+    if saida is None:
+        saida = _saida_padrao
+
+    return saida.emitir(resultado)
@@ -1,28 +1,39 @@
-import math
+import numpy as np
 import pandas as pd
 
+from modulos.utils_pandas.utils_cache import memoizar
 from modulos.utils_pandas.utils_criacao_colunas import criar_col_chv
-
-from IPython.display import display
+from modulos.utils_pandas.utils_indice import IndiceChave
+from modulos.utils_pandas.utils_transformacao_df import selecionar_top_n
+from modulos.utils_pandas.utils_saida import (
+    ResultadoColsPorLinha,
+    ResultadoGranularidade,
+    ResultadoIntervalo,
+    ResultadoVisaoGeral,
+    emitir
+)
 
 from pandas.core.frame import DataFrame
 
+from typing import List, Optional
+
 
-def mostrar_intervalo(df: DataFrame, col: str) -> None:
+def mostrar_intervalo(df: DataFrame, col: str, saida=None):
     """
     Mostra o intervalo de valores em uma coluna do DataFrame.
 
     Parâmetros:
         df (DataFrame): O DataFrame.
         col (str): O nome da coluna.
+        saida (optional): Saída que renderiza o resultado (ver utils_saida). Se não especificada, usa a saída padrão.
 
     Retorno:
-        None
+        O retorno da saída: None na saída padrão (notebook), ResultadoIntervalo nas demais.
     """
-    print(f'A coluna {col} vai de {df[col].min()} até {df[col].max()}')
+    return emitir(ResultadoIntervalo(col, df[col].min(), df[col].max()), saida)
 
 
-def mostrar_n_cols_por_linha(df: pd.DataFrame, n_cols: int = 10, n_linhas_df: int = 5):
+def mostrar_n_cols_por_linha(df: pd.DataFrame, n_cols: int = 10, n_linhas_df: int = 5, saida=None):
     """
     Exibe as primeiras n_linhas_df linhas e agrupa as colunas em grupos de n_cols.
     
@@ -30,59 +41,83 @@ def mostrar_n_cols_por_linha(df: pd.DataFrame, n_cols: int = 10, n_linhas_df: in
         df (pd.DataFrame): O DataFrame a ser exibido.
         n_cols (int): O número de colunas por grupo.
         n_linhas_df (int): O número de linhas a serem exibidas.
+        saida (optional): Saída que renderiza o resultado (ver utils_saida). Se não especificada, usa a saída padrão.
+
+    Retorno:
+        O retorno da saída: None na saída padrão (notebook), ResultadoColsPorLinha nas demais.
     """
-    for i in range(0, math.ceil(len(df.columns) / n_cols)):
-        display(df.iloc[0:n_linhas_df, (i * n_cols): (i * n_cols) + n_cols])
+    return emitir(ResultadoColsPorLinha(df.iloc[0:n_linhas_df], n_cols), saida)
 
 
-def mostrar_top_valores(df: DataFrame, col_num: str, cols_dsc: list = None) -> DataFrame:
+def mostrar_top_valores(df: DataFrame, col_num: str, cols_dsc: list = None, n: Optional[int] = None,
+                        cols_grupo: Optional[List[str]] = None, manter: str = 'first') -> DataFrame:
     """
     Retorna os top valores do DataFrame ordenados por uma coluna numérica e outras colunas descritivas.
 
     Parâmetros:
         df (DataFrame): O DataFrame.
         col_num (str): O nome da coluna numérica.
-        cols_dsc (list): Lista com os nomes das colunas descritivas.
+        cols_dsc (list): Lista com os nomes das colunas descritivas. Se não especificado, usa todas as demais colunas.
+        n (int, optional): Se informado, retorna apenas os n maiores valores sem ordenar o DataFrame inteiro.
+        cols_grupo (List[str], optional): Colunas que definem grupos para o top-n por grupo. Requer n.
+        manter (str, optional): Tratamento de empates do top-n: 'first', 'last' ou 'all'. Padrão é 'first'.
 
     Retorno:
         DataFrame: DataFrame ordenado pelos top valores.
     """
 
     if cols_dsc is None:
-        cols_dsc = [c for c in cols_dsc if c != col_num]
+        cols_dsc = [c for c in df.columns if c != col_num]
 
-    return df[[*cols_dsc, col_num]].sort_values(col_num, ascending=False)
+    cols = [*cols_dsc, *[c for c in (cols_grupo or []) if c not in cols_dsc], col_num]
 
-def mostrar_visao_geral(df: DataFrame) -> None:
+    if n is None:
+        return df[cols].sort_values(col_num, ascending=False)
+
+    return selecionar_top_n(df, col_num, n, cols_grupo, manter)[cols]
+
+def mostrar_visao_geral(df: DataFrame, saida=None):
     """
     Mostra uma visão geral do DataFrame, incluindo seu tamanho e os primeiros registros.
 
     Parâmetros:
         df (DataFrame): O DataFrame.
+        saida (optional): Saída que renderiza o resultado (ver utils_saida). Se não especificada, usa a saída padrão.
 
     Retorno:
-        None
+        O retorno da saída: None na saída padrão (notebook), ResultadoVisaoGeral nas demais.
     """
+    return emitir(ResultadoVisaoGeral(df.shape, df.head(5)), saida)
 
-    print(f'Tamanho da base: {df.shape}')
-    print(f'\nVisualização dos primeiros registros:')
-    display(df.head(5))
-
-def obter_duplicatas(df: DataFrame, cols: list) -> DataFrame:
+@memoizar
+def obter_duplicatas(df: DataFrame, cols: list, cache=None, indice: Optional[IndiceChave] = None) -> DataFrame:
     """
     Retorna as duplicatas no DataFrame, baseado nas colunas fornecidas.
 
     Parâmetros:
         df (DataFrame): O DataFrame.
         cols (list): Lista com os nomes das colunas.
+        cache (optional): True (cache padrão) ou um utils_cache.CacheResultados. Defaults to None (sem cache).
+        indice (IndiceChave, optional): Índice de df pelas colunas cols. Com ele, as contagens saem dos códigos
+            inteiros do índice e a coluna 'chv' só é montada para as linhas duplicadas.
 
     Retorno:
         DataFrame: DataFrame contendo as duplicatas.
     """
-    novo_df = df.copy()
+    if indice is not None:
+        indice.validar(df, cols)
 
-    novo_df = criar_col_chv(novo_df, cols)
-    novo_df[f'qtd_distintos_chv'] = novo_df.groupby('chv')[cols[0]].transform('count')
+        qtd_por_codigo = np.bincount(
+            indice.codigos, weights=df[cols[0]].notna().to_numpy(), minlength=indice.qtd_chaves)
+        qtd_distintos_chv = qtd_por_codigo[indice.codigos].astype('int64')
+
+        novo_df = criar_col_chv(df[qtd_distintos_chv > 1], cols)
+        novo_df['qtd_distintos_chv'] = qtd_distintos_chv[qtd_distintos_chv > 1]
+    else:
+        novo_df = df.copy()
+
+        novo_df = criar_col_chv(novo_df, cols)
+        novo_df[f'qtd_distintos_chv'] = novo_df.groupby('chv')[cols[0]].transform('count')
 
     return (
         novo_df[novo_df[f'qtd_distintos_chv'] > 1]
@@ -90,17 +125,23 @@ def obter_duplicatas(df: DataFrame, cols: list) -> DataFrame:
             [f'qtd_distintos_chv', *[c for c in cols]], 
             ascending=[False, *[True for c in cols]]))
 
-def testa_granularidade(df: DataFrame, cols: list) -> None:
+def testa_granularidade(df: DataFrame, cols: list, saida=None, indice: Optional[IndiceChave] = None):
     """
     Testa a granularidade do DataFrame baseado nas colunas fornecidas.
 
     Parâmetros:
         df (DataFrame): O DataFrame.
         cols (list): Lista com os nomes das colunas.
+        saida (optional): Saída que renderiza o resultado (ver utils_saida). Se não especificada, usa a saída padrão.
+        indice (IndiceChave, optional): Índice de df pelas colunas cols; a quantidade de combinações vem dele.
 
     Retorno:
-        None
+        O retorno da saída: None na saída padrão (notebook), ResultadoGranularidade nas demais.
     """
+    if indice is not None:
+        indice.validar(df, cols)
+        return emitir(ResultadoGranularidade(cols, indice.n, indice.qtd_chaves), saida)
+
     novo_df = df.copy()
 
     novo_df = criar_col_chv(novo_df, cols)
@@ -108,16 +149,4 @@ def testa_granularidade(df: DataFrame, cols: list) -> None:
     tam = novo_df.shape[0]
     qtd_combinacoes = novo_df.chv.nunique()
 
-    print('Qtd de linhas da base:')
-    print(tam)
-    print('Qtd de combinacoes distintas:')
-    print(qtd_combinacoes)
-
-    if tam == qtd_combinacoes:
-        print(f'\n{cols} é granular')
-    else:
-        print(f'{cols} não é granular')
-        print('\nHá {} duplicatas ({}% da base)'.format(
-            tam - qtd_combinacoes,
-            round((tam - qtd_combinacoes)*100/tam,2)
-        ))
+    return emitir(ResultadoGranularidade(cols, tam, qtd_combinacoes), saida)
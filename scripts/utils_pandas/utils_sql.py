@@ -0,0 +1,295 @@
+import os
+import pandas as pd
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Union
+from pandas.core.frame import DataFrame
+
+
+# Motor SQL embutido (DuckDB) usado pelas funções tb_* quando chamadas com
+# motor='duckdb'. As funções deste módulo fazem apenas a parte relacional
+# pesada (varredura e agregação, em paralelo e fora da memória quando preciso)
+# e devolvem tabelas pequenas, que as funções tb_* terminam com o mesmo código
+# pandas do caminho padrão, para que a saída seja idêntica.
+
+
+@dataclass
+class FontePastasCsv:
+    """
+    Fonte equivalente a le_pastas_csv(lst_pastas), lida diretamente pelo motor SQL
+    sem carregar os arquivos em um DataFrame. Inclui a coluna 'Tabela' com o nome do arquivo.
+
+    Como em le_csv, cada arquivo é lido como UTF-8 e, se não for, como latin1. Os tipos
+    seguem a inferência do pandas (ver _inferir_tipos): os mesmos textos viram ausentes,
+    colunas só com inteiros viram BIGINT (DOUBLE se houver ausentes, como o float64 do
+    pandas), só com números viram DOUBLE, só com True/False viram BOOLEAN e as demais,
+    inclusive datas, continuam texto. Diferenças em relação a le_pastas_csv:
+        - a inferência é feita sobre todos os arquivos juntos, e não arquivo a arquivo; uma coluna
+          numérica em um arquivo e texto em outro fica toda como texto (no pandas, ficaria
+          object com números e textos misturados, por exemplo 1 em vez de '001');
+        - esquemas registrados (utils_esquema) não são aplicados.
+
+    Parâmetros:
+        lst_pastas (List[str]): Lista de pastas com arquivos .csv.
+    """
+    lst_pastas: List[str]
+
+    def arquivos(self) -> List[str]:
+        return [
+            os.path.join(pasta, nm_arquivo)
+            for pasta in self.lst_pastas
+            for nm_arquivo in os.listdir(pasta)
+            if nm_arquivo.endswith('.csv')]
+
+
+Fonte = Union[DataFrame, FontePastasCsv]
+
+MOTORES = ('pandas', 'duckdb')
+
+# Textos que o read_csv do pandas lê como ausentes por padrão (na_values)
+_NULOS_PANDAS = (
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null')
+
+# Padrões dos textos que o pandas converte para inteiro, número e booleano
+_RE_INTEIRO = r'\s*[+-]?[0-9]+\s*'
+_RE_NUMERO = r'(?i)\s*[+-]?(([0-9]+\.?[0-9]*|\.[0-9]+)(e[+-]?[0-9]+)?|inf|infinity)\s*'
+_RE_BOOLEANO = r'True|TRUE|true|False|FALSE|false'
+
+_TIPOS_INTEIROS = ('TINYINT', 'SMALLINT', 'INTEGER', 'BIGINT', 'UTINYINT', 'USMALLINT', 'UINTEGER', 'UBIGINT')
+
+
+def validar_motor(motor: str) -> None:
+    if motor not in MOTORES:
+        raise ValueError(f'motor deve ser um de {MOTORES}, não {motor!r}')
+
+
+def _nm(col: str) -> str:
+    return '"' + str(col).replace('"', '""') + '"'
+
+
+def _lista_nms(cols: List[str]) -> str:
+    return ', '.join(_nm(c) for c in cols)
+
+
+def _texto(vlr: str) -> str:
+    return "'" + vlr.replace("'", "''") + "'"
+
+
+def _ler_arquivo(con, caminho: str) -> str:
+    """
+    Retorna a consulta que lê um arquivo com todas as colunas como texto, em UTF-8 ou,
+    se o arquivo não for UTF-8, em latin1, mais a coluna 'Tabela'.
+    """
+    import duckdb
+
+    nulos = ', '.join(_texto(v) for v in _NULOS_PANDAS)
+
+    def consulta(encoding):
+        return f"""
+            SELECT *, {_texto(os.path.basename(caminho))} AS Tabela
+            FROM read_csv({_texto(caminho)}, all_varchar = true, header = true, delim = ',',
+                          quote = '"', escape = '"', nullstr = [{nulos}], encoding = '{encoding}')"""
+
+    # O DuckDB só acusa o texto inválido ao varrer o arquivo, então a escolha exige uma varredura
+    try:
+        con.execute(f'SELECT COUNT(*) FROM ({consulta("utf-8")})').fetchone()
+        return consulta('utf-8')
+    except duckdb.InvalidInputException:
+        return consulta('latin-1')
+
+
+def _inferir_tipos(con, visao: str) -> Dict[str, str]:
+    """
+    Infere, em uma única varredura, o tipo que o pandas daria a cada coluna de texto da visão.
+    """
+    cols = [c for c, *_ in con.execute(f'DESCRIBE {visao}').fetchall() if c != 'Tabela']
+
+    if not cols:
+        return {}
+
+    contagens = ', '.join(
+        f"COUNT({_nm(c)}), "
+        f"COUNT(*) FILTER (regexp_full_match({_nm(c)}, '{_RE_INTEIRO}')), "
+        f"COUNT(*) FILTER (regexp_full_match({_nm(c)}, '{_RE_NUMERO}')), "
+        f"COUNT(*) FILTER (regexp_full_match({_nm(c)}, '{_RE_BOOLEANO}'))"
+        for c in cols)
+
+    qtd_linhas, *qtds = con.execute(f'SELECT COUNT(*), {contagens} FROM {visao}').fetchone()
+
+    tipos = {}
+
+    for i, c in enumerate(cols):
+        qtd_validos, qtd_inteiros, qtd_numeros, qtd_booleanos = qtds[4 * i:4 * i + 4]
+
+        if qtd_validos > 0 and qtd_inteiros == qtd_validos:
+            tipos[c] = 'BIGINT' if qtd_validos == qtd_linhas else 'DOUBLE'
+        elif qtd_numeros == qtd_validos:
+            tipos[c] = 'DOUBLE'
+        elif qtd_booleanos == qtd_validos:
+            tipos[c] = 'BOOLEAN'
+        else:
+            tipos[c] = 'VARCHAR'
+
+    return tipos
+
+
+@contextmanager
+def _conexao(fonte: Fonte):
+    """
+    Abre uma conexão DuckDB em memória e expõe a fonte como a visão 'fonte'.
+    """
+    import duckdb
+
+    con = duckdb.connect()
+
+    if isinstance(fonte, FontePastasCsv):
+        consultas = [f'({_ler_arquivo(con, a)})' for a in fonte.arquivos()]
+        con.execute(f"CREATE VIEW fonte_texto AS {' UNION ALL BY NAME '.join(consultas)}")
+
+        tipos = _inferir_tipos(con, 'fonte_texto')
+        cols = ', '.join(
+            [_nm(c) if tp == 'VARCHAR' else f'CAST({_nm(c)} AS {tp}) AS {_nm(c)}' for c, tp in tipos.items()]
+            + ['Tabela'])
+
+        con.execute(f'CREATE VIEW fonte AS SELECT {cols} FROM fonte_texto')
+    else:
+        con.register('fonte', fonte)
+
+    try:
+        yield con
+    finally:
+        con.close()
+
+
+def _tipos_fonte(con) -> Dict[str, str]:
+    return {nm_col: tp for nm_col, tp, *_ in con.execute('DESCRIBE fonte').fetchall()}
+
+
+def _cols_fonte(con) -> List[str]:
+    return list(_tipos_fonte(con))
+
+
+def _nao_nulos(cols: List[str]) -> str:
+    return ' AND '.join(f'{_nm(c)} IS NOT NULL' for c in cols)
+
+
+def agregar_soma(fonte: Fonte, lst_cols_id: List[str], lst_cols_somadas: List[str]) -> DataFrame:
+    """
+    Soma as colunas agrupando pelas colunas de identificação, como groupby(...).sum().
+
+    Parâmetros:
+        fonte (Fonte): DataFrame ou FontePastasCsv.
+        lst_cols_id (List[str]): Colunas de identificação.
+        lst_cols_somadas (List[str]): Colunas somadas.
+
+    Retorno:
+        DataFrame: Uma linha por combinação de identificação, ordenada pelas colunas de identificação.
+    """
+    with _conexao(fonte) as con:
+        tipos = _tipos_fonte(con)
+
+        # Soma de inteiros continua inteira (o DuckDB usaria HUGEINT); o resto vira DOUBLE
+        somas = ', '.join(
+            f"CAST(SUM({_nm(c)}) AS {'BIGINT' if tipos[c] in _TIPOS_INTEIROS else 'DOUBLE'}) AS {_nm(c)}"
+            for c in lst_cols_somadas)
+
+        return con.execute(f"""
+            SELECT {_lista_nms(lst_cols_id)}, {somas}
+            FROM fonte
+            WHERE {_nao_nulos(lst_cols_id)}
+            GROUP BY ALL
+            ORDER BY {_lista_nms(lst_cols_id)}""").fetchdf()
+
+
+def contar_freq(fonte: Fonte, cols: List[str]) -> DataFrame:
+    """
+    Conta as combinações de valores das colunas, como value_counts().
+
+    Parâmetros:
+        fonte (Fonte): DataFrame ou FontePastasCsv.
+        cols (List[str]): Colunas contadas.
+
+    Retorno:
+        DataFrame: Colunas cols e freq_abs, em ordem das colunas cols.
+    """
+    with _conexao(fonte) as con:
+        return con.execute(f"""
+            SELECT {_lista_nms(cols)}, COUNT(*) AS freq_abs
+            FROM fonte
+            WHERE {_nao_nulos(cols)}
+            GROUP BY ALL
+            ORDER BY {_lista_nms(cols)}""").fetchdf()
+
+
+def contar_freq_periodo(fonte: Fonte, col_dat: str, col_chv: str, periodo: str = 'a') -> DataFrame:
+    """
+    Conta os valores não nulos de col_chv por ano ou mês de col_dat.
+
+    Parâmetros:
+        fonte (Fonte): DataFrame ou FontePastasCsv.
+        col_dat (str): Coluna de data.
+        col_chv (str): Coluna contada.
+        periodo (str, optional): 'a' (ano) ou 'm' (mês). Defaults to 'a'.
+
+    Retorno:
+        DataFrame: Colunas periodo (início do período, timestamp) e qtd_registros, em ordem de periodo.
+    """
+    with _conexao(fonte) as con:
+        unidade = {'a': 'year', 'm': 'month'}[periodo]
+
+        return con.execute(f"""
+            SELECT date_trunc('{unidade}', CAST({_nm(col_dat)} AS TIMESTAMP)) AS periodo,
+                   COUNT({_nm(col_chv)}) AS qtd_registros
+            FROM fonte
+            WHERE {_nm(col_dat)} IS NOT NULL
+            GROUP BY ALL
+            ORDER BY periodo""").fetchdf()
+
+
+def contar_distintos(fonte: Fonte, cols: List[str] = None) -> Tuple[pd.Series, int]:
+    """
+    Conta os valores distintos (não nulos) de cada coluna, como nunique().
+
+    Parâmetros:
+        fonte (Fonte): DataFrame ou FontePastasCsv.
+        cols (List[str], optional): Colunas consideradas. Se não especificado, usa todas.
+
+    Retorno:
+        Tuple[pd.Series, int]: Quantidade de distintos por coluna e quantidade total de linhas.
+    """
+    with _conexao(fonte) as con:
+        if cols is None:
+            cols = _cols_fonte(con)
+
+        cols = list(cols)
+        contagens = ', '.join(f'COUNT(DISTINCT {_nm(c)})' for c in cols)
+
+        *qtds, qtd_linhas = con.execute(f'SELECT {contagens}, COUNT(*) FROM fonte').fetchone()
+
+    return pd.Series(qtds, index=cols, dtype='int64'), qtd_linhas
+
+
+def contar_distintos_por_chave(fonte: Fonte, lst_cols_chv: List[str]) -> DataFrame:
+    """
+    Conta os valores distintos das colunas não chave para cada combinação de chave.
+
+    Parâmetros:
+        fonte (Fonte): DataFrame ou FontePastasCsv.
+        lst_cols_chv (List[str]): Colunas chave.
+
+    Retorno:
+        DataFrame: Colunas chave e uma contagem por coluna não chave, em ordem das chaves.
+    """
+    with _conexao(fonte) as con:
+        contagens = ', '.join(
+            f'COUNT(DISTINCT {_nm(c)}) AS {_nm(c)}'
+            for c in _cols_fonte(con) if c not in lst_cols_chv)
+
+        return con.execute(f"""
+            SELECT {_lista_nms(lst_cols_chv)}, {contagens}
+            FROM fonte
+            WHERE {_nao_nulos(lst_cols_chv)}
+            GROUP BY ALL
+            ORDER BY {_lista_nms(lst_cols_chv)}""").fetchdf()
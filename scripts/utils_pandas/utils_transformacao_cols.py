@@ -1,10 +1,19 @@
+import re
+
 import pandas as pd
 import numpy as np
 
 from typing import Dict, Any, Optional
 from pandas.core.frame import DataFrame
 
-from modulos.utils_pandas.utils_operacoes import padronizar_string
+from modulos.utils_pandas.utils_operacoes import montar_padrao_alternancia, padronizar_string
+from modulos.utils_pandas.utils_arrow import (
+    aceita_substituicao_arrow,
+    eh_str_arrow,
+    padronizar_str_arrow,
+    substituir_valores_arrow
+)
+from modulos.utils_pandas.utils_paralelo import aplicar_por_coluna, montar_df
 
 
 def converter_tipo_cols(df: DataFrame, dic_dtypes: Dict[str, str]) -> DataFrame:
@@ -82,6 +91,8 @@ def preencher_ausentes_cols(df, lst_cols, vlr_preenchido):
 def corrigir_valores_col(df, nm_col_corrigida, dic_correcao, nm_col_criada = None):
     """
     Corrige valores de uma coluna em um DataFrame.
+    Colunas string[pyarrow] são corrigidas com kernels do Arrow e continuam em Arrow, desde que
+    os valores corrigidos sejam texto; com outros valores, seguem o caminho object.
 
     Args:
         nm_col_corrigida (str): Nome da coluna a ser corrigida.
@@ -97,29 +108,61 @@ def corrigir_valores_col(df, nm_col_corrigida, dic_correcao, nm_col_criada = Non
     if nm_col_criada is None:
         nm_col_criada = nm_col_corrigida
 
-    novo_df[nm_col_criada] = novo_df[nm_col_corrigida].astype('str').replace(dic_correcao)
+    if eh_str_arrow(novo_df[nm_col_corrigida]) and aceita_substituicao_arrow(dic_correcao):
+        novo_df[nm_col_criada] = substituir_valores_arrow(novo_df[nm_col_corrigida], dic_correcao)
+    else:
+        novo_df[nm_col_criada] = novo_df[nm_col_corrigida].astype('str').replace(dic_correcao)
 
     return novo_df
 
 
-def converter_tipo_cols(df, dic_dtypes):
+def _converter_col(serie, lst_tps):
+
+    for tp in lst_tps:
+        if tp=='datetime':
+            if not pd.api.types.is_datetime64_any_dtype(serie):
+                serie = pd.to_datetime(serie)
+        else:
+            serie = serie.astype(tp)
+
+    return serie
+
+
+def converter_tipo_cols(df, dic_dtypes, paralelo = None):
     """
     Converte os tipos de colunas em um DataFrame de acordo com o dicionário de tipos fornecido.
 
     Args:
         df (DataFrame): DataFrame a ser modificado.
         dic_dtypes (Dict[str, str]): Dicionário onde as chaves são os tipos de dados desejados e os valores
-            são os nomes das colunas a serem convertidas para esses tipos.
+            são os nomes das colunas a serem convertidas para esses tipos (uma coluna ou uma lista).
+        paralelo (optional): None (padrão), 'threads', 'processos' ou um Executor; converte as colunas
+            em paralelo (ver utils_paralelo).
 
     Returns:
         DataFrame: DataFrame com as colunas convertidas para os tipos especificados.
     """
+    if paralelo is not None:
+        dic_tps_por_col = {}
+        for tp, lst_cols in dic_dtypes.items():
+            for nm_col in [lst_cols] if isinstance(lst_cols, str) else lst_cols:
+                dic_tps_por_col.setdefault(nm_col, []).append(tp)
+
+        lst_convertidas = aplicar_por_coluna(
+            _converter_col, paralelo, [df[nm_col] for nm_col in dic_tps_por_col], dic_tps_por_col.values())
+
+        return montar_df(df, dict(zip(dic_tps_por_col, lst_convertidas)))
+
     novo_df = df.copy()
 
     for tp, lst_cols in dic_dtypes.items():
+        lst_cols = [lst_cols] if isinstance(lst_cols, str) else lst_cols
 
         if tp=='datetime':
-            novo_df[lst_cols] = novo_df[lst_cols].apply(pd.to_datetime)
+            # Colunas que já saíram do leitor como datas (EsquemaCsv) não são reprocessadas
+            for nm_col in lst_cols:
+                if not pd.api.types.is_datetime64_any_dtype(novo_df[nm_col]):
+                    novo_df[nm_col] = pd.to_datetime(novo_df[nm_col])
         else:
             novo_df[lst_cols] = novo_df[lst_cols].astype(tp)
 
@@ -135,35 +178,123 @@ def preencher_com_ausente(df, nm_col_preenchida, condicao):
 
 
 
-def padronizar_str_cols(df, lst_cols_pad = None, dic_cols_pad = None):
+def _padronizar_col(serie):
+
+    if eh_str_arrow(serie):
+        return padronizar_str_arrow(serie)
+
+    return serie.apply(padronizar_string)
+
+
+def padronizar_str_cols(df, lst_cols_pad = None, dic_cols_pad = None, paralelo = None):
+    """
+    Aplica padronizar_string às colunas especificadas.
+    Colunas string[pyarrow] são padronizadas com kernels do Arrow e continuam em Arrow.
+
+    Args:
+        df (pandas.DataFrame): O DataFrame.
+        lst_cols_pad (list, optional): Colunas padronizadas no próprio lugar.
+        dic_cols_pad (dict, optional): Dicionário coluna original -> coluna criada com o valor padronizado.
+        paralelo (optional): None (padrão), 'threads', 'processos' ou um Executor; padroniza as colunas
+            em paralelo (ver utils_paralelo). Colunas object passam por padronizar_string em Python puro,
+            então 'processos' é o que acelera; colunas string[pyarrow] já usam kernels do Arrow.
+
+    Returns:
+        pandas.DataFrame: O DataFrame com as colunas padronizadas.
+    """
+    if paralelo is not None:
+        lst_pares = [(nm_col, nm_col) for nm_col in lst_cols_pad or []] + list((dic_cols_pad or {}).items())
+
+        lst_padronizadas = aplicar_por_coluna(_padronizar_col, paralelo, [df[orig] for orig, _ in lst_pares])
+
+        return montar_df(df, {criada: serie for (_, criada), serie in zip(lst_pares, lst_padronizadas)})
 
     novo_df = df.copy()
 
     if lst_cols_pad is not None:
         for nm_col in lst_cols_pad:
-            novo_df[nm_col] = novo_df[nm_col].apply(padronizar_string)
+            novo_df[nm_col] = _padronizar_col(novo_df[nm_col])
 
     if dic_cols_pad is not None:
         for nm_col in dic_cols_pad.items():
-            novo_df[nm_col[1]] = novo_df[nm_col[0]].apply(padronizar_string)
+            novo_df[nm_col[1]] = _padronizar_col(novo_df[nm_col[0]])
         
     return novo_df
 
 
-def remover_texto_col(df, nm_col, texto):
+def _remover_regex(serie, padrao, padrao_compilado = None):
+    # O Arrow compila o padrão com o RE2, que não tem, por exemplo, lookbehind; nesses casos a
+    # coluna string[pyarrow] passa pelo re do Python, como as colunas object
+    if eh_str_arrow(serie):
+        import pyarrow as pa
+
+        try:
+            return serie.str.replace(padrao, '', regex=True)
+        except pa.ArrowInvalid:
+            pass
+
+    if padrao_compilado is None:
+        padrao_compilado = re.compile(padrao)
+
+    return serie.str.replace(padrao_compilado, '', regex=True)
+
+
+def remover_texto_col(df, nm_col, texto, regex = False):
     """
     Remove o texto especificado de todas as strings na coluna especificada do DataFrame.
+    Em colunas string[pyarrow], o pandas já executa a substituição com kernels do Arrow; expressões
+    que o RE2 do Arrow não aceita (como lookbehind) usam o re do Python, com o mesmo resultado.
     
     Args:
         df (pandas.DataFrame): O DataFrame.
         nm_col (str): O nome da coluna que contém as strings.
         texto (str): O texto a ser removido das strings.
+        regex (bool, optional): Se True, texto é uma expressão regular; caso contrário, é literal. Default é False.
         
     Returns:
         pandas.Series: A coluna contendo as strings sem o texto especificado.
     """
     novo_df = df.copy()
-    novo_df[nm_col] = novo_df[nm_col].str.replace(texto, '')
+
+    if regex:
+        novo_df[nm_col] = _remover_regex(novo_df[nm_col], texto)
+    else:
+        novo_df[nm_col] = novo_df[nm_col].str.replace(texto, '', regex=False)
+
+    return novo_df
+
+
+def remover_textos_cols(df, lst_cols, lst_textos, regex = False):
+    """
+    Remove vários textos de uma vez das colunas especificadas, com uma única passada por coluna.
+    Os textos são combinados em uma expressão de alternância pré-compilada, em vez de uma
+    chamada de remover_texto_col (e uma cópia da coluna) por texto.
+
+    Como a remoção é feita em uma só passada, um texto que só aparece depois da remoção
+    de outro (por exemplo 'ABC' em 'ABXC' removendo 'X') não é removido.
+
+    Args:
+        df (pandas.DataFrame): O DataFrame.
+        lst_cols (list): Os nomes das colunas que contêm as strings.
+        lst_textos (list): Os textos a serem removidos.
+        regex (bool, optional): Se True, os textos são expressões regulares; caso contrário, são literais
+            e, quando um texto é prefixo de outro, prevalece o mais longo. Default é False.
+            Colunas string[pyarrow] usam o RE2 do Arrow e, se ele recusar a expressão, o re do Python.
+
+    Returns:
+        pandas.DataFrame: O DataFrame com os textos removidos das colunas.
+    """
+    novo_df = df.copy()
+
+    padrao = montar_padrao_alternancia(lst_textos, regex)
+    if padrao == '':
+        return novo_df
+
+    padrao_compilado = re.compile(padrao)
+
+    for nm_col in lst_cols:
+        novo_df[nm_col] = _remover_regex(novo_df[nm_col], padrao, padrao_compilado)
+
     return novo_df
 
 
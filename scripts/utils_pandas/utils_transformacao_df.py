@@ -1,12 +1,22 @@
+import numpy as np
 import pandas as pd
 
 from modulos.utils_pandas.utils_criacao_colunas import (
     criar_col_pct,
     criar_col_qtd_digitos,
     criar_col_soma_acc)
-
-
-from typing import List, Optional
+from modulos.utils_pandas.utils_cache import memoizar
+from modulos.utils_pandas.utils_saida import ResultadoAusentes, emitir
+from modulos.utils_pandas.utils_sql import (
+    agregar_soma,
+    contar_distintos,
+    contar_distintos_por_chave,
+    contar_freq,
+    contar_freq_periodo,
+    validar_motor)
+
+
+from typing import List, Optional, Union
 from pandas.core.frame import DataFrame
 
 
@@ -23,7 +33,102 @@ def agrupar_chv_lista(df, lst_col_chv):
     return novo_df
 
 
-def soma_agg(df: DataFrame, lst_cols_id: list, lst_cols_somadas: list) -> DataFrame:
+def selecionar_top_n(df: DataFrame, col_num: Union[str, List[str]], n: int,
+                     cols_grupo: Optional[List[str]] = None, manter: str = 'first') -> DataFrame:
+    """
+    Seleciona as n linhas com os maiores valores de uma coluna numérica, sem ordenar o DataFrame inteiro.
+    Sem grupos, usa nlargest (seleção parcial e ordenação apenas das n linhas); com grupos, agrupa as
+    posições por código de grupo sem ordenar, faz uma seleção parcial (np.partition) em cada grupo com
+    mais de n linhas e ordena apenas as linhas selecionadas.
+
+    Parâmetros:
+        df (DataFrame): DataFrame de entrada.
+        col_num (Union[str, List[str]]): Coluna (ou colunas, sem grupos) usada na ordenação decrescente.
+        n (int): Quantidade de linhas mantidas (por grupo, se cols_grupo for informado).
+        cols_grupo (List[str], optional): Colunas que definem os grupos. Defaults to None.
+        manter (str, optional): Tratamento de empates no limite do top-n: 'first' e 'last' mantêm a primeira
+            ou a última ocorrência; 'all' mantém todos os empatados, podendo retornar mais de n linhas. Defaults to 'first'.
+
+    Retorno:
+        DataFrame: DataFrame com as linhas selecionadas, em ordem decrescente de col_num (dentro de cada grupo).
+    """
+    if manter not in ('first', 'last', 'all'):
+        raise ValueError(f"manter deve ser 'first', 'last' ou 'all', não {manter!r}")
+
+    if n <= 0:
+        return df.iloc[:0]
+
+    if cols_grupo is None:
+        return df.nlargest(n, col_num, keep=manter)
+
+    if not isinstance(col_num, str):
+        raise ValueError('O top-n por grupo aceita apenas uma coluna numérica')
+
+    valores = df[col_num].to_numpy(dtype=float, na_value=np.nan)
+    codigos = df.groupby(cols_grupo, sort=False).ngroup().fillna(-1).to_numpy(dtype='int64')
+
+    # Linhas com grupo ausente ficam de fora, como no groupby; linhas sem valor só completam os grupos
+    # com menos de n valores (ver mais abaixo), como no nlargest
+    validas = ~np.isnan(valores) & (codigos >= 0)
+    pos_validas = np.flatnonzero(validas)
+    codigos_validos = codigos[validas]
+
+    qtd_grupos = codigos.max() + 1 if len(codigos) else 0
+    contagens = np.bincount(codigos_validos, minlength=qtd_grupos)
+    inicio = np.concatenate([[0], np.cumsum(contagens)])
+
+    # Posições agrupadas por código, na ordem original, sem ordenar (contagem + ordem de ocorrência)
+    ocorrencia = pd.Series(codigos_validos).groupby(codigos_validos).cumcount().to_numpy()
+    ordem = np.empty(len(pos_validas), dtype='int64')
+    ordem[inicio[codigos_validos] + ocorrencia] = pos_validas
+
+    selecionadas = np.zeros(len(df), dtype=bool)
+    selecionadas[pos_validas] = contagens[codigos_validos] <= n
+
+    # Só os grupos maiores que n passam pela seleção parcial (np.partition, linear no tamanho do grupo)
+    for codigo in np.flatnonzero(contagens > n):
+        posicoes = ordem[inicio[codigo]:inicio[codigo + 1]]
+        vals = valores[posicoes]
+
+        limite = np.partition(vals, len(vals) - n)[len(vals) - n]
+        maiores = vals > limite
+
+        if manter == 'all':
+            maiores |= vals == limite
+        else:
+            pos_empate = np.flatnonzero(vals == limite)
+            qtd_empate = n - maiores.sum()
+            maiores[pos_empate[:qtd_empate] if manter == 'first' else pos_empate[len(pos_empate) - qtd_empate:]] = True
+
+        selecionadas[posicoes[maiores]] = True
+
+    # Como no nlargest, grupos com menos de n valores são completados com as primeiras linhas sem
+    # valor, na ordem original (com 'all', com todas elas)
+    pos_sem_valor = np.flatnonzero(np.isnan(valores) & (codigos >= 0))
+    codigos_sem_valor = codigos[pos_sem_valor]
+    faltantes = n - contagens[codigos_sem_valor]
+
+    if manter == 'all':
+        selecionadas[pos_sem_valor[faltantes > 0]] = True
+    else:
+        ocorrencia = pd.Series(codigos_sem_valor).groupby(codigos_sem_valor).cumcount().to_numpy()
+        selecionadas[pos_sem_valor[ocorrencia < faltantes]] = True
+
+    # Com 'last', os empates da ordenação final também saem de trás para frente
+    base = df[selecionadas]
+    if manter == 'last':
+        base = base.iloc[::-1]
+
+    return (
+        base
+        .sort_values(
+            [*cols_grupo, col_num],
+            ascending=[*[True for c in cols_grupo], False],
+            kind='stable'))
+
+
+def soma_agg(df: DataFrame, lst_cols_id: list, lst_cols_somadas: list, n: Optional[int] = None,
+             cols_grupo: Optional[List[str]] = None, manter: str = 'first') -> DataFrame:
     """
     Soma as colunas especificadas do DataFrame agrupando por colunas de identificação.
 
@@ -31,27 +136,39 @@ def soma_agg(df: DataFrame, lst_cols_id: list, lst_cols_somadas: list) -> DataFr
         df (DataFrame): DataFrame original.
         lst_cols_id (list): Lista das colunas de identificação.
         lst_cols_somadas (list): Lista das colunas a serem somadas.
+        n (int, optional): Se informado, retorna apenas as n maiores somas (ver selecionar_top_n). Defaults to None.
+        cols_grupo (List[str], optional): Subconjunto de lst_cols_id para o top-n por grupo, por exemplo as
+            n maiores lojas de cada conta. Ordena pela primeira coluna somada. Defaults to None.
+        manter (str, optional): Tratamento de empates do top-n: 'first', 'last' ou 'all'. Defaults to 'first'.
 
     Retorno:
         DataFrame: DataFrame resultante da agregação.
     """
     novo_df = df.copy()
     
-    return (
+    novo_df = (
         novo_df
         .groupby(lst_cols_id)
         .agg({c: 'sum' for c in lst_cols_somadas})
-        .reset_index()
-        .sort_values(lst_cols_somadas, ascending=False))
+        .reset_index())
 
+    if n is None:
+        return novo_df.sort_values(lst_cols_somadas, ascending=False)
 
-def tb_ausentes(df: DataFrame, cols: list = None) -> DataFrame:
+    if cols_grupo is None:
+        return selecionar_top_n(novo_df, lst_cols_somadas, n, manter=manter)
+
+    return selecionar_top_n(novo_df, lst_cols_somadas[0], n, cols_grupo, manter)
+
+
+def tb_ausentes(df: DataFrame, cols: list = None, saida=None) -> DataFrame:
     """
     Retorna uma tabela com a quantidade e percentual de valores ausentes por coluna.
 
     Parâmetros:
         df (DataFrame): DataFrame original.
         cols (list, optional): Lista das colunas a serem consideradas. Se não especificado, usa todas as colunas.
+        saida (optional): Saída que recebe o resumo de colunas com ausentes (ver utils_saida). Se não especificada, usa a saída padrão.
 
     Retorno:
         DataFrame: Tabela de valores ausentes por coluna.
@@ -69,21 +186,26 @@ def tb_ausentes(df: DataFrame, cols: list = None) -> DataFrame:
     tb_ausentes = tb_ausentes.sort_values('pct_ausentes', ascending=False).round(2)
 
     qtd_cols_ausentes = tb_ausentes[tb_ausentes['qtd_ausentes'] > 0].shape[0]
-    print(f'Há {qtd_cols_ausentes} colunas com valores ausentes.')
 
-    return (
+    tb_ausentes = (
         tb_ausentes
         .reset_index()
         .rename(columns={'index': 'col'}))
 
+    emitir(ResultadoAusentes(qtd_cols_ausentes, tb_ausentes), saida)
+    return tb_ausentes
+
 
-def tb_ausentes_distintos(df: DataFrame, cols: list = None) -> DataFrame:
+@memoizar
+def tb_ausentes_distintos(df: DataFrame, cols: list = None, saida=None, cache=None) -> DataFrame:
     """
     Retorna uma tabela com valores ausentes e distintos por coluna.
 
     Parâmetros:
         df (DataFrame): DataFrame original.
         cols (list, optional): Lista das colunas a serem consideradas. Se não especificado, usa todas as colunas.
+        saida (optional): Saída repassada para tb_ausentes.
+        cache (optional): True (cache padrão) ou um utils_cache.CacheResultados para reaproveitar o resultado de chamadas com os mesmos dados e argumentos. Defaults to None (sem cache).
 
     Retorno:
         DataFrame: Tabela de valores ausentes e distintos por coluna.
@@ -96,7 +218,7 @@ def tb_ausentes_distintos(df: DataFrame, cols: list = None) -> DataFrame:
 
     return (
         novo_df
-        .pipe(tb_ausentes, cols)
+        .pipe(tb_ausentes, cols, saida)
         .merge(
             novo_df
             .pipe(tb_distintos, cols),
@@ -104,25 +226,32 @@ def tb_ausentes_distintos(df: DataFrame, cols: list = None) -> DataFrame:
             how='inner'))
 
 
-def tb_distintos(df: DataFrame, cols: list = None) -> DataFrame:
+def tb_distintos(df: DataFrame, cols: list = None, motor: str = 'pandas') -> DataFrame:
     """
     Retorna uma tabela com a quantidade e percentual de valores distintos por coluna.
 
     Parâmetros:
         df (DataFrame): DataFrame original.
         cols (list, optional): Lista das colunas a serem consideradas. Se não especificado, usa todas as colunas.
+        motor (str, optional): 'pandas' ou 'duckdb'. Com 'duckdb', a agregação roda no motor SQL embutido e df também pode ser uma utils_sql.FontePastasCsv. Defaults to 'pandas'.
 
     Retorno:
         DataFrame: Tabela de valores distintos por coluna.
     """
+    validar_motor(motor)
 
-    novo_df = df.copy()
+    if motor == 'duckdb':
+        qtd_distintos, qtd_linhas = contar_distintos(df, cols)
+    else:
+        novo_df = df.copy()
 
-    if cols is None:
-        cols = novo_df.columns
+        if cols is None:
+            cols = novo_df.columns
+
+        qtd_distintos = novo_df[cols].nunique()
+        qtd_linhas = novo_df.shape[0]
 
-    qtd_distintos = novo_df[cols].nunique()
-    pct_distintos = round(novo_df[cols].nunique() / novo_df.shape[0] * 100, 2)
+    pct_distintos = round(qtd_distintos / qtd_linhas * 100, 2)
 
     return pd.DataFrame({
         'col': qtd_distintos.index,
@@ -131,32 +260,28 @@ def tb_distintos(df: DataFrame, cols: list = None) -> DataFrame:
     }).sort_values('pct_distintos', ascending=False)
 
 
-def tb_distrib(df: DataFrame, cols_num: list = None, qtd_zerados: bool = False) -> DataFrame:
+def tb_distrib(df: DataFrame, cols_num: list = None, qtd_zerados: bool = False, tol_abs: float = 1e-6) -> DataFrame:
     """
     Retorna um DataFrame com estatísticas descritivas das colunas numéricas.
 
     Parâmetros:
         df (DataFrame): DataFrame a ser analisado.
         cols_num (list, optional): Lista das colunas numéricas a serem consideradas. Se não especificado, todas as colunas numéricas serão consideradas. Defaults to None.
-        qtd_zerados (bool, optional): Indica se as estatísticas de valores zerados devem ser incluídas. Defaults to False.
+        qtd_zerados (bool, optional): Indica se as quantidades de valores zerados, negativos e positivos (ver tb_zerados) devem ser incluídas. Defaults to False.
+        tol_abs (float, optional): Tolerância absoluta para considerar um valor zerado. Defaults to 1e-6.
 
     Retorno:
         DataFrame: DataFrame contendo as estatísticas descritivas.
     """
-    novo_df = df.copy()
-
     if cols_num is None:
-        cols_num = novo_df.select_dtypes(include='number').columns
+        cols_num = df.select_dtypes(include='number').columns
     
-    novo_df = (
-        novo_df[cols_num]
-        .describe()
-        .reset_index())
+    novo_df = df[cols_num].describe()
 
     if qtd_zerados:
-        return pd.concat([novo_df, tb_zerados(novo_df, cols_num)])
-    else:
-        return novo_df
+        novo_df = pd.concat([novo_df, tb_zerados(df, cols_num, tol_abs)])
+
+    return novo_df.reset_index()
 
 
 def tb_distrib_data(df: DataFrame, col_dat: str) -> DataFrame:
@@ -170,15 +295,15 @@ def tb_distrib_data(df: DataFrame, col_dat: str) -> DataFrame:
     Retorno:
         DataFrame: DataFrame contendo os percentis da coluna de data.
     """
-    novo_df = df.copy()
-
-    novo_df[col_dat] = pd.to_datetime(novo_df[col_dat]).dt.date
-    quartis = novo_df[col_dat].quantile([0, 0.25, 0.5, 0.75, 1])
+    # Percentis sobre datetime64 (int64 por baixo), convertendo para date só o resultado
+    datas = pd.to_datetime(df[col_dat]).dt.normalize()
+    quartis = datas.quantile([0, 0.25, 0.5, 0.75, 1])
 
-    return pd.DataFrame({'percentil': quartis.index, col_dat: quartis.values})
+    return pd.DataFrame({'percentil': quartis.index, col_dat: quartis.dt.date.values})
 
 
-def tb_freq(df: DataFrame, cols: list, freq_acc: bool = False) -> DataFrame:
+@memoizar
+def tb_freq(df: DataFrame, cols: list, freq_acc: bool = False, motor: str = 'pandas', cache=None) -> DataFrame:
     """
     Retorna um DataFrame com as frequências absolutas e relativas das colunas especificadas.
 
@@ -186,18 +311,28 @@ def tb_freq(df: DataFrame, cols: list, freq_acc: bool = False) -> DataFrame:
         df (DataFrame): DataFrame a ser analisado.
         cols (list): Lista das colunas para calcular as frequências.
         freq_acc (bool, optional): Indica se as frequências acumuladas devem ser incluídas. Defaults to False.
+        motor (str, optional): 'pandas' ou 'duckdb'. Com 'duckdb', a agregação roda no motor SQL embutido e df também pode ser uma utils_sql.FontePastasCsv. Defaults to 'pandas'.
+        cache (optional): True (cache padrão) ou um utils_cache.CacheResultados. Defaults to None (sem cache).
 
     Retorno:
         DataFrame: DataFrame contendo as frequências absolutas e relativas.
     """
-    novo_df = df.copy()
+    validar_motor(motor)
+
+    if motor == 'duckdb':
+        # Mesma ordenação do value_counts: grupos em ordem das chaves, depois por frequência
+        novo_df = (
+            contar_freq(df, cols)
+            .sort_values('freq_abs', ascending=False)
+            .reset_index(drop=True))
+    else:
+        novo_df = (
+            df[cols]
+            .value_counts()
+            .reset_index()
+            .rename(columns={0:'freq_abs','count':'freq_abs'}))
 
-    novo_df = (
-        novo_df[cols]
-        .value_counts()
-        .reset_index()
-        .rename(columns={0:'freq_abs','count':'freq_abs'})
-        .pipe(criar_col_pct, 'freq_abs', 'freq_rel'))
+    novo_df = novo_df.pipe(criar_col_pct, 'freq_abs', 'freq_rel')
 
     if freq_acc:
         return (
@@ -208,7 +343,7 @@ def tb_freq(df: DataFrame, cols: list, freq_acc: bool = False) -> DataFrame:
         return novo_df
 
 
-def tb_freq_data(df, col_dat: str, col_chv: str, periodo: str = 'a'):
+def tb_freq_data(df, col_dat: str, col_chv: str, periodo: str = 'a', motor: str = 'pandas'):
     """
     Calcula a frequência dos dados.
 
@@ -217,37 +352,46 @@ def tb_freq_data(df, col_dat: str, col_chv: str, periodo: str = 'a'):
         col_dat (str): Nome da coluna contendo datas.
         col_chv (str): Nome da coluna chave para contar a frequência.
         periodo (str, optional): Período de frequência. Defaults to 'a' (ano).
+        motor (str, optional): 'pandas' ou 'duckdb'. Com 'duckdb', a agregação roda no motor SQL embutido e df também pode ser uma utils_sql.FontePastasCsv. Defaults to 'pandas'.
 
     Retorno:
         DataFrame: DataFrame com a frequência calculada.
     """
-
-    novo_df = df.copy()
+    validar_motor(motor)
 
     nm_col_criada = {
         'a':'ano',
         'm':'mes'
     }[periodo]
 
-    func_formatacao = {
-        'a': pd.to_datetime(novo_df[col_dat]).dt.year,
-        'm': pd.to_datetime(novo_df[col_dat]).dt.to_period('M')
-    }[periodo]
+    def formatar_periodo(datas):
+        datas = pd.to_datetime(datas)
+        return datas.dt.year if periodo == 'a' else datas.dt.to_period('M')
 
-    novo_df[nm_col_criada] = func_formatacao
+    if motor == 'duckdb':
+        novo_df = contar_freq_periodo(df, col_dat, col_chv, periodo)
+        novo_df = (
+            novo_df
+            .assign(**{nm_col_criada: formatar_periodo(novo_df['periodo'])})
+            [[nm_col_criada, 'qtd_registros']])
+    else:
+        novo_df = df.copy()
+        novo_df[nm_col_criada] = formatar_periodo(novo_df[col_dat])
 
-    return (
-        novo_df
-        .groupby(nm_col_criada)[col_chv]
-        .count()
-        .reset_index()
-        .rename(columns={col_chv: 'qtd_registros'})
-        .pipe(criar_col_pct, 'qtd_registros', 'pct_registros'))
+        novo_df = (
+            novo_df
+            .groupby(nm_col_criada)[col_chv]
+            .count()
+            .reset_index()
+            .rename(columns={col_chv: 'qtd_registros'}))
+
+    return novo_df.pipe(criar_col_pct, 'qtd_registros', 'pct_registros')
 
 
 def tb_freq_digitos(df: DataFrame, col: str) -> DataFrame:
     """
     Calcula a frequência dos dígitos.
+    Para os primeiros dígitos (lei de Benford), ver tb_digitos_iniciais e tb_benford em utils_benford.
 
     Parâmetros:
         df (DataFrame): DataFrame de entrada.
@@ -263,7 +407,7 @@ def tb_freq_digitos(df: DataFrame, col: str) -> DataFrame:
         .pipe(criar_col_qtd_digitos, col)
         .pipe(tb_freq, ['qtd_digitos']))
 
-def tb_soma_agg(df: DataFrame, lst_cols_id: List[str], nm_col_somada: str) -> DataFrame:
+def tb_soma_agg(df: DataFrame, lst_cols_id: List[str], nm_col_somada: str, motor: str = 'pandas') -> DataFrame:
     """
     Calcula a soma agregada de colunas.
 
@@ -271,26 +415,36 @@ def tb_soma_agg(df: DataFrame, lst_cols_id: List[str], nm_col_somada: str) -> Da
         df (DataFrame): DataFrame de entrada.
         lst_cols_id (List[str]): Lista de nomes de colunas a serem agrupadas.
         nm_col_somada (str): Nome da coluna a ser somada.
+        motor (str, optional): 'pandas' ou 'duckdb'. Com 'duckdb', a agregação roda no motor SQL embutido e df também pode ser uma utils_sql.FontePastasCsv. Defaults to 'pandas'.
 
     Retorno:
         DataFrame: DataFrame com a soma agregada calculada.
     """
-    novo_df = df.copy()
+    validar_motor(motor)
+
+    if motor == 'duckdb':
+        novo_df = (
+            agregar_soma(df, lst_cols_id, [nm_col_somada])
+            .sort_values([nm_col_somada], ascending=False))
+    else:
+        novo_df = df.pipe(soma_agg, lst_cols_id, [nm_col_somada])
 
     return (
         novo_df
-        .pipe(soma_agg, lst_cols_id, [nm_col_somada])
         .pipe(criar_col_pct, nm_col_somada)
         .pipe(criar_col_soma_acc, nm_col_somada)
         .pipe(criar_col_pct, f'sum_{nm_col_somada}_acc', acc=True))
 
-def tb_visao_geral(df: DataFrame, cols: Optional[List[str]] = None) -> DataFrame:
+@memoizar
+def tb_visao_geral(df: DataFrame, cols: Optional[List[str]] = None, saida=None, cache=None) -> DataFrame:
     """
     Cria uma visão geral do DataFrame.
 
     Parâmetros:
         df (DataFrame): DataFrame de entrada.
         cols (List[str], optional): Lista de colunas a serem incluídas na visão geral. Defaults to None.
+        saida (optional): Saída repassada para tb_ausentes.
+        cache (optional): True (cache padrão) ou um utils_cache.CacheResultados. Defaults to None (sem cache).
 
     Retorno:
         DataFrame: DataFrame com a visão geral criada.
@@ -302,7 +456,7 @@ def tb_visao_geral(df: DataFrame, cols: Optional[List[str]] = None) -> DataFrame
 
     return (
         novo_df
-        .pipe(tb_ausentes, cols)
+        .pipe(tb_ausentes, cols, saida)
 
         .merge(
             novo_df
@@ -319,31 +473,40 @@ def tb_visao_geral(df: DataFrame, cols: Optional[List[str]] = None) -> DataFrame
             on='col',
             how='inner'))
 
-def tb_zerados(df: DataFrame, cols_num: Optional[List[str]] = None) -> DataFrame:
+def tb_zerados(df: DataFrame, cols_num: Optional[List[str]] = None, tol_abs: float = 1e-6) -> DataFrame:
     """
-    Conta as ocorrências de valores zero.
+    Conta os valores zerados (|x| <= tol_abs), negativos e positivos de cada coluna numérica.
+    As três contagens de todas as colunas saem de uma única contagem NumPy (bincount). Valores ausentes não são contados.
 
     Parâmetros:
         df (DataFrame): DataFrame de entrada.
         cols_num (List[str], optional): Lista de colunas numéricas a serem consideradas. Defaults to None.
+        tol_abs (float, optional): Tolerância absoluta para considerar um valor zerado. Defaults to 1e-6.
 
     Retorno:
-        DataFrame: DataFrame contendo as colunas e a quantidade de zeros encontrados.
+        DataFrame: DataFrame com as linhas 'qtd_zerados', 'qtd_negativos' e 'qtd_positivos' e uma coluna por coluna numérica,
+            no mesmo formato do describe() para ser concatenado a ele.
     """
-    novo_df = df.copy()
-
     if cols_num is None:
-        cols_num = novo_df.select_dtypes(include='number').columns
+        cols_num = df.select_dtypes(include='number').columns
 
-    novo_df = (
-        (df[cols_num] < 1e-6)
-        .sum()
-        .reset_index()
-        .rename(columns={'index': 'col', 0: 'qtd_zerados'})
-        .transpose())
+    valores = df[cols_num].to_numpy(dtype=float, na_value=np.nan)
 
-    novo_df.columns = novo_df.iloc[0]
-    return novo_df.iloc[1:]
+    # Classe de cada valor: 0 zerado, 1 negativo, 2 positivo, 3 ausente
+    classes = np.where(
+        np.isnan(valores), 3,
+        np.where(np.abs(valores) <= tol_abs, 0, np.where(valores < 0, 1, 2)))
+
+    # Desloca as classes de cada coluna para contar todas as colunas de uma vez
+    qtd_cols = valores.shape[1]
+    contagens = (
+        np.bincount((classes + 4 * np.arange(qtd_cols)).ravel(), minlength=4 * qtd_cols)
+        .reshape(qtd_cols, 4))
+
+    return pd.DataFrame(
+        contagens[:, :3].T,
+        index=['qtd_zerados', 'qtd_negativos', 'qtd_positivos'],
+        columns=cols_num)
 
 
 def transformar_linhas_em_colunas(df, nm_col_chv, lst_cols_id, lst_cols_vlr):
@@ -366,9 +529,23 @@ def transformar_linhas_em_colunas(df, nm_col_chv, lst_cols_id, lst_cols_vlr):
     return novo_df
 
 
-def conta_distintos_cols_nao_chave(df, lst_cols_chv):
+def conta_distintos_cols_nao_chave(df, lst_cols_chv, motor = 'pandas'):
+    """
+    Conta os valores distintos de cada coluna não chave para cada combinação das colunas chave.
+
+    Parâmetros:
+        df (DataFrame): DataFrame de entrada.
+        lst_cols_chv (list): Lista das colunas chave.
+        motor (str, optional): 'pandas' ou 'duckdb'. Com 'duckdb', a agregação roda no motor SQL embutido e df também pode ser uma utils_sql.FontePastasCsv. Defaults to 'pandas'.
+
+    Retorno:
+        DataFrame: DataFrame com as colunas chave e a quantidade de distintos das demais.
+    """
+    validar_motor(motor)
+
+    if motor == 'duckdb':
+        return contar_distintos_por_chave(df, lst_cols_chv)
 
-    lst_cols = [c for c in df.columns if c not in lst_cols_chv]
     dic_col_func = {c:'nunique' for c in df.columns if c not in lst_cols_chv}
     
     return (df